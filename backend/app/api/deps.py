@@ -1,42 +1,111 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import AsyncIterator
 
-from app.repositories.sql_account_repository import SqlAccountRepository
-from app.repositories.sql_transaction_repository import SqlTransactionRepository
-from app.repositories.sql_instrument_repository import SqlInstrumentRepository
-from app.repositories.sql_trade_repository import SqlTradeRepository
-from app.repositories.sql_portfolio_repository import SqlPortfolioRepository
-from app.repositories.sql_portfolio_snapshot_repository import SqlPortfolioSnapshotRepository
-from app.repositories.sql_price_repository import SqlPriceRepository
+from starlette.concurrency import run_in_threadpool
 
+from app.db import UnitOfWork, bind_unit_of_work, unbind_unit_of_work
 
+
+async def request_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """
+    Unité de travail de la requête (dépendance globale, scope="function") :
+    tous les appels de repository partagent une session / transaction,
+    commit quand la route se termine sans erreur, rollback sinon (HTTPException comprise),
+    avant l'envoi de la réponse.
+    async pour que le ContextVar soit posé dans le contexte copié vers le threadpool des routes sync.
+    """
+    uow = UnitOfWork()
+    token = bind_unit_of_work(uow)
+    try:
+        yield uow
+    except BaseException:
+        await run_in_threadpool(uow.rollback)
+        raise
+    else:
+        await run_in_threadpool(uow.commit)
+    finally:
+        unbind_unit_of_work(token)
+        await run_in_threadpool(uow.close)
+
+
+# repositories construits au premier appel (aucun accès base) ; modules SQL importés à ce
+# moment-là aussi : le démarrage ne charge que les routes
 @lru_cache
 def get_account_repo():
+    from app.repositories.sql_account_repository import SqlAccountRepository
+
     return SqlAccountRepository()
 
 
 @lru_cache
 def get_tx_repo():
-    account_repo = get_account_repo()
-    return SqlTransactionRepository(tx_account_repo=account_repo)
-   
+    from app.repositories.sql_transaction_repository import SqlTransactionRepository
+
+    return SqlTransactionRepository(tx_account_repo=get_account_repo())
+
+
 @lru_cache
 def get_portfolio_repo():
+    from app.repositories.sql_portfolio_repository import SqlPortfolioRepository
+
     return SqlPortfolioRepository()
 
+
 @lru_cache
 def get_portfolio_snapshot_repo():
+    from app.repositories.sql_portfolio_snapshot_repository import SqlPortfolioSnapshotRepository
+
     return SqlPortfolioSnapshotRepository()
 
+
 @lru_cache
 def get_instrument_repo():
+    from app.repositories.sql_instrument_repository import SqlInstrumentRepository
+
     return SqlInstrumentRepository()
 
+
 @lru_cache
 def get_trade_repo():
+    from app.repositories.sql_trade_repository import SqlTradeRepository
+
     return SqlTradeRepository()
 
+
 @lru_cache
 def get_price_repo():
-    return SqlPriceRepository()
\ No newline at end of file
+    from app.repositories.sql_price_repository import SqlPriceRepository
+
+    return SqlPriceRepository()
+
+
+@lru_cache
+def get_import_job_repo():
+    from app.repositories.sql_import_job_repository import SqlImportJobRepository
+
+    return SqlImportJobRepository()
+
+
+# lectures asyncio (routes async def en lecture seule) : sessions hors unité de travail,
+# greenlet / driver async requis au premier appel seulement
+@lru_cache
+def get_async_account_repo():
+    from app.repositories.async_sql_account_repository import AsyncSqlAccountRepository
+
+    return AsyncSqlAccountRepository()
+
+
+@lru_cache
+def get_async_tx_repo():
+    from app.repositories.async_sql_transaction_repository import AsyncSqlTransactionRepository
+
+    return AsyncSqlTransactionRepository()
+
+
+@lru_cache
+def get_async_price_repo():
+    from app.repositories.async_sql_price_repository import AsyncSqlPriceRepository
+
+    return AsyncSqlPriceRepository()
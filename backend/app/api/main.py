@@ -1,8 +1,12 @@
-import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
 from app.db import init_db
+from app.api.deps import get_import_job_repo, request_unit_of_work
+from app.api.query_stats import QueryStatsMiddleware
+from app.settings import get_query_stats_settings
 
 from app.api.routes.health import router as health_router
 from app.api.routes.net_worth import router as net_worth_router
@@ -11,6 +15,7 @@ from app.api.routes.account_transactions import router as account_transactions_r
 from app.api.routes.budgets import router as budgets_router
 from app.api.routes.import_csv import router as import_csv_router
 from app.api.routes.import_victor import router as import_victor_router
+from app.api.routes.import_jobs import router as import_jobs_router
 from app.api.routes.portfolios import router as portfolios_router
 from app.api.routes.net_worth_full import router as net_worth_full_router
 from app.api.routes.instruments import router as instruments_router
@@ -18,15 +23,23 @@ from app.api.routes.trades import router as trades_router, pos_router as positio
 from app.api.routes.prices import router as prices_router
 
 
-app = FastAPI(title="DASHMONEY API", version="0.1.0")
-
-@app.on_event("startup")
-def _startup_sql_only() -> None:
-    db_url = os.getenv("DASHMONEY_DATABASE_URL", "").strip()
-    if not db_url:
-        raise RuntimeError("DASHMONEY_DATABASE_URL is required (SQL-only mode).")
-    # Fail fast if DB unreachable + ensure tables exist
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # seul aller-retour de vérification au démarrage (les repositories n'en font plus) :
+    # URL absente ou base injoignable => échec immédiat
     init_db()
+    # jobs d'import interrompus par un redémarrage : jamais repris
+    get_import_job_repo().fail_unfinished(message="interrupted by server restart")
+    yield
+
+
+app = FastAPI(
+    title="DASHMONEY API",
+    version="0.1.0",
+    lifespan=lifespan,
+    dependencies=[Depends(request_unit_of_work, scope="function")],
+)
+app.add_middleware(QueryStatsMiddleware, warn_threshold=get_query_stats_settings().warn_threshold)
 
 app.include_router(health_router)
 app.include_router(net_worth_router)
@@ -35,6 +48,7 @@ app.include_router(account_transactions_router)
 app.include_router(budgets_router)
 app.include_router(import_csv_router)
 app.include_router(import_victor_router)
+app.include_router(import_jobs_router)
 app.include_router(portfolios_router)
 app.include_router(net_worth_full_router)
 app.include_router(instruments_router)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db_stats import QueryStats, bind_query_stats, unbind_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.db_time_sec * 1000:.1f};desc="{stats.count} queries"'
+
+
+class QueryStatsMiddleware:
+    """
+    Requêtes SQL et temps base par requête HTTP :
+    - en-tête Server-Timing (posé au début de la réponse : le commit de l'unité de travail est compté) ;
+    - log DEBUG par requête, WARNING au-delà de `warn_threshold` requêtes (N+1 probable).
+    ASGI pur (pas BaseHTTPMiddleware) : pas de tâche ni de copie de la réponse en plus.
+    """
+
+    def __init__(self, app: ASGIApp, *, warn_threshold: int | None = None) -> None:
+        self.app = app
+        self.warn_threshold = warn_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        token = bind_query_stats(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            unbind_query_stats(token)
+            # chemin de la route (ex: /accounts/{account_id}) pour regrouper par endpoint
+            path = getattr(scope.get("route"), "path", scope["path"])
+            if self.warn_threshold is not None and stats.count > self.warn_threshold:
+                logger.warning(
+                    "%s %s -> %d: %d SQL queries (threshold %d), %.1f ms in database",
+                    scope["method"], path, status, stats.count, self.warn_threshold, stats.db_time_sec * 1000,
+                )
+            else:
+                logger.debug(
+                    "%s %s -> %d: %d SQL queries, %.1f ms in database",
+                    scope["method"], path, status, stats.count, stats.db_time_sec * 1000,
+                )
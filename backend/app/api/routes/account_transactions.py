@@ -4,9 +4,16 @@ import datetime as dt
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Response
-
-from app.api.deps import get_account_repo, get_tx_repo
-from app.api.schemas.transactions import AccountTransactionCreateRequest, TransactionResponse,TransactionUpdateRequest
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import get_account_repo, get_async_account_repo, get_async_tx_repo, get_tx_repo
+from app.api.schemas.transactions import (
+    AccountTransactionCreateRequest,
+    TransactionResponse,
+    TransactionUpdateRequest,
+    TransactionWithBalancePage,
+    TransactionWithBalanceResponse,
+)
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
 from app.services.transaction_query_service import TransactionQuery, apply_transaction_query
@@ -107,7 +114,7 @@ def update_account_transaction(account_id: str, tx_id: UUID, payload: Transactio
 
 
 @router.get("/{account_id}/transactions", response_model=list[TransactionResponse])
-def list_account_transactions(
+async def list_account_transactions(
     account_id: str,
     date_from: dt.date | None = Query(default=None),
     date_to: dt.date | None = Query(default=None),
@@ -119,11 +126,11 @@ def list_account_transactions(
     sort_dir: str = Query(default="asc", pattern="^(asc|desc)$"),
 ) -> list[TransactionResponse]:
     try:
-        acc = get_account_repo().get_account(account_id)
+        acc = await get_async_account_repo().get_account(account_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    txs = get_tx_repo().list(account_id=acc.id)
+    txs = await get_async_tx_repo().list(account_id=acc.id)
 
     query_obj = TransactionQuery(
         date_from=date_from,
@@ -136,8 +143,43 @@ def list_account_transactions(
         sort_dir=sort_dir, # type: ignore[arg-type]
     )
 
-    txs = apply_transaction_query(txs, query_obj)
-    return [_tx_to_response(t) for t in txs]
+    # filtre / tri / conversion sur tout l'historique : hors de la boucle d'événements
+    return await run_in_threadpool(_query_responses, txs, query_obj)
+
+
+@router.get("/{account_id}/transactions/running-balance", response_model=TransactionWithBalancePage)
+async def list_account_transactions_with_balance(
+    account_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    sort_dir: str = Query(default="asc", pattern="^(asc|desc)$"),
+) -> TransactionWithBalancePage:
+    try:
+        acc = await get_async_account_repo().get_account(account_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Account not found")
+
+    # solde après chaque tx calculé côté SQL (window function), seule la page demandée est chargée
+    page, total = await get_async_tx_repo().list_with_running_balance(
+        account_id=acc.id,
+        opening_balance=acc.opening_balance,
+        limit=limit,
+        offset=offset,
+        descending=sort_dir == "desc",
+    )
+
+    return TransactionWithBalancePage(
+        items=[
+            TransactionWithBalanceResponse(
+                **_tx_to_response(x.transaction).model_dump(),
+                balance_after=str(x.balance_after.amount),
+            )
+            for x in page
+        ],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
 
 
 def _tx_to_response(tx: Transaction) -> TransactionResponse:
@@ -154,3 +196,7 @@ def _tx_to_response(tx: Transaction) -> TransactionResponse:
         label=tx.label,
         created_at=tx.created_at,
     )
+
+
+def _query_responses(txs: list[Transaction], query_obj: TransactionQuery) -> list[TransactionResponse]:
+    return [_tx_to_response(t) for t in apply_transaction_query(txs, query_obj)]
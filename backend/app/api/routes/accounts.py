@@ -5,14 +5,14 @@ import logging
 import datetime as dt
 
 from fastapi import APIRouter, HTTPException, Response, Query
+from starlette.concurrency import run_in_threadpool
 
-from app.api.deps import get_account_repo, get_tx_repo
+from app.api.deps import get_account_repo, get_async_account_repo, get_async_tx_repo, get_tx_repo
 from app.api.schemas.accounts import AccountCreateRequest, AccountResponse, AccountTimeSeriesResponse, TimeSeriesPoint,AccountUpdateRequest
 from app.domain.account import Account
 from app.domain.money import Currency
 from app.domain.signed_money import SignedMoney
 from app.api.schemas.accounts import AccountBalanceResponse
-from app.engine.account_balance import compute_balance
 from app.engine.account_timeseries import pick_granularity, compute_timeseries
 
 from uuid import uuid4
@@ -308,38 +308,28 @@ def update_account(account_id: str, req: AccountUpdateRequest) -> AccountRespons
 
 
 @router.get("/{account_id}/balance", response_model=AccountBalanceResponse)
-def get_account_balance(
+async def get_account_balance(
     account_id: str,
     at: dt.date | None = Query(default=None),
 ) -> AccountBalanceResponse:
-    # 1) compte
-    try:
-        acc = get_account_repo().get_account(account_id)
-    except KeyError:
+    # une requête : SUM / COUNT des tx jusqu'à `at` côté SQL (compte absent => aucune ligne)
+    found = await get_async_tx_repo().balances_at(at=at, account_ids=[account_id])
+    if not found:
         raise HTTPException(status_code=404, detail="Account not found")
-
-    # 2) tx
-    txs = get_tx_repo().list(account_id=acc.id)
-
-    # 3) compute
-    opening, tx_sum, balance, n = compute_balance(
-        opening_balance=acc.opening_balance,
-        transactions=txs,
-        at=at,
-    )
+    ab = found[0]
 
     return AccountBalanceResponse(
-        account_id=acc.id,
-        currency=acc.currency.value,
+        account_id=ab.account_id,
+        currency=ab.opening_balance.currency.value,
         at=at,
-        opening_balance=str(opening.amount),
-        transactions_sum=str(tx_sum.amount),
-        balance=str(balance.amount),
-        transactions_count=n,
+        opening_balance=str(ab.opening_balance.amount),
+        transactions_sum=str(ab.tx_sum.amount),
+        balance=str(ab.balance.amount),
+        transactions_count=ab.tx_count,
     )
 
 @router.get("/{account_id}/timeseries", response_model=AccountTimeSeriesResponse)
-def account_timeseries(
+async def account_timeseries(
     account_id: str,
     date_from: dt.date = Query(..., alias="from"),
     date_to: dt.date = Query(..., alias="to"),
@@ -349,15 +339,17 @@ def account_timeseries(
         raise HTTPException(status_code=422, detail="from must be <= to")
 
     try:
-        acc = get_account_repo().get_account(account_id)
+        acc = await get_async_account_repo().get_account(account_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    txs = get_tx_repo().list(account_id=acc.id)
+    txs = await get_async_tx_repo().list_frame(account_ids=[acc.id])
 
     g = pick_granularity(date_from, date_to) if granularity == "auto" else granularity
 
-    raw = compute_timeseries(
+    # calcul CPU : hors de la boucle d'événements
+    raw = await run_in_threadpool(
+        compute_timeseries,
         opening_balance=acc.opening_balance,
         transactions=txs,
         date_from=date_from,
@@ -5,12 +5,7 @@ import logging
 from fastapi import APIRouter, HTTPException, Query
 
 from app.api.deps import get_account_repo, get_tx_repo
-from app.engine.budget import (
-    totals_by_kind,
-    expense_totals_by_category,
-    expense_totals_by_subcategory,
-    monthly_totals_by_kind,
-)
+from app.engine.budget import summarize_budget_totals
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/accounts", tags=["budgets"])
@@ -24,17 +19,13 @@ def budget_summary(
 ):
     try:
         acc = get_account_repo().get_account(account_id)
-        txs = get_tx_repo().list(account_id=acc.id)
-
-        if date_from is not None:
-            txs = [t for t in txs if t.date >= date_from]
-        if date_to is not None:
-            txs = [t for t in txs if t.date <= date_to]
-
-        kb = totals_by_kind(txs, currency=acc.currency)
-        by_cat = expense_totals_by_category(txs, currency=acc.currency)
-        by_sub = expense_totals_by_subcategory(txs, currency=acc.currency)
-        by_month_kind = monthly_totals_by_kind(txs, currency=acc.currency)
+        # agrégats calculés en SQL (GROUP BY), seules les lignes agrégées remontent
+        totals = get_tx_repo().budget_totals(account_id=acc.id, date_from=date_from, date_to=date_to)
+        summary = summarize_budget_totals(totals, currency=acc.currency)
+        kb = summary.by_kind
+        by_cat = summary.by_category
+        by_sub = summary.by_subcategory
+        by_month_kind = summary.by_month_kind
 
         return {
             "account_id": acc.id,
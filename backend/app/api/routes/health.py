@@ -1,10 +1,46 @@
 #route API qui qui dedamnde au serveur s'il tourne bien
 
 
-from fastapi import APIRouter
+import time
+
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.db import POOL_METRICS, get_engine
+from app.db_async import ASYNC_POOL_METRICS, get_async_engine
+from app.db_pool import pool_status
+from app.settings import get_db_pool_settings
 
 router = APIRouter()
 
 @router.get("/health")
 def health() -> dict:
     return {"status": "ok"}
+
+
+@router.get("/health/db")
+def health_db() -> dict:
+    """
+    Connectivité (SELECT 1 chronométré, checkout inclus) + état et compteurs du pool.
+    Le pool asyncio n'apparaît qu'une fois son engine créé (première route async servie).
+    """
+    engine = get_engine()
+    settings = get_db_pool_settings()
+
+    t0 = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        raise HTTPException(status_code=503, detail=f"database unavailable: {type(e).__name__}")
+    latency_ms = round((time.perf_counter() - t0) * 1000, 3)
+
+    out = {
+        "status": "ok",
+        "latency_ms": latency_ms,
+        "pool": pool_status(engine.pool, POOL_METRICS, settings),
+    }
+    if get_async_engine.cache_info().currsize:
+        out["async_pool"] = pool_status(get_async_engine().sync_engine.pool, ASYNC_POOL_METRICS, settings)
+    return out
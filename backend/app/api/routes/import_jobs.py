@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+
+from app.api.deps import get_account_repo, get_import_job_repo, get_tx_repo
+from app.api.schemas.import_jobs import ImportJobErrorOut, ImportJobErrorPage, ImportJobOut
+from app.domain.import_job import ImportJob
+from app.services.import_formats import ImportFormat, ImportFormatError, check_filename
+from app.services.import_job_service import submit_import_job
+
+router = APIRouter(tags=["import"])
+
+
+def _job_out(job: ImportJob) -> ImportJobOut:
+    return ImportJobOut(
+        id=str(job.id),
+        account_id=job.account_id,
+        format=job.format,
+        filename=job.filename,
+        status=job.status.value,
+        skip_duplicates=job.skip_duplicates,
+        rows_parsed=job.rows_parsed,
+        imported=job.imported,
+        duplicates_skipped=job.duplicates_skipped,
+        errors_count=job.errors_count,
+        message=job.message,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.post("/accounts/{account_id}/import-jobs", response_model=ImportJobOut, status_code=202)
+def create_import_job(
+    account_id: str,
+    format: ImportFormat = Query(default="csv"),
+    skip_duplicates: bool = Query(default=False),
+    file: UploadFile = File(...),
+) -> ImportJobOut:
+    """
+    Import en arrière-plan : retourne le job immédiatement (PENDING),
+    suivi via GET /import-jobs/{job_id} et /import-jobs/{job_id}/errors.
+    """
+    try:
+        acc = get_account_repo().get_account(account_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Account not found")
+
+    try:
+        check_filename(format, file.filename)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    job, _ = submit_import_job(
+        jobs=get_import_job_repo(),
+        tx_repo=get_tx_repo(),
+        account=acc,
+        fmt=format,
+        filename=file.filename or "upload",
+        upload=file.file,
+        skip_duplicates=skip_duplicates,
+    )
+    return _job_out(job)
+
+
+@router.get("/import-jobs/{job_id}", response_model=ImportJobOut)
+def get_import_job(job_id: UUID) -> ImportJobOut:
+    try:
+        return _job_out(get_import_job_repo().get(job_id))
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+
+@router.get("/import-jobs/{job_id}/errors", response_model=ImportJobErrorPage)
+def list_import_job_errors(
+    job_id: UUID,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+) -> ImportJobErrorPage:
+    repo = get_import_job_repo()
+    try:
+        repo.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+    items, total = repo.list_errors(job_id, limit=limit, offset=offset)
+    return ImportJobErrorPage(
+        items=[ImportJobErrorOut(line=e.line_no, message=e.message) for e in items],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import datetime as dt
 from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 
-from app.api.deps import get_account_repo, get_tx_repo
+from app.api.deps import get_async_account_repo, get_async_tx_repo
 from app.api.schemas.net_worth import NetWorthResponse, NetWorthTimeseriesResponse,NetWorthGroupedResponse,NetWorthGroupLine,NetWorthTimeseriesGroupedResponse, NetWorthTimeseriesGroup
 from app.api.schemas.accounts import TimeSeriesPoint
 
-from app.engine.net_worth import compute_net_worth, compute_net_worth_timeseries, compute_net_worth_grouped,compute_net_worth_timeseries_grouped
+from app.engine.net_worth import (
+    compute_net_worth_from_balances,
+    compute_net_worth_grouped_from_balances,
+    compute_net_worth_timeseries,
+    compute_net_worth_timeseries_grouped,
+)
 from app.engine.account_timeseries import pick_granularity
 
 from app.domain.account import AccountType
@@ -50,28 +56,22 @@ def _filter_accounts_by_type(accounts, selected: set[AccountType] | None):
     return [a for a in accounts if a.account_type in selected]
 
 @router.get("", response_model=NetWorthResponse)
-def get_net_worth(
+async def get_net_worth(
     at: dt.date | None = Query(default=None),
     types: str | None = Query(default=None, description="CSV of account types, e.g. CHECKING,SAVINGS"),
 ) -> NetWorthResponse:
-    acc_repo = get_account_repo()
-    tx_repo = get_tx_repo()
+    acc_repo = get_async_account_repo()
+    tx_repo = get_async_tx_repo()
 
-    accounts = acc_repo.list_accounts()
+    accounts = await acc_repo.list_accounts()
     selected = _parse_types(types)
     accounts = _filter_accounts_by_type(accounts, selected)
     currency = _ensure_single_currency(accounts)
 
-    # On récupère toutes les transactions (par compte) puis on agrège via le moteur
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # Soldes par compte agrégés côté SQL (une requête SUM ... GROUP BY compte)
+    balances = await tx_repo.balances_at(at=at, account_ids=[a.id for a in accounts])
 
-    nw = compute_net_worth(
-        accounts=accounts,
-        transactions=all_txs,
-        at=at,
-    )
+    nw = compute_net_worth_from_balances(balances)
 
     return NetWorthResponse(
         currency=currency,
@@ -81,7 +81,7 @@ def get_net_worth(
 
 
 @router.get("/timeseries", response_model=NetWorthTimeseriesResponse)
-def get_net_worth_timeseries(
+async def get_net_worth_timeseries(
     date_from: dt.date = Query(..., alias="from"),
     date_to: dt.date = Query(..., alias="to"),
     granularity: str = Query(default="auto", pattern="^(auto|daily|weekly|monthly|yearly)$"),
@@ -90,21 +90,22 @@ def get_net_worth_timeseries(
     if date_from > date_to:
         raise HTTPException(status_code=422, detail="from must be <= to")
 
-    acc_repo = get_account_repo()
-    tx_repo = get_tx_repo()
+    acc_repo = get_async_account_repo()
+    tx_repo = get_async_tx_repo()
 
-    accounts = acc_repo.list_accounts()
+    accounts = await acc_repo.list_accounts()
     selected = _parse_types(types)
     accounts = _filter_accounts_by_type(accounts, selected)
     currency = _ensure_single_currency(accounts)
 
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # une seule requête, en colonnes (TransactionFrame)
+    all_txs = await tx_repo.list_frame(account_ids=[a.id for a in accounts])
 
     g = pick_granularity(date_from, date_to) if granularity == "auto" else granularity
 
-    raw = compute_net_worth_timeseries(
+    # calcul CPU : hors de la boucle d'événements
+    raw = await run_in_threadpool(
+        compute_net_worth_timeseries,
         accounts=accounts,
         transactions=all_txs,
         date_from=date_from,
@@ -133,25 +134,23 @@ def get_net_worth_timeseries(
     )
 
 @router.get("/grouped", response_model=NetWorthGroupedResponse)
-def get_net_worth_grouped(
+async def get_net_worth_grouped(
     at: dt.date | None = Query(default=None),
     types: str | None = Query(default=None, description="CSV of account types, e.g. CHECKING,SAVINGS"),
 ) -> NetWorthGroupedResponse:
-    acc_repo = get_account_repo()
-    tx_repo = get_tx_repo()
+    acc_repo = get_async_account_repo()
+    tx_repo = get_async_tx_repo()
 
-    accounts = acc_repo.list_accounts()
+    accounts = await acc_repo.list_accounts()
     selected = _parse_types(types)
     accounts = _filter_accounts_by_type(accounts, selected)
     currency = _ensure_single_currency(accounts)
 
-    # On récupère toutes les transactions (par compte) puis on agrège via le moteur
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # Soldes agrégés côté SQL, partagés entre total et groupes
+    balances = await tx_repo.balances_at(at=at, account_ids=[a.id for a in accounts])
 
-    total = compute_net_worth(accounts=accounts, transactions=all_txs, at=at)
-    groups = compute_net_worth_grouped(accounts=accounts, transactions=all_txs, at=at)
+    total = compute_net_worth_from_balances(balances)
+    groups = compute_net_worth_grouped_from_balances(balances)
 
     return NetWorthGroupedResponse(
         currency=currency,
@@ -165,7 +164,7 @@ def get_net_worth_grouped(
 
 
 @router.get("/timeseries/grouped", response_model=NetWorthTimeseriesGroupedResponse)
-def get_net_worth_timeseries_grouped(
+async def get_net_worth_timeseries_grouped(
     date_from: dt.date = Query(..., alias="from"),
     date_to: dt.date = Query(..., alias="to"),
     granularity: str = Query(default="auto", pattern="^(auto|daily|weekly|monthly|yearly)$"),
@@ -174,22 +173,22 @@ def get_net_worth_timeseries_grouped(
     if date_from > date_to:
         raise HTTPException(status_code=422, detail="from must be <= to")
 
-    acc_repo = get_account_repo()
-    tx_repo = get_tx_repo()
+    acc_repo = get_async_account_repo()
+    tx_repo = get_async_tx_repo()
 
-    accounts = acc_repo.list_accounts()
+    accounts = await acc_repo.list_accounts()
     selected = _parse_types(types)
     accounts = _filter_accounts_by_type(accounts, selected)
 
     currency = _ensure_single_currency(accounts)
 
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # une seule requête, en colonnes (TransactionFrame)
+    all_txs = await tx_repo.list_frame(account_ids=[a.id for a in accounts])
 
     g = pick_granularity(date_from, date_to) if granularity == "auto" else granularity
 
-    total_raw, groups_raw = compute_net_worth_timeseries_grouped(
+    total_raw, groups_raw = await run_in_threadpool(
+        compute_net_worth_timeseries_grouped,
         accounts=accounts,
         transactions=all_txs,
         date_from=date_from,
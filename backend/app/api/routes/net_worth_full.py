@@ -31,19 +31,18 @@ def get_net_worth_full(at: dt.date | None = Query(default=None)) -> NetWorthFull
     accounts = acc_repo.list_accounts()
     currency = _ensure_single_currency(accounts)
 
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # soldes agrégés côté SQL (une requête SUM ... GROUP BY compte)
+    balances = tx_repo.balances_at(at=at, account_ids=[a.id for a in accounts])
 
     portfolios = p_repo.list()
     snaps = s_repo.list()
 
     nw = compute_net_worth_full(
         accounts=accounts,
-        transactions=all_txs,
         portfolios=portfolios,
         portfolio_snapshots=snaps,
         at=at,
+        balances=balances,
     )
 
     return NetWorthFullResponse(currency=currency, at=at, net_worth_full=str(nw.amount))
@@ -66,9 +65,8 @@ def get_net_worth_full_timeseries(
     accounts = acc_repo.list_accounts()
     currency = _ensure_single_currency(accounts)
 
-    all_txs = []
-    for acc in accounts:
-        all_txs.extend(tx_repo.list(account_id=acc.id))
+    # une seule requête, en colonnes (TransactionFrame)
+    all_txs = tx_repo.list_frame(account_ids=[a.id for a in accounts])
 
     portfolios = p_repo.list()
     snaps = s_repo.list()
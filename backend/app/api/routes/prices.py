@@ -4,21 +4,25 @@ import datetime as dt
 
 from fastapi import APIRouter, HTTPException, Query
 
-from app.api.deps import get_instrument_repo, get_price_repo
-from app.api.schemas.prices import PriceOut, PriceUpdateResult
+from app.api.deps import get_async_price_repo, get_instrument_repo, get_price_repo
+from app.api.schemas.prices import PriceAsOfOut, PriceBackfillResult, PriceOut, PriceUpdateResult
+from app.services.price_backfill_service import backfill_prices
 from app.services.update_prices_service import update_prices_for_day
 
 
 router = APIRouter(prefix="/prices", tags=["prices"])
 
+# symboles × jours par appel /as-of
+MAX_AS_OF_PAIRS = 10_000
+
 
 @router.get("", response_model=list[PriceOut])
-def list_prices(
+async def list_prices(
     symbol: str | None = None,
     date_from: dt.date | None = Query(default=None),
     date_to: dt.date | None = Query(default=None),
 ):
-    repo = get_price_repo()
+    repo = get_async_price_repo()
 
     if symbol is None:
         if date_from is not None or date_to is not None:
@@ -32,16 +36,16 @@ def list_prices(
                 source=p.source,
                 captured_at=p.captured_at,
             )
-            for p in repo.list()
+            for p in await repo.list()
         ]
 
     if (date_from is None) != (date_to is None):
         raise HTTPException(status_code=422, detail="date_from and date_to must be provided together")
 
     if date_from is not None and date_to is not None:
-        items = repo.list_between(symbol=symbol, date_from=date_from, date_to=date_to)
+        items = await repo.list_between(symbol=symbol, date_from=date_from, date_to=date_to)
     else:
-        items = repo.list(symbol=symbol)
+        items = await repo.list(symbol=symbol)
 
     return [
         PriceOut(
@@ -56,10 +60,47 @@ def list_prices(
     ]
 
 
+@router.get("/as-of", response_model=list[PriceAsOfOut])
+async def prices_as_of(
+    symbol: list[str] = Query(..., description="repeatable"),
+    day: list[dt.date] = Query(..., description="repeatable"),
+):
+    """
+    Dernier prix <= chaque jour, pour chaque symbole (une seule requête SQL).
+    """
+    symbols = sorted({s.strip().upper() for s in symbol if s.strip()})
+    days = sorted(set(day))
+    if not symbols:
+        raise HTTPException(status_code=422, detail="symbol is required")
+    if len(symbols) * len(days) > MAX_AS_OF_PAIRS:
+        raise HTTPException(status_code=422, detail=f"too many symbol x day pairs (max {MAX_AS_OF_PAIRS})")
+
+    found = await get_async_price_repo().prices_as_of(symbols=symbols, days=days)
+
+    out: list[PriceAsOfOut] = []
+    for sym in symbols:
+        for d in days:
+            p = found.get((sym, d))
+            out.append(
+                PriceAsOfOut(
+                    symbol=sym,
+                    day=d,
+                    price=None if p is None else PriceOut(
+                        symbol=p.symbol,
+                        day=p.day,
+                        price=str(p.price),
+                        currency=p.currency.value,
+                        source=p.source,
+                        captured_at=p.captured_at,
+                    ),
+                )
+            )
+    return out
+
+
 @router.get("/{symbol}/latest", response_model=PriceOut)
-def latest_price(symbol: str):
-    repo = get_price_repo()
-    p = repo.latest(symbol=symbol)
+async def latest_price(symbol: str):
+    p = await get_async_price_repo().latest(symbol=symbol)
     if p is None:
         raise HTTPException(status_code=404, detail="price not found")
     return PriceOut(
@@ -83,4 +124,30 @@ def update_daily_prices(day: dt.date | None = Query(default=None, description="U
 
     res = update_prices_for_day(day_utc=day, instrument_repo=instrument_repo, price_repo=price_repo)
 
-    return PriceUpdateResult(day=dt.date.fromisoformat(res["day"]), stored=res["stored"], skipped=res["skipped"])
+    return PriceUpdateResult(
+        day=dt.date.fromisoformat(res["day"]),
+        stored=res["stored"],
+        skipped=res["skipped"],
+        timed_out=res["timed_out"],
+    )
+
+
+@router.post("/backfill", response_model=PriceBackfillResult)
+def backfill_price_history(
+    date_from: dt.date = Query(...),
+    date_to: dt.date | None = Query(default=None, description="default: today UTC"),
+    symbol: list[str] | None = Query(default=None, description="default: all STOCK / ETF instruments"),
+):
+    if date_to is None:
+        date_to = dt.datetime.now(dt.timezone.utc).date()
+    if date_from > date_to:
+        raise HTTPException(status_code=422, detail="date_from must be <= date_to")
+
+    res = backfill_prices(
+        instrument_repo=get_instrument_repo(),
+        price_repo=get_price_repo(),
+        date_from=date_from,
+        date_to=date_to,
+        symbols=symbol,
+    )
+    return PriceBackfillResult(**res)
@@ -159,11 +159,7 @@ def create_trade(portfolio_id: UUID, payload: TradeCreate) -> TradeOut:
             linked_cash_tx_id=tx.id,
         )
     except Exception as e:
-        # best effort rollback: delete created tx
-        try:
-            get_tx_repo().delete(account_id=p.cash_account_id, tx_id=tx.id)
-        except Exception:
-            pass
+        # la tx miroir est annulée avec le rollback de l'unité de travail de la requête
         raise HTTPException(status_code=422, detail=str(e))
 
     t_repo.add(trade)
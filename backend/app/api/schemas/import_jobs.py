@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import datetime as dt
+from pydantic import BaseModel, Field
+
+
+class ImportJobOut(BaseModel):
+    id: str
+    account_id: str
+    format: str
+    filename: str
+    status: str
+    skip_duplicates: bool
+    rows_parsed: int = Field(ge=0)
+    imported: int = Field(ge=0)
+    duplicates_skipped: int = Field(ge=0)
+    errors_count: int = Field(ge=0)
+    message: str | None = None
+    created_at: dt.datetime
+    started_at: dt.datetime | None = None
+    finished_at: dt.datetime | None = None
+
+
+class ImportJobErrorOut(BaseModel):
+    line: int
+    message: str
+
+
+class ImportJobErrorPage(BaseModel):
+    items: list[ImportJobErrorOut]
+    total: int
+    limit: int
+    offset: int
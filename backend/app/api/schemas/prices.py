@@ -17,3 +17,21 @@ class PriceUpdateResult(BaseModel):
     day: dt.date
     stored: int = Field(ge=0)
     skipped: int = Field(ge=0)
+    timed_out: int = Field(default=0, ge=0)  # inclus dans skipped
+
+
+class PriceBackfillResult(BaseModel):
+    date_from: dt.date
+    date_to: dt.date
+    instruments: int = Field(ge=0)  # STOCK / ETF considérés
+    fetched: int = Field(ge=0)  # instruments avec des trous (une requête d'historique chacun)
+    up_to_date: int = Field(ge=0)
+    stored: int = Field(ge=0)
+    skipped: int = Field(ge=0)  # instruments non couverts (crypto, other)
+    failed: list[str] = Field(default_factory=list)  # Stooq indisponible
+
+
+class PriceAsOfOut(BaseModel):
+    symbol: str
+    day: dt.date  # jour demandé
+    price: PriceOut | None  # dernier prix <= day, None si aucun
@@ -50,4 +50,14 @@ class TransactionUpdateRequest(BaseModel):
         pattern=r"^-?\d+(\.\d{1,2})?$",
         description="V2: Signed amount as string, e.g. '-12.34' or '1000'",
     )
-    kind: TransactionKind | None = None
\ No newline at end of file
+    kind: TransactionKind | None = None
+
+class TransactionWithBalanceResponse(TransactionResponse):
+    balance_after: str
+
+
+class TransactionWithBalancePage(BaseModel):
+    items: list[TransactionWithBalanceResponse]
+    total: int
+    limit: int
+    offset: int
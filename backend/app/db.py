@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from functools import lru_cache
+from typing import Iterator
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, Session
 
 
 from app.db_base import Base
+from app.db_pool import PoolMetrics, engine_pool_kwargs, instrument_pool
+from app.db_stats import instrument_engine
+from app.settings import get_db_pool_settings
+
+# compteurs du pool de get_engine() (exposés par GET /health/db)
+POOL_METRICS = PoolMetrics()
 
 
 
@@ -23,19 +33,120 @@ def get_database_url() -> str:
 
 @lru_cache
 def get_engine() -> Engine:
-    url = get_database_url()
-    return create_engine(url, future=True)
+    url = make_url(get_database_url())
+    engine = create_engine(url, future=True, **engine_pool_kwargs(url, get_db_pool_settings(), POOL_METRICS))
+    instrument_pool(engine.pool, POOL_METRICS)
+    instrument_engine(engine)
+    return engine
 
 
 @lru_cache
 def get_session_factory() -> sessionmaker[Session]:
-    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, future=True)
+    # expire_on_commit=False : les lignes lues restent utilisables après le commit de session_scope()
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, expire_on_commit=False, future=True)
 
 
 def new_session() -> Session:
     return get_session_factory()()
 
 
+class UnitOfWork:
+    """
+    Une session / une transaction partagée par tous les appels de repository d'une requête.
+    La session n'est ouverte qu'au premier appel (pas de checkout pour une requête sans SQL).
+    Une erreur SQL dans un appel marque l'unité en échec : rollback à la fin au lieu du commit.
+    """
+
+    def __init__(self) -> None:
+        self._session: Session | None = None
+        self.failed = False
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = new_session()
+        return self._session
+
+    def commit(self) -> None:
+        if self._session is None:
+            return
+        if self.failed:
+            self._session.rollback()
+        else:
+            self._session.commit()
+
+    def rollback(self) -> None:
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_current_uow: ContextVar[UnitOfWork | None] = ContextVar("dashmoney_unit_of_work", default=None)
+
+
+def bind_unit_of_work(uow: UnitOfWork) -> Token:
+    return _current_uow.set(uow)
+
+
+def unbind_unit_of_work(token: Token) -> None:
+    _current_uow.reset(token)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """
+    Unité de travail pour le contexte courant (scripts, jobs) : commit en sortie, rollback sur exception.
+    Les requêtes HTTP passent par la dépendance app.api.deps.request_unit_of_work.
+    """
+    uow = UnitOfWork()
+    token = bind_unit_of_work(uow)
+    try:
+        yield uow
+        uow.commit()
+    except BaseException:
+        uow.rollback()
+        raise
+    finally:
+        unbind_unit_of_work(token)
+        uow.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Session d'un appel de repository.
+    - dans une unité de travail : session partagée, flush en sortie (les appels suivants voient
+      les écritures, les erreurs d'intégrité remontent ici), commit à la fin de l'unité ;
+    - sinon : session dédiée, commit en sortie.
+    """
+    uow = _current_uow.get()
+    if uow is None:
+        with new_session() as s:
+            yield s
+            s.commit()
+        return
+
+    s = uow.session
+    try:
+        yield s
+        s.flush()
+    except SQLAlchemyError:
+        uow.failed = True
+        s.rollback()
+        raise
+    except BaseException:
+        # erreur métier en cours d'appel : ses modifications non flushées sont abandonnées,
+        # comme avec une session dédiée fermée sans commit
+        for obj in [*s.new, *s.deleted]:
+            s.expunge(obj)
+        s.expire_all()
+        raise
+
+
 def init_db() -> None:
     """
     Ensure database connectivity.
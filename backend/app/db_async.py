@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from sqlalchemy.engine import make_url
+
+from app.db import get_database_url
+from app.db_pool import PoolMetrics, engine_pool_kwargs, instrument_pool
+from app.db_stats import instrument_engine
+from app.settings import get_db_pool_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+# driver sync -> driver asyncio (psycopg 3 fait les deux)
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+# pool distinct de celui de app.db : ses connexions s'ajoutent au total (cf. DbPoolSettings)
+ASYNC_POOL_METRICS = PoolMetrics()
+
+
+def get_async_database_url() -> str:
+    """
+    DASHMONEY_ASYNC_DATABASE_URL si fournie, sinon DASHMONEY_DATABASE_URL avec le driver asyncio équivalent.
+    """
+    env = os.getenv("DASHMONEY_ASYNC_DATABASE_URL", "").strip()
+    if env:
+        return env
+
+    url = make_url(get_database_url())
+    driver = _ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise RuntimeError(f"no asyncio driver known for '{url.drivername}' (set DASHMONEY_ASYNC_DATABASE_URL)")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# sqlalchemy.ext.asyncio exige greenlet à l'import : chargé au premier usage seulement,
+# les routes sync et les scripts n'en dépendent pas
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    url = make_url(get_async_database_url())
+    engine = create_async_engine(
+        url,
+        **engine_pool_kwargs(url, get_db_pool_settings(), ASYNC_POOL_METRICS, base=AsyncAdaptedQueuePool),
+    )
+    instrument_pool(engine.sync_engine.pool, ASYNC_POOL_METRICS)
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+@lru_cache
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def new_async_session() -> AsyncSession:
+    return get_async_session_factory()()
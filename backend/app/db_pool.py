@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.settings import DbPoolSettings
+
+
+class PoolMetrics:
+    """
+    Compteurs cumulés d'un pool (depuis le démarrage du process), alimentés par les événements
+    du pool et par le temps passé dans QueuePool._do_get (attente d'une connexion libre).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_total_sec = 0.0
+        self.wait_max_sec = 0.0
+        self.overflow_peak = 0
+
+    def record_wait(self, seconds: float, *, timed_out: bool) -> None:
+        with self._lock:
+            self.wait_total_sec += seconds
+            self.wait_max_sec = max(self.wait_max_sec, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total_sec * 1000, 3),
+                "wait_avg_ms": round(self.wait_total_sec * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_sec * 1000, 3),
+                "overflow_peak": self.overflow_peak,
+            }
+
+
+def timed_pool_class(base: type[QueuePool], metrics: PoolMetrics) -> type[QueuePool]:
+    """
+    Sous-classe de `base` qui chronomètre l'obtention d'une connexion (file d'attente incluse).
+    Une classe par engine (et non un wrapper d'instance) : survit à pool.recreate() / engine.dispose().
+    """
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except PoolTimeoutError:
+            metrics.record_wait(time.perf_counter() - t0, timed_out=True)
+            raise
+        metrics.record_wait(time.perf_counter() - t0, timed_out=False)
+        metrics.record_checkout(max(self.overflow(), 0))
+        return conn
+
+    return type(f"Timed{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def instrument_pool(pool: Pool, metrics: PoolMetrics) -> None:
+    """
+    Connexions ouvertes / invalidées. Écouteurs sur l'instance (la dispatch est reprise par
+    pool.recreate()) : l'écoute au niveau classe n'est pas supportée pour les pools asyncio.
+    """
+    event.listen(pool, "connect", lambda dbapi_conn, record: metrics.record_connect())
+    event.listen(pool, "invalidate", lambda dbapi_conn, record, exc: metrics.record_invalidation())
+
+
+def engine_pool_kwargs(
+    url: URL,
+    settings: DbPoolSettings,
+    metrics: PoolMetrics,
+    *,
+    base: type[QueuePool] = QueuePool,
+) -> dict[str, Any]:
+    """
+    Arguments de create_engine / create_async_engine pour le pool.
+    SQLite en mémoire garde son pool par défaut (une connexion par thread, pas de file d'attente).
+    """
+    kwargs: dict[str, Any] = {"pool_pre_ping": settings.pre_ping, "pool_recycle": settings.pool_recycle}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return kwargs
+    return {
+        **kwargs,
+        "poolclass": timed_pool_class(base, metrics),
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+    }
+
+
+def pool_status(pool: Pool, metrics: PoolMetrics, settings: DbPoolSettings) -> dict[str, Any]:
+    status: dict[str, Any] = {
+        "class": type(pool).__name__,
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout_sec": settings.pool_timeout,
+        "pool_recycle_sec": settings.pool_recycle,
+        "pre_ping": settings.pre_ping,
+    }
+    if isinstance(pool, QueuePool):
+        status |= {
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+    return status | metrics.snapshot()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import threading
+import time
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """
+    Requêtes SQL exécutées (un executemany compte pour une) et temps passé dans le driver.
+    Partagé entre threads (routes sync, run_in_threadpool) : verrou sur les compteurs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.db_time_sec = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.db_time_sec += seconds
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("dashmoney_query_stats", default=None)
+
+# clé de conn.info : pile des débuts d'exécution (curseurs imbriqués possibles)
+_STARTS_KEY = "dashmoney_query_starts"
+
+
+def bind_query_stats(stats: QueryStats) -> Token:
+    return _current_stats.set(stats)
+
+
+def unbind_query_stats(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault(_STARTS_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    starts = conn.info.get(_STARTS_KEY)
+    if stats is not None and starts:
+        stats.record(time.perf_counter() - starts.pop())
+
+
+def _handle_error(ctx) -> None:
+    # requête en erreur : pas d'after_cursor_execute, comptée quand même
+    if ctx.connection is not None:
+        _after_cursor_execute(ctx.connection, None, None, None, None, False)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Compte les requêtes de `engine` dans les QueryStats du contexte courant (rien hors contexte).
+    Engine asyncio : passer engine.sync_engine.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Statistiques des requêtes exécutées dans le bloc, par le thread / la tâche courante
+    (et les routes sync ou run_in_threadpool qui en héritent le contexte).
+    """
+    stats = QueryStats()
+    token = bind_query_stats(stats)
+    try:
+        yield stats
+    finally:
+        unbind_query_stats(token)
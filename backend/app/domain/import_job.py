@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+
+class ImportJobStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (ImportJobStatus.SUCCEEDED, ImportJobStatus.FAILED)
+
+
+@dataclass(frozen=True)
+class ImportJob:
+    id: UUID
+    account_id: str
+    format: str  # "csv" | "victor"
+    filename: str
+    status: ImportJobStatus
+    created_at: dt.datetime
+    skip_duplicates: bool = False
+    rows_parsed: int = 0
+    imported: int = 0
+    duplicates_skipped: int = 0
+    errors_count: int = 0
+    message: Optional[str] = None  # erreur bloquante (fichier illisible, en-têtes...)
+    started_at: Optional[dt.datetime] = None
+    finished_at: Optional[dt.datetime] = None
+
+
+@dataclass(frozen=True)
+class ImportJobError:
+    line_no: int
+    message: str
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import datetime as dt
+from decimal import Decimal
+import hashlib
+from typing import Optional
+
+from app.domain.money import _quantize_money
+from app.domain.transaction import Transaction
+
+FINGERPRINT_LEN = 64  # sha256 hex
+
+
+def _normalize_text(value: Optional[str]) -> str:
+    # casse / espaces multiples ignorés ("CB  Carrefour" == "cb carrefour")
+    return " ".join((value or "").split()).casefold()
+
+
+def fingerprint(
+    *,
+    account_id: str,
+    date: dt.date,
+    amount: Decimal,
+    category: str,
+    label: Optional[str],
+) -> str:
+    """
+    Empreinte de déduplication des imports : compte, date, montant (2 décimales),
+    catégorie et libellé normalisés. Deux tx légitimement identiques ont la même empreinte :
+    la déduplication compte les occurrences, elle ne suppose pas l'unicité.
+    """
+    payload = "\x1f".join(
+        (
+            account_id.strip(),
+            date.isoformat(),
+            str(_quantize_money(amount)),
+            _normalize_text(category),
+            _normalize_text(label),
+        )
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def transaction_fingerprint(tx: Transaction) -> str:
+    return fingerprint(
+        account_id=tx.account_id,
+        date=tx.date,
+        amount=tx.amount.amount,
+        category=tx.category,
+        label=tx.label,
+    )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import datetime as dt
+from decimal import Decimal
+from typing import Iterable
+
+from app.domain.money import Currency, _quantize_money
+from app.domain.transaction import Transaction, TransactionKind
+
+
+# codes kind = index dans cet ordre (fixe)
+KINDS: tuple[TransactionKind, ...] = tuple(TransactionKind)
+_KIND_CODES = {k: i for i, k in enumerate(KINDS)}
+
+NO_SUBCATEGORY = -1
+
+
+def kind_code(kind: TransactionKind) -> int:
+    return _KIND_CODES[kind]
+
+
+def to_cents(amount: Decimal) -> int:
+    # même arrondi que SignedMoney (2 décimales, ROUND_HALF_UP)
+    return int(_quantize_money(amount).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+@dataclass(frozen=True)
+class TransactionFrame:
+    """
+    Représentation colonnaire et compacte d'un ensemble de transactions (lecture seule).
+    Une colonne = un `array` ; category / subcategory / kind / account_id / currency
+    sont encodés par dictionnaire (code -> valeur dans la liste correspondante).
+    Seuls les champs utiles aux engines sont présents (pas d'id / label / created_at).
+    """
+    ordinals: array  # 'q' date.toordinal()
+    sequences: array  # 'q'
+    cents: array  # 'q' montant signé en centimes
+    kind_codes: array  # 'B' index dans KINDS
+    account_codes: array  # 'I' index dans account_ids
+    category_codes: array  # 'I' index dans categories
+    subcategory_codes: array  # 'i' index dans subcategories, NO_SUBCATEGORY si None
+    currency_codes: array  # 'B' index dans currencies
+    account_ids: list[str]
+    categories: list[str]
+    subcategories: list[str]
+    currencies: list[Currency]
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    @classmethod
+    def empty(cls) -> "TransactionFrame":
+        return TransactionFrameBuilder().build()
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionFrame":
+        b = TransactionFrameBuilder()
+        for t in transactions:
+            b.append(
+                account_id=t.account_id,
+                date=t.date,
+                sequence=t.sequence,
+                amount=t.amount.amount,
+                currency=t.amount.currency,
+                kind=t.kind,
+                category=t.category,
+                subcategory=t.subcategory,
+            )
+        return b.build()
+
+    def date(self, i: int) -> dt.date:
+        return dt.date.fromordinal(self.ordinals[i])
+
+    def amount(self, i: int) -> Decimal:
+        return from_cents(self.cents[i])
+
+    def kind(self, i: int) -> TransactionKind:
+        return KINDS[self.kind_codes[i]]
+
+    def account_id(self, i: int) -> str:
+        return self.account_ids[self.account_codes[i]]
+
+    def take(self, indices: Iterable[int]) -> "TransactionFrame":
+        """
+        Sous-ensemble (dans l'ordre de `indices`) ; les dictionnaires sont partagés.
+        """
+        idx = list(indices)
+        return TransactionFrame(
+            ordinals=array("q", [self.ordinals[i] for i in idx]),
+            sequences=array("q", [self.sequences[i] for i in idx]),
+            cents=array("q", [self.cents[i] for i in idx]),
+            kind_codes=array("B", [self.kind_codes[i] for i in idx]),
+            account_codes=array("I", [self.account_codes[i] for i in idx]),
+            category_codes=array("I", [self.category_codes[i] for i in idx]),
+            subcategory_codes=array("i", [self.subcategory_codes[i] for i in idx]),
+            currency_codes=array("B", [self.currency_codes[i] for i in idx]),
+            account_ids=self.account_ids,
+            categories=self.categories,
+            subcategories=self.subcategories,
+            currencies=self.currencies,
+        )
+
+    def between(self, date_from: dt.date | None, date_to: dt.date | None) -> "TransactionFrame":
+        """
+        Filtre date_from <= date <= date_to (bornes optionnelles, incluses).
+        """
+        if date_from is None and date_to is None:
+            return self
+        lo = date_from.toordinal() if date_from is not None else None
+        hi = date_to.toordinal() if date_to is not None else None
+        return self.take(
+            i
+            for i, o in enumerate(self.ordinals)
+            if (lo is None or o >= lo) and (hi is None or o <= hi)
+        )
+
+    def partition_by_account(self) -> dict[str, "TransactionFrame"]:
+        """
+        Un seul passage : {account_id -> frame du compte} (ordre conservé).
+        """
+        rows: dict[int, list[int]] = {}
+        for i, code in enumerate(self.account_codes):
+            rows.setdefault(code, []).append(i)
+        return {self.account_ids[code]: self.take(idx) for code, idx in rows.items()}
+
+
+class TransactionFrameBuilder:
+    """
+    Construit un TransactionFrame ligne à ligne (ex: directement depuis des rows SQL).
+    """
+
+    def __init__(self) -> None:
+        self._ordinals = array("q")
+        self._sequences = array("q")
+        self._cents = array("q")
+        self._kinds = array("B")
+        self._accounts = array("I")
+        self._categories = array("I")
+        self._subcategories = array("i")
+        self._currencies = array("B")
+        self._account_codes: dict[str, int] = {}
+        self._category_codes: dict[str, int] = {}
+        self._subcategory_codes: dict[str, int] = {}
+        self._currency_codes: dict[Currency, int] = {}
+
+    @staticmethod
+    def _encode(codes: dict, value) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def append(
+        self,
+        *,
+        account_id: str,
+        date: dt.date,
+        sequence: int,
+        amount: Decimal,
+        currency: Currency | str,
+        kind: TransactionKind | str,
+        category: str,
+        subcategory: str | None,
+    ) -> None:
+        self._ordinals.append(date.toordinal())
+        self._sequences.append(sequence)
+        self._cents.append(to_cents(amount))
+        self._kinds.append(_KIND_CODES[TransactionKind(kind)])
+        self._accounts.append(self._encode(self._account_codes, account_id))
+        self._categories.append(self._encode(self._category_codes, category))
+        self._subcategories.append(
+            NO_SUBCATEGORY if subcategory is None else self._encode(self._subcategory_codes, subcategory)
+        )
+        self._currencies.append(self._encode(self._currency_codes, Currency(currency)))
+
+    def build(self) -> TransactionFrame:
+        return TransactionFrame(
+            ordinals=self._ordinals,
+            sequences=self._sequences,
+            cents=self._cents,
+            kind_codes=self._kinds,
+            account_codes=self._accounts,
+            category_codes=self._categories,
+            subcategory_codes=self._subcategories,
+            currency_codes=self._currencies,
+            account_ids=list(self._account_codes),
+            categories=list(self._category_codes),
+            subcategories=list(self._subcategory_codes),
+            currencies=list(self._currency_codes),
+        )
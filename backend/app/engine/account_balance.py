@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import datetime as dt
+from bisect import bisect_right
+from dataclasses import dataclass
 from decimal import Decimal
+from typing import Iterable
 
+from app.domain.account import AccountType
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame, from_cents
 from app.domain.money import Currency
 
 
@@ -18,26 +23,151 @@ def _signed_tx_amount(tx: Transaction) -> SignedMoney:
     return tx.amount
 
 
+@dataclass(frozen=True)
+class BalanceIndex:
+    """
+    Index cumulatif d'un compte (construit une fois, interrogé N fois).
+    - ordinals: dates distinctes (toordinal) triées
+    - sums: somme cumulée des tx jusqu'à ordinals[i] inclus
+    - counts: nombre cumulé de tx jusqu'à ordinals[i] inclus
+    Un solde à la date `at` devient une recherche dichotomique.
+    """
+    ordinals: list[int]
+    sums: list[Decimal]
+    counts: list[int]
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction] | TransactionFrame) -> "BalanceIndex":
+        if isinstance(transactions, TransactionFrame):
+            return cls._from_frame(transactions)
+
+        per_day: dict[int, list] = {}
+        for t in transactions:
+            o = t.date.toordinal()
+            slot = per_day.get(o)
+            if slot is None:
+                per_day[o] = [_signed_tx_amount(t).amount, 1]
+            else:
+                slot[0] += _signed_tx_amount(t).amount
+                slot[1] += 1
+
+        ordinals: list[int] = []
+        sums: list[Decimal] = []
+        counts: list[int] = []
+        total = Decimal("0")
+        n = 0
+        for o in sorted(per_day):
+            amount, count = per_day[o]
+            total += amount
+            n += count
+            ordinals.append(o)
+            sums.append(total)
+            counts.append(n)
+
+        return cls(ordinals=ordinals, sums=sums, counts=counts)
+
+    @classmethod
+    def _from_frame(cls, frame: TransactionFrame) -> "BalanceIndex":
+        # agrégation en centimes (int), conversion Decimal une fois par jour
+        per_day: dict[int, list[int]] = {}
+        for o, c in zip(frame.ordinals, frame.cents):
+            slot = per_day.get(o)
+            if slot is None:
+                per_day[o] = [c, 1]
+            else:
+                slot[0] += c
+                slot[1] += 1
+
+        ordinals: list[int] = []
+        sums: list[Decimal] = []
+        counts: list[int] = []
+        total = 0
+        n = 0
+        for o in sorted(per_day):
+            cents, count = per_day[o]
+            total += cents
+            n += count
+            ordinals.append(o)
+            sums.append(from_cents(total))
+            counts.append(n)
+
+        return cls(ordinals=ordinals, sums=sums, counts=counts)
+
+    def sum_at(self, at: dt.date | None) -> tuple[Decimal, int]:
+        """
+        Retourne (somme des tx, nombre de tx) jusqu'à `at` inclus.
+        at=None => toutes les tx.
+        """
+        if not self.ordinals:
+            return Decimal("0"), 0
+
+        if at is None:
+            return self.sums[-1], self.counts[-1]
+
+        i = bisect_right(self.ordinals, at.toordinal())
+        if i == 0:
+            return Decimal("0"), 0
+        return self.sums[i - 1], self.counts[i - 1]
+
+
+_EMPTY_INDEX = BalanceIndex(ordinals=[], sums=[], counts=[])
+
+
+def build_balance_indexes(transactions: Iterable[Transaction] | TransactionFrame) -> dict[str, BalanceIndex]:
+    """
+    Un seul passage sur les tx => {account_id: BalanceIndex}.
+    """
+    if isinstance(transactions, TransactionFrame):
+        return {aid: BalanceIndex.from_transactions(f) for aid, f in transactions.partition_by_account().items()}
+
+    by_account: dict[str, list[Transaction]] = {}
+    for t in transactions:
+        by_account.setdefault(t.account_id, []).append(t)
+
+    return {aid: BalanceIndex.from_transactions(txs) for aid, txs in by_account.items()}
+
+
+def get_balance_index(indexes: dict[str, BalanceIndex], account_id: str) -> BalanceIndex:
+    return indexes.get(account_id, _EMPTY_INDEX)
+
+
+@dataclass(frozen=True)
+class AccountBalance:
+    """
+    Solde d'un compte à une date, déjà agrégé (ex: SUM(amount) ... GROUP BY account_id côté SQL).
+    """
+    account_id: str
+    account_type: AccountType
+    opening_balance: SignedMoney
+    tx_sum: SignedMoney
+    tx_count: int
+
+    @property
+    def balance(self) -> SignedMoney:
+        return SignedMoney(
+            amount=self.opening_balance.amount + self.tx_sum.amount,
+            currency=self.opening_balance.currency,
+        )
+
+
 def compute_balance(
     *,
     opening_balance: SignedMoney,
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame | None = None,
     at: dt.date | None,
+    index: BalanceIndex | None = None,
 ) -> tuple[SignedMoney, SignedMoney, SignedMoney, int]:
     """
     Retourne (opening_balance, tx_sum, balance, tx_count).
     Filtre les tx jusqu'à la date `at` si fournie (incluse).
+    Si `index` est fourni (déjà construit), `transactions` est ignoré.
     """
-    txs = transactions
-    if at is not None:
-        txs = [t for t in txs if t.date <= at]
+    if index is None:
+        index = BalanceIndex.from_transactions(transactions if transactions is not None else [])
 
-    # somme des tx
-    total = Decimal("0")
-    for t in txs:
-        total += _signed_tx_amount(t).amount
+    total, count = index.sum_at(at)
 
     tx_sum = SignedMoney(amount=total, currency=opening_balance.currency)
     balance = SignedMoney(amount=opening_balance.amount + tx_sum.amount, currency=opening_balance.currency)
 
-    return opening_balance, tx_sum, balance, len(txs)
\ No newline at end of file
+    return opening_balance, tx_sum, balance, count
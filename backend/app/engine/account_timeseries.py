@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import datetime as dt
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
+from typing import Iterator
 
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame, from_cents, kind_code, to_cents
+from app.engine.timeseries_engine import resolve_timeseries_engine
 
 
 Granularity = str  # "daily"|"weekly"|"monthly"|"yearly"
@@ -56,86 +60,205 @@ def _bucket_label(g: Granularity, d: dt.date) -> str:
     raise ValueError(f"unknown granularity '{g}'")
 
 
+def _next_bucket_start(g: Granularity, d: dt.date) -> dt.date:
+    """
+    Premier jour du bucket suivant celui qui commence à `d` (d = début de bucket).
+    """
+    if g == "daily":
+        return d + dt.timedelta(days=1)
+    if g == "weekly":
+        return d + dt.timedelta(days=7)
+    if g == "monthly":
+        if d.month == 12:
+            return dt.date(d.year + 1, 1, 1)
+        return dt.date(d.year, d.month + 1, 1)
+    if g == "yearly":
+        return dt.date(d.year + 1, 1, 1)
+    raise ValueError(f"unknown granularity '{g}'")
+
+
+def _bucket_start(g: Granularity, d: dt.date) -> dt.date:
+    if g == "daily":
+        return d
+    if g == "weekly":
+        return d - dt.timedelta(days=d.weekday())  # lundi ISO
+    if g == "monthly":
+        return d.replace(day=1)
+    if g == "yearly":
+        return d.replace(month=1, day=1)
+    raise ValueError(f"unknown granularity '{g}'")
+
+
+def iter_buckets(g: Granularity, date_from: dt.date, date_to: dt.date) -> Iterator[tuple[str, dt.date, dt.date]]:
+    """
+    Itère les buckets de [date_from, date_to] par arithmétique calendaire :
+    (label, début, fin), bornes incluses et ramenées dans la plage.
+    Un pas par bucket (pas un pas par jour).
+    """
+    if date_from > date_to:
+        raise ValueError("date_from must be <= date_to")
+
+    cur = _bucket_start(g, date_from)
+    while cur <= date_to:
+        nxt = _next_bucket_start(g, cur)
+        end = nxt - dt.timedelta(days=1)
+        yield _bucket_label(g, cur), max(cur, date_from), min(end, date_to)
+        cur = nxt
+
+
+def timeseries_point(
+    bucket: str,
+    *,
+    income: int,
+    expense: int,
+    n_income: int,
+    n_expense: int,
+    balance_start: int,
+    balance_end: int,
+) -> dict:
+    """
+    Point au format du moteur Decimal, à partir de centimes.
+    Même exposant que les sommes Decimal : "0" si aucune tx du kind dans le bucket, sinon 2 décimales.
+    """
+    zero = Decimal("0")
+    return {
+        "bucket": bucket,
+        "income": from_cents(income) if n_income else zero,
+        "expense": from_cents(expense) if n_expense else zero,
+        "net": from_cents(income - expense) if (n_income or n_expense) else zero,
+        "balance_start": from_cents(balance_start),
+        "balance_end": from_cents(balance_end),
+    }
+
+
+def _compute_timeseries_frame(
+    *,
+    opening_balance: SignedMoney,
+    frame: TransactionFrame,
+    date_from: dt.date,
+    date_to: dt.date,
+    granularity: Granularity,
+) -> list[dict]:
+    # même algorithme que compute_timeseries, en centimes (int) sur les colonnes du frame
+    order = sorted(range(len(frame)), key=frame.ordinals.__getitem__)
+    ordinals = [frame.ordinals[i] for i in order]
+    cents = [frame.cents[i] for i in order]
+    kinds = [frame.kind_codes[i] for i in order]
+    income_code = kind_code(TransactionKind.INCOME)
+    expense_code = kind_code(TransactionKind.EXPENSE)
+
+    lo = bisect_left(ordinals, date_from.toordinal())
+    balance = to_cents(opening_balance.amount) + sum(cents[:lo])
+
+    points: list[dict] = []
+    for bucket, _start, end in iter_buckets(granularity, date_from, date_to):
+        hi = bisect_right(ordinals, end.toordinal(), lo)
+
+        income = expense = signed_sum = 0
+        n_income = n_expense = 0
+        for i in range(lo, hi):
+            c = cents[i]
+            signed_sum += c
+            if kinds[i] == income_code:
+                income += abs(c)
+                n_income += 1
+            elif kinds[i] == expense_code:
+                expense += abs(c)
+                n_expense += 1
+        lo = hi
+
+        points.append(
+            timeseries_point(
+                bucket,
+                income=income,
+                expense=expense,
+                n_income=n_income,
+                n_expense=n_expense,
+                balance_start=balance,
+                balance_end=balance + signed_sum,
+            )
+        )
+        balance += signed_sum
+
+    return points
+
+
 def compute_timeseries(
     *,
     opening_balance: SignedMoney,
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame,
     date_from: dt.date,
     date_to: dt.date,
     granularity: Granularity,
+    engine: str | None = None,
 ) -> list[dict]:
     """
     Returns points (dict) ordered by bucket:
     {bucket, income, expense, net, balance_end} with Decimal values (not formatted).
+    `transactions`: list[Transaction] or TransactionFrame (same result).
+    `engine`: "decimal" | "numpy" | "auto" (None => setting, cf. resolve_timeseries_engine).
     """
     if date_from > date_to:
         raise ValueError("date_from must be <= date_to")
 
-    # Filter txs that affect output range + txs before range for initial balance
-    txs_in_range = [t for t in transactions if date_from <= t.date <= date_to]
-    txs_before = [t for t in transactions if t.date < date_from]
+    if resolve_timeseries_engine(len(transactions), engine) == "numpy":
+        from app.engine.timeseries_numpy import compute_timeseries_np
+
+        return compute_timeseries_np(
+            opening_balance=opening_balance,
+            transactions=transactions,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+        )
+
+    if isinstance(transactions, TransactionFrame):
+        return _compute_timeseries_frame(
+            opening_balance=opening_balance,
+            frame=transactions,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+        )
+
+    # Tri stable par date (l'ordre date/sequence du repo est conservé) + ordinals pour bisect
+    txs = sorted(transactions, key=lambda t: t.date)
+    ordinals = [t.date.toordinal() for t in txs]
 
     # initial balance at date_from
-    balance = opening_balance.amount + sum((_signed_decimal(t) for t in txs_before), Decimal("0"))
-
-    # Group txs by bucket label
-    buckets: dict[str, dict] = {}
-    for t in txs_in_range:
-        b = _bucket_label(granularity, t.date)
-        if b not in buckets:
-            buckets[b] = {"income": Decimal("0"), "expense": Decimal("0"), "signed_sum": Decimal("0")}
-        inc, exp = _income_expense_decimals(t)
-        buckets[b]["income"] += inc
-        buckets[b]["expense"] += exp
-        buckets[b]["signed_sum"] += _signed_decimal(t)
-
-    # We must output buckets in chronological order, including empty buckets.
-    # We'll iterate dates and record bucket transitions.
+    lo = bisect_left(ordinals, date_from.toordinal())
+    balance = opening_balance.amount + sum((_signed_decimal(t) for t in txs[:lo]), Decimal("0"))
+
+    # Buckets in chronological order (including empty ones), boundaries precomputed:
+    # each bucket consumes the slice of txs whose date <= bucket end.
     points: list[dict] = []
-    seen: set[str] = set()
 
-    cur = date_from
-    last_bucket: str | None = None
+    for bucket, _start, end in iter_buckets(granularity, date_from, date_to):
+        hi = bisect_right(ordinals, end.toordinal(), lo)
 
-    def flush_bucket(bucket: str) -> None:
-        nonlocal balance
-        data = buckets.get(bucket, {"income": Decimal("0"), "expense": Decimal("0"), "signed_sum": Decimal("0")})
+        income = Decimal("0")
+        expense = Decimal("0")
+        signed_sum = Decimal("0")
+        for t in txs[lo:hi]:
+            inc, exp = _income_expense_decimals(t)
+            income += inc
+            expense += exp
+            signed_sum += _signed_decimal(t)
+        lo = hi
 
         balance_start = balance
-        balance_end = balance + data["signed_sum"]
+        balance_end = balance + signed_sum
         balance = balance_end  # update state
 
-        income = data["income"]
-        expense = data["expense"]
-        net = income - expense
-
         points.append(
             {
                 "bucket": bucket,
                 "income": income,
                 "expense": expense,
-                "net": net,
-                "balance_start": balance_start,  # NEW
+                "net": income - expense,
+                "balance_start": balance_start,
                 "balance_end": balance_end,
             }
         )
 
-    while cur <= date_to:
-        b = _bucket_label(granularity, cur)
-        if last_bucket is None:
-            last_bucket = b
-
-        if b != last_bucket:
-            if last_bucket not in seen:
-                flush_bucket(last_bucket)
-                seen.add(last_bucket)
-            last_bucket = b
-
-        # advance
-        cur += dt.timedelta(days=1)
-
-    # flush last
-    if last_bucket is not None and last_bucket not in seen:
-        flush_bucket(last_bucket)
-
-    return points
\ No newline at end of file
+    return points
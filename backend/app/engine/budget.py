@@ -9,6 +9,7 @@ from collections import defaultdict
 from app.domain.money import Currency
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import KINDS, NO_SUBCATEGORY, TransactionFrame, from_cents, kind_code
 
 
 @dataclass(frozen=True)
@@ -43,76 +44,269 @@ class MonthlyKindTotal:
     total: SignedMoney
 
 
+@dataclass(frozen=True)
+class BudgetSummary:
+    by_kind: list[KindTotal]
+    by_category: list[CategoryTotal]
+    by_subcategory: list[SubcategoryTotal]
+    by_month_kind: list[MonthlyKindTotal]
+
+
+@dataclass(frozen=True)
+class BudgetTotals:
+    """
+    Sommes brutes (non quantifiées) par groupe : sortie d'un scan Python ou d'un GROUP BY SQL.
+    """
+    by_kind: dict[TransactionKind, Decimal]
+    by_category: dict[str, Decimal]  # EXPENSE uniquement
+    by_subcategory: dict[tuple[str, str], Decimal]  # EXPENSE avec subcategory
+    by_month_kind: dict[tuple[int, int, TransactionKind], Decimal]
+
+
 # app/engine/budget.py (suite)
 
 def _zero(currency: Currency) -> SignedMoney:
     return SignedMoney.from_str("0.00", currency)
 
 
-def totals_by_kind(txs: list[Transaction], *, currency: Currency) -> list[KindTotal]:
-    acc: dict[TransactionKind, Decimal] = defaultdict(Decimal)
+def _frame_sums(frame: TransactionFrame, key_of, *, kind: TransactionKind | None = None) -> dict:
+    """
+    Somme des centimes par clé sur un TransactionFrame (clé = key_of(i), None => ignorée),
+    en ne gardant que `kind` si fourni. Retourne {clé: Decimal}.
+    """
+    only = kind_code(kind) if kind is not None else None
+    acc: dict = defaultdict(int)
+    for i, (k, c) in enumerate(zip(frame.kind_codes, frame.cents)):
+        if only is not None and k != only:
+            continue
+        key = key_of(i)
+        if key is None:
+            continue
+        acc[key] += c
+    return {key: from_cents(v) for key, v in acc.items()}
 
-    for t in txs:
-        # currency déjà garantie par repo (strict)
-        acc[t.kind] += t.amount.amount
 
-    out = [
-        KindTotal(kind=k, total=SignedMoney.from_str(f"{v:.2f}", currency))
-        for k, v in acc.items()
-    ]
-    out.sort(key=lambda x: x.kind.value)  # stable
-    return out
+def _money(v: Decimal, currency: Currency) -> SignedMoney:
+    # quantization unique (SignedMoney arrondit à 2 décimales)
+    return SignedMoney(amount=v, currency=currency)
 
 
-def expense_totals_by_category(txs: list[Transaction], *, currency: Currency) -> list[CategoryTotal]:
-    acc: dict[str, Decimal] = defaultdict(Decimal)
+def _kind_totals(acc: dict[TransactionKind, Decimal], currency: Currency) -> list[KindTotal]:
+    out = [KindTotal(kind=k, total=_money(v, currency)) for k, v in acc.items()]
+    out.sort(key=lambda x: x.kind.value)  # stable
+    return out
 
-    for t in txs:
-        if t.kind != TransactionKind.EXPENSE:
-            continue
-        acc[t.category] += t.amount.amount  # négatif en général
 
-    out = [
-        CategoryTotal(category=c, total=SignedMoney.from_str(f"{v:.2f}", currency))
-        for c, v in acc.items()
-    ]
+def _category_totals(acc: dict[str, Decimal], currency: Currency) -> list[CategoryTotal]:
+    out = [CategoryTotal(category=c, total=_money(v, currency)) for c, v in acc.items()]
     # tri déterministe : plus grosse dépense (valeur la plus négative) d'abord ?
     # On reste descriptif : on trie par montant croissant (ex: -500, -20) => gros postes en haut
     out.sort(key=lambda x: (x.total.amount, x.category.casefold()))
     return out
 
 
-def expense_totals_by_subcategory(txs: list[Transaction], *, currency: Currency) -> list[SubcategoryTotal]:
-    acc: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
-
-    for t in txs:
-        if t.kind != TransactionKind.EXPENSE:
-            continue
-        if t.subcategory is None:
-            continue
-        acc[(t.category, t.subcategory)] += t.amount.amount
-
+def _subcategory_totals(acc: dict[tuple[str, str], Decimal], currency: Currency) -> list[SubcategoryTotal]:
     out = [
-        SubcategoryTotal(category=cat, subcategory=sub, total=SignedMoney.from_str(f"{v:.2f}", currency))
+        SubcategoryTotal(category=cat, subcategory=sub, total=_money(v, currency))
         for (cat, sub), v in acc.items()
     ]
     out.sort(key=lambda x: (x.total.amount, x.category.casefold(), x.subcategory.casefold()))
     return out
 
 
-def monthly_totals_by_kind(txs: list[Transaction], *, currency: Currency) -> list[MonthlyKindTotal]:
-    acc: dict[tuple[int, int, TransactionKind], Decimal] = defaultdict(Decimal)
-
-    for t in txs:
-        acc[(t.date.year, t.date.month, t.kind)] += t.amount.amount
-
+def _monthly_totals(acc: dict[tuple[int, int, TransactionKind], Decimal], currency: Currency) -> list[MonthlyKindTotal]:
     out = [
-        MonthlyKindTotal(
-            month=MonthKey(year=y, month=m),
-            kind=k,
-            total=SignedMoney.from_str(f"{v:.2f}", currency),
-        )
+        MonthlyKindTotal(month=MonthKey(year=y, month=m), kind=k, total=_money(v, currency))
         for (y, m, k), v in acc.items()
     ]
     out.sort(key=lambda x: (x.month.year, x.month.month, x.kind.value))
     return out
+
+
+def totals_by_kind(txs: list[Transaction] | TransactionFrame, *, currency: Currency) -> list[KindTotal]:
+    acc: dict[TransactionKind, Decimal] = defaultdict(Decimal)
+
+    if isinstance(txs, TransactionFrame):
+        codes = txs.kind_codes
+        acc.update(_frame_sums(txs, lambda i: KINDS[codes[i]]))
+    else:
+        for t in txs:
+            # currency déjà garantie par repo (strict)
+            acc[t.kind] += t.amount.amount
+
+    return _kind_totals(acc, currency)
+
+
+def expense_totals_by_category(txs: list[Transaction] | TransactionFrame, *, currency: Currency) -> list[CategoryTotal]:
+    acc: dict[str, Decimal] = defaultdict(Decimal)
+
+    if isinstance(txs, TransactionFrame):
+        codes, names = txs.category_codes, txs.categories
+        acc.update(_frame_sums(txs, lambda i: names[codes[i]], kind=TransactionKind.EXPENSE))
+    else:
+        for t in txs:
+            if t.kind != TransactionKind.EXPENSE:
+                continue
+            acc[t.category] += t.amount.amount  # négatif en général
+
+    return _category_totals(acc, currency)
+
+
+def expense_totals_by_subcategory(
+    txs: list[Transaction] | TransactionFrame, *, currency: Currency
+) -> list[SubcategoryTotal]:
+    acc: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
+
+    if isinstance(txs, TransactionFrame):
+        cats, cat_names = txs.category_codes, txs.categories
+        subs, sub_names = txs.subcategory_codes, txs.subcategories
+
+        def key_of(i: int) -> tuple[str, str] | None:
+            if subs[i] == NO_SUBCATEGORY:
+                return None
+            return cat_names[cats[i]], sub_names[subs[i]]
+
+        acc.update(_frame_sums(txs, key_of, kind=TransactionKind.EXPENSE))
+    else:
+        for t in txs:
+            if t.kind != TransactionKind.EXPENSE:
+                continue
+            if t.subcategory is None:
+                continue
+            acc[(t.category, t.subcategory)] += t.amount.amount
+
+    return _subcategory_totals(acc, currency)
+
+
+def monthly_totals_by_kind(txs: list[Transaction] | TransactionFrame, *, currency: Currency) -> list[MonthlyKindTotal]:
+    acc: dict[tuple[int, int, TransactionKind], Decimal] = defaultdict(Decimal)
+
+    if isinstance(txs, TransactionFrame):
+        ordinals, codes = txs.ordinals, txs.kind_codes
+        months: dict[int, tuple[int, int]] = {}  # cache ordinal -> (year, month)
+
+        def key_of(i: int) -> tuple[int, int, TransactionKind]:
+            ym = months.get(ordinals[i])
+            if ym is None:
+                d = dt.date.fromordinal(ordinals[i])
+                ym = months[ordinals[i]] = (d.year, d.month)
+            return ym[0], ym[1], KINDS[codes[i]]
+
+        acc.update(_frame_sums(txs, key_of))
+    else:
+        for t in txs:
+            acc[(t.date.year, t.date.month, t.kind)] += t.amount.amount
+
+    return _monthly_totals(acc, currency)
+
+
+def _scan_transactions(
+    txs: list[Transaction],
+    *,
+    date_from: dt.date | None,
+    date_to: dt.date | None,
+) -> BudgetTotals:
+    by_kind: dict[TransactionKind, Decimal] = defaultdict(Decimal)
+    by_cat: dict[str, Decimal] = defaultdict(Decimal)
+    by_sub: dict[tuple[str, str], Decimal] = defaultdict(Decimal)
+    by_month: dict[tuple[int, int, TransactionKind], Decimal] = defaultdict(Decimal)
+
+    for t in txs:
+        d = t.date
+        if (date_from is not None and d < date_from) or (date_to is not None and d > date_to):
+            continue
+
+        a = t.amount.amount
+        by_kind[t.kind] += a
+        by_month[(d.year, d.month, t.kind)] += a
+        if t.kind == TransactionKind.EXPENSE:
+            by_cat[t.category] += a
+            if t.subcategory is not None:
+                by_sub[(t.category, t.subcategory)] += a
+
+    return BudgetTotals(by_kind=by_kind, by_category=by_cat, by_subcategory=by_sub, by_month_kind=by_month)
+
+
+def _scan_frame(
+    frame: TransactionFrame,
+    *,
+    date_from: dt.date | None,
+    date_to: dt.date | None,
+) -> BudgetTotals:
+    # sommes en centimes sur les codes, décodage (et Decimal) une fois par groupe à la fin
+    lo = date_from.toordinal() if date_from is not None else dt.date.min.toordinal()
+    hi = date_to.toordinal() if date_to is not None else dt.date.max.toordinal()
+    expense = kind_code(TransactionKind.EXPENSE)
+
+    by_kind: dict[int, int] = defaultdict(int)
+    by_cat: dict[int, int] = defaultdict(int)
+    by_sub: dict[tuple[int, int], int] = defaultdict(int)
+    by_month: dict[tuple[int, int], int] = defaultdict(int)  # (ordinal du 1er du mois, kind)
+    month_of: dict[int, int] = {}
+
+    for o, k, c, cat, sub in zip(
+        frame.ordinals, frame.kind_codes, frame.cents, frame.category_codes, frame.subcategory_codes
+    ):
+        if o < lo or o > hi:
+            continue
+
+        m = month_of.get(o)
+        if m is None:
+            m = month_of[o] = dt.date.fromordinal(o).replace(day=1).toordinal()
+
+        by_kind[k] += c
+        by_month[(m, k)] += c
+        if k == expense:
+            by_cat[cat] += c
+            if sub != NO_SUBCATEGORY:
+                by_sub[(cat, sub)] += c
+
+    cats, subs = frame.categories, frame.subcategories
+    months = {m: dt.date.fromordinal(m) for m, _ in by_month}
+    return BudgetTotals(
+        by_kind={KINDS[k]: from_cents(v) for k, v in by_kind.items()},
+        by_category={cats[c]: from_cents(v) for c, v in by_cat.items()},
+        by_subcategory={(cats[c], subs[sc]): from_cents(v) for (c, sc), v in by_sub.items()},
+        by_month_kind={
+            (months[m].year, months[m].month, KINDS[k]): from_cents(v) for (m, k), v in by_month.items()
+        },
+    )
+
+
+def budget_totals(
+    txs: list[Transaction] | TransactionFrame,
+    *,
+    date_from: dt.date | None = None,
+    date_to: dt.date | None = None,
+) -> BudgetTotals:
+    """
+    Les 4 agrégats bruts en un seul passage, filtre de dates (bornes incluses) compris.
+    """
+    scan = _scan_frame if isinstance(txs, TransactionFrame) else _scan_transactions
+    return scan(txs, date_from=date_from, date_to=date_to)
+
+
+def summarize_budget_totals(totals: BudgetTotals, *, currency: Currency) -> BudgetSummary:
+    """
+    Quantization (une fois par groupe) + tris, quelle que soit la source des sommes.
+    """
+    return BudgetSummary(
+        by_kind=_kind_totals(totals.by_kind, currency),
+        by_category=_category_totals(totals.by_category, currency),
+        by_subcategory=_subcategory_totals(totals.by_subcategory, currency),
+        by_month_kind=_monthly_totals(totals.by_month_kind, currency),
+    )
+
+
+def summarize_budget(
+    txs: list[Transaction] | TransactionFrame,
+    *,
+    currency: Currency,
+    date_from: dt.date | None = None,
+    date_to: dt.date | None = None,
+) -> BudgetSummary:
+    """
+    Les 4 agrégats du budget (kind, catégorie, sous-catégorie, mois x kind) en un seul passage,
+    filtre de dates (bornes incluses) compris. Même résultat que les 4 fonctions séparées.
+    """
+    return summarize_budget_totals(budget_totals(txs, date_from=date_from, date_to=date_to), currency=currency)
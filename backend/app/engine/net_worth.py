@@ -5,32 +5,42 @@ from decimal import Decimal
 
 from app.domain.account import Account
 from app.domain.transaction import Transaction
+from app.domain.transaction_frame import TransactionFrame
 from app.domain.signed_money import SignedMoney
-from app.engine.account_balance import compute_balance
+from app.engine.account_balance import (
+    AccountBalance,
+    BalanceIndex,
+    build_balance_indexes,
+    compute_balance,
+    get_balance_index,
+)
 from app.engine.account_timeseries import compute_timeseries, Granularity
+from app.engine.timeseries_engine import resolve_timeseries_engine
 from app.domain.account import AccountType
 
 
 def compute_net_worth(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame | None = None,
     at: dt.date | None,
+    indexes: dict[str, BalanceIndex] | None = None,
 ) -> SignedMoney:
     """
     Somme des balances de tous les comptes à la date `at`.
+    `indexes` (cf. build_balance_indexes) évite de re-parcourir les tx.
     """
+    if indexes is None:
+        indexes = build_balance_indexes(transactions or [])
 
     total = Decimal("0")
     currency = None
 
     for account in accounts:
-        account_txs = [t for t in transactions if t.account_id == account.id]
-
         _, _, balance, _ = compute_balance(
             opening_balance=account.opening_balance,
-            transactions=account_txs,
             at=at,
+            index=get_balance_index(indexes, account.id),
         )
 
         total += balance.amount
@@ -41,118 +51,227 @@ def compute_net_worth(
     return SignedMoney(amount=total, currency=currency)
 
 
-def compute_net_worth_timeseries(
+def compute_net_worth_from_balances(balances: list[AccountBalance]) -> SignedMoney:
+    """
+    Même résultat que compute_net_worth, à partir de soldes déjà agrégés (1 ligne par compte).
+    """
+    total = Decimal("0")
+    currency = None
+    for b in balances:
+        balance = b.balance
+        total += balance.amount
+        if currency is None:
+            currency = balance.currency
+    return SignedMoney(amount=total, currency=currency)
+
+
+def compute_net_worth_grouped_from_balances(balances: list[AccountBalance]) -> dict[str, SignedMoney]:
+    """
+    Même résultat que compute_net_worth_grouped, à partir de soldes déjà agrégés.
+    """
+    totals: dict[AccountType, Decimal] = {}
+    currencies: dict[AccountType, object] = {}
+    for b in balances:
+        balance = b.balance
+        totals[b.account_type] = totals.get(b.account_type, Decimal("0")) + balance.amount
+        currencies.setdefault(b.account_type, balance.currency)
+
+    return {
+        t.value: SignedMoney(amount=totals[t], currency=currencies[t])
+        for t in AccountType
+        if t in totals
+    }
+
+
+def partition_by_account(
+    transactions: list[Transaction] | TransactionFrame,
+) -> dict[str, list[Transaction]] | dict[str, TransactionFrame]:
+    """
+    Un seul passage : {account_id -> tx du compte} (ordre d'entrée conservé).
+    Remplace les `[t for t in transactions if t.account_id == account.id]` par compte.
+    """
+    if isinstance(transactions, TransactionFrame):
+        return transactions.partition_by_account()
+
+    out: dict[str, list[Transaction]] = {}
+    for t in transactions:
+        bucket = out.get(t.account_id)
+        if bucket is None:
+            out[t.account_id] = [t]
+        else:
+            bucket.append(t)
+    return out
+
+
+def _accumulate_points(aggregated: dict[str, dict], points: list[dict]) -> None:
+    for p in points:
+        bucket = p["bucket"]
+
+        agg = aggregated.get(bucket)
+        if agg is None:
+            agg = aggregated[bucket] = {
+                "income": Decimal("0"),
+                "expense": Decimal("0"),
+                "net": Decimal("0"),
+                "balance_start": Decimal("0"),
+                "balance_end": Decimal("0"),
+            }
+
+        agg["income"] += p["income"]
+        agg["expense"] += p["expense"]
+        agg["net"] += p["net"]
+        agg["balance_start"] += p["balance_start"]
+        agg["balance_end"] += p["balance_end"]
+
+
+def _ordered_points(aggregated: dict[str, dict]) -> list[dict]:
+    # tri chronologique
+    return [{"bucket": bucket, **aggregated[bucket]} for bucket in sorted(aggregated.keys())]
+
+
+def _sweep_timeseries(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame,
     date_from: dt.date,
     date_to: dt.date,
     granularity: Granularity,
-) -> list[dict]:
+    with_groups: bool,
+) -> tuple[dict[str, dict], dict[str, dict[str, dict]]]:
     """
-    Agrège les timeseries de tous les comptes.
+    Une timeseries par compte (calculée une seule fois), agrégée en même temps
+    dans le total et dans le groupe AccountType du compte.
     """
+    by_account = partition_by_account(transactions)
 
-    aggregated: dict[str, dict] = {}
+    total: dict[str, dict] = {}
+    groups: dict[str, dict[str, dict]] = {}
+    if with_groups:
+        # ordre stable = ordre de l'enum (comme avant)
+        present = {a.account_type for a in accounts}
+        groups = {t.value: {} for t in AccountType if t in present}
 
     for account in accounts:
-        account_txs = [t for t in transactions if t.account_id == account.id]
-
         points = compute_timeseries(
             opening_balance=account.opening_balance,
-            transactions=account_txs,
+            transactions=by_account.get(account.id, []),
             date_from=date_from,
             date_to=date_to,
             granularity=granularity,
         )
 
-        for p in points:
-            bucket = p["bucket"]
+        _accumulate_points(total, points)
+        if with_groups:
+            _accumulate_points(groups[account.account_type.value], points)
 
-            if bucket not in aggregated:
-                aggregated[bucket] = {
-                    "income": Decimal("0"),
-                    "expense": Decimal("0"),
-                    "net": Decimal("0"),
-                    "balance_start": Decimal("0"),
-                    "balance_end": Decimal("0"),
-                }
+    return total, groups
 
-            aggregated[bucket]["income"] += p["income"]
-            aggregated[bucket]["expense"] += p["expense"]
-            aggregated[bucket]["net"] += p["net"]
-            aggregated[bucket]["balance_start"] += p["balance_start"]
-            aggregated[bucket]["balance_end"] += p["balance_end"]
 
-    # tri chronologique
-    ordered = []
-    for bucket in sorted(aggregated.keys()):
-        ordered.append({"bucket": bucket, **aggregated[bucket]})
+def compute_net_worth_timeseries(
+    *,
+    accounts: list[Account],
+    transactions: list[Transaction] | TransactionFrame,
+    date_from: dt.date,
+    date_to: dt.date,
+    granularity: Granularity,
+    engine: str | None = None,
+) -> list[dict]:
+    """
+    Agrège les timeseries de tous les comptes.
+    """
+    if resolve_timeseries_engine(len(transactions), engine) == "numpy":
+        from app.engine.timeseries_numpy import sweep_timeseries_np
 
-    return ordered
+        total_points, _ = sweep_timeseries_np(
+            accounts=accounts,
+            transactions=transactions,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+            with_groups=False,
+        )
+        return total_points
+
+    total, _ = _sweep_timeseries(
+        accounts=accounts,
+        transactions=transactions,
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+        with_groups=False,
+    )
+    return _ordered_points(total)
 
 
 def compute_net_worth_grouped(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame | None = None,
     at: dt.date | None,
+    indexes: dict[str, BalanceIndex] | None = None,
 ) -> dict[str, SignedMoney]:
     """
     Retourne un mapping {AccountType -> net worth}.
-    Réutilise compute_net_worth (pas de duplication).
+    Un seul passage sur les comptes (les tx sont déjà indexées par compte).
     """
-    out: dict[str, SignedMoney] = {}
+    if indexes is None:
+        indexes = build_balance_indexes(transactions or [])
 
-    for t in AccountType:
-        group_accounts = [a for a in accounts if a.account_type == t]
-        if not group_accounts:
-            continue
+    totals: dict[AccountType, Decimal] = {}
+    currencies: dict[AccountType, object] = {}
 
-        out[t.value] = compute_net_worth(
-            accounts=group_accounts,
-            transactions=transactions,
+    for account in accounts:
+        _, _, balance, _ = compute_balance(
+            opening_balance=account.opening_balance,
             at=at,
+            index=get_balance_index(indexes, account.id),
         )
 
-    return out
+        t = account.account_type
+        totals[t] = totals.get(t, Decimal("0")) + balance.amount
+        currencies.setdefault(t, balance.currency)
+
+    return {
+        t.value: SignedMoney(amount=totals[t], currency=currencies[t])
+        for t in AccountType
+        if t in totals
+    }
 
 
 def compute_net_worth_timeseries_grouped(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame,
     date_from: dt.date,
     date_to: dt.date,
     granularity: Granularity,
+    engine: str | None = None,
 ) -> tuple[list[dict], dict[str, list[dict]]]:
     """
     Retourne:
       - total_points (list[dict])
       - groups_points (dict[type -> list[dict]])
+    Total et groupes sont produits dans le même passage.
     """
-    # total
-    total_points = compute_net_worth_timeseries(
-        accounts=accounts,
-        transactions=transactions,
-        date_from=date_from,
-        date_to=date_to,
-        granularity=granularity,
-    )
-
-    # groups
-    groups: dict[str, list[dict]] = {}
-    for t in AccountType:
-        group_accounts = [a for a in accounts if a.account_type == t]
-        if not group_accounts:
-            continue
+    if resolve_timeseries_engine(len(transactions), engine) == "numpy":
+        from app.engine.timeseries_numpy import sweep_timeseries_np
 
-        groups[t.value] = compute_net_worth_timeseries(
-            accounts=group_accounts,
+        return sweep_timeseries_np(
+            accounts=accounts,
             transactions=transactions,
             date_from=date_from,
             date_to=date_to,
             granularity=granularity,
+            with_groups=True,
         )
 
-    return total_points, groups
\ No newline at end of file
+    total, groups = _sweep_timeseries(
+        accounts=accounts,
+        transactions=transactions,
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+        with_groups=True,
+    )
+
+    return _ordered_points(total), {k: _ordered_points(v) for k, v in groups.items()}
@@ -5,22 +5,34 @@ from decimal import Decimal
 
 from app.domain.account import Account
 from app.domain.transaction import Transaction
+from app.domain.transaction_frame import TransactionFrame
 from app.domain.money import Currency
 from app.domain.portfolio import Portfolio, PortfolioSnapshot
 from app.domain.signed_money import SignedMoney
-from app.engine.net_worth import compute_net_worth, compute_net_worth_timeseries
-from app.engine.portfolio_value import compute_portfolios_value, bucket_end_date
+from app.engine.account_balance import AccountBalance, BalanceIndex
+from app.engine.net_worth import compute_net_worth, compute_net_worth_from_balances, compute_net_worth_timeseries
+from app.engine.account_timeseries import iter_buckets
+from app.engine.portfolio_value import compute_portfolios_value, compute_portfolios_value_series
 
 
 def compute_net_worth_full(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame | None = None,
     portfolios: list[Portfolio],
     portfolio_snapshots: list[PortfolioSnapshot],
     at: dt.date | None,
+    indexes: dict[str, BalanceIndex] | None = None,
+    balances: list[AccountBalance] | None = None,
 ) -> SignedMoney:
-    cash = compute_net_worth(accounts=accounts, transactions=transactions, at=at)
+    """
+    `balances` (soldes déjà agrégés à `at`, cf. SqlTransactionRepository.balances_at)
+    remplace accounts/transactions/indexes pour la partie cash.
+    """
+    if balances is not None:
+        cash = compute_net_worth_from_balances(balances)
+    else:
+        cash = compute_net_worth(accounts=accounts, transactions=transactions, at=at, indexes=indexes)
 
     currency = cash.currency
     if currency is None:
@@ -40,7 +52,7 @@ def compute_net_worth_full(
 def compute_net_worth_full_timeseries(
     *,
     accounts: list[Account],
-    transactions: list[Transaction],
+    transactions: list[Transaction] | TransactionFrame,
     portfolios: list[Portfolio],
     portfolio_snapshots: list[PortfolioSnapshot],
     date_from: dt.date,
@@ -66,17 +78,17 @@ def compute_net_worth_full_timeseries(
         break
     currency = currency or Currency.EUR
 
-    out: list[dict] = []
-    for p in cash_points:
-        as_of = bucket_end_date(p["bucket"], granularity, date_from, date_to)
-
-        pv = compute_portfolios_value(
-            portfolios=portfolios,
-            snapshots=portfolio_snapshots,
-            at=as_of,
-            currency=currency,
-        )
+    # as_of = fin de chaque bucket (bornée à la plage), dans le même ordre que cash_points
+    as_of_dates = [end for _, _, end in iter_buckets(granularity, date_from, date_to)]
+    pvs = compute_portfolios_value_series(
+        portfolios=portfolios,
+        snapshots=portfolio_snapshots,
+        dates=as_of_dates,
+        currency=currency,
+    )
 
+    out: list[dict] = []
+    for p, pv in zip(cash_points, pvs):
         out.append(
             {
                 **p,
@@ -85,4 +97,4 @@ def compute_net_worth_full_timeseries(
             }
         )
 
-    return out
\ No newline at end of file
+    return out
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from dataclasses import dataclass
 from decimal import Decimal
 from uuid import UUID
 
@@ -54,6 +55,82 @@ def compute_portfolios_value(
     return SignedMoney(amount=total, currency=currency)
 
 
+@dataclass(frozen=True)
+class SnapshotIndex:
+    """
+    Snapshots d'un portfolio triés par (date, id) : on ne garde que le dernier de chaque jour.
+    - ordinals: dates distinctes (toordinal) croissantes
+    - values: valeur du snapshot retenu pour ce jour
+    """
+    ordinals: list[int]
+    values: list[Decimal]
+
+    @classmethod
+    def from_snapshots(cls, snapshots: list[PortfolioSnapshot]) -> "SnapshotIndex":
+        ordinals: list[int] = []
+        values: list[Decimal] = []
+        for s in sorted(snapshots, key=lambda s: (s.date, str(s.id))):
+            o = s.date.toordinal()
+            if ordinals and ordinals[-1] == o:
+                values[-1] = s.value.amount  # même tie-break que _latest_snapshot_value
+            else:
+                ordinals.append(o)
+                values.append(s.value.amount)
+        return cls(ordinals=ordinals, values=values)
+
+
+def build_snapshot_indexes(snapshots: list[PortfolioSnapshot]) -> dict[UUID, SnapshotIndex]:
+    """
+    Un seul passage sur les snapshots => {portfolio_id: SnapshotIndex}.
+    """
+    by_portfolio: dict[UUID, list[PortfolioSnapshot]] = {}
+    for s in snapshots:
+        by_portfolio.setdefault(s.portfolio_id, []).append(s)
+    return {pid: SnapshotIndex.from_snapshots(snaps) for pid, snaps in by_portfolio.items()}
+
+
+def compute_portfolios_value_series(
+    *,
+    portfolios: list[Portfolio],
+    snapshots: list[PortfolioSnapshot],
+    dates: list[dt.date],
+    currency: Currency,
+) -> list[SignedMoney]:
+    """
+    Équivalent de compute_portfolios_value pour chaque date de `dates` (croissantes),
+    en une jointure "as-of" : dates et snapshots triés sont parcourus ensemble (merge).
+    Coût O(portfolios × (dates + snapshots)) au lieu de O(dates × portfolios × snapshots).
+    """
+    for p in portfolios:
+        if p.currency != currency:
+            raise ValueError("Multiple currencies not supported yet (portfolio currency mismatch)")
+
+    date_ordinals = [d.toordinal() for d in dates]
+    if any(a > b for a, b in zip(date_ordinals, date_ordinals[1:])):
+        raise ValueError("dates must be sorted")
+
+    totals = [Decimal("0.00")] * len(dates)
+    indexes = build_snapshot_indexes(snapshots)
+
+    for p in portfolios:
+        index = indexes.get(p.id)
+        if index is None:
+            # pas de snapshot => 0
+            continue
+
+        j = 0
+        n = len(index.ordinals)
+        current: Decimal | None = None
+        for i, o in enumerate(date_ordinals):
+            while j < n and index.ordinals[j] <= o:
+                current = index.values[j]
+                j += 1
+            if current is not None:
+                totals[i] += current
+
+    return [SignedMoney(amount=t, currency=currency) for t in totals]
+
+
 def bucket_end_date(bucket: str, granularity: str, date_from: dt.date, date_to: dt.date) -> dt.date:
     """
     Reconstruit une date 'as_of' pour un bucket de tes timeseries.
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable
+
+
+def trading_days(date_from: dt.date, date_to: dt.date) -> list[dt.date]:
+    """
+    Jours ouvrés (lun-ven) inclus. Les fériés ne sont pas connus ici : le backfill les
+    mémorise comme jours fermés (PriceRepository.add_closed_days) une fois constatés.
+    """
+    if date_from > date_to:
+        raise ValueError("date_from must be <= date_to")
+    n = (date_to - date_from).days + 1
+    days = (date_from + dt.timedelta(days=i) for i in range(n))
+    return [d for d in days if d.weekday() < 5]
+
+
+def missing_days(existing: Iterable[dt.date], date_from: dt.date, date_to: dt.date) -> list[dt.date]:
+    have = set(existing)
+    return [d for d in trading_days(date_from, date_to) if d not in have]
+
+
+def gap_ranges(missing: list[dt.date]) -> list[tuple[dt.date, dt.date]]:
+    """
+    Regroupe des jours ouvrés manquants (triés) en plages [début, fin] ;
+    un week-end entre deux jours manquants ne coupe pas la plage.
+    """
+    ranges: list[tuple[dt.date, dt.date]] = []
+    for d in missing:
+        if ranges and d == _next_trading_day(ranges[-1][1]):
+            ranges[-1] = (ranges[-1][0], d)
+        else:
+            ranges.append((d, d))
+    return ranges
+
+
+def _next_trading_day(d: dt.date) -> dt.date:
+    d += dt.timedelta(days=1)
+    while d.weekday() >= 5:
+        d += dt.timedelta(days=1)
+    return d
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+from app.settings import get_engine_settings
+
+
+TimeseriesEngine = str  # "decimal"|"numpy"
+
+
+def numpy_available() -> bool:
+    return find_spec("numpy") is not None
+
+
+def resolve_timeseries_engine(n_transactions: int, engine: str | None = None) -> TimeseriesEngine:
+    """
+    Choix du moteur de timeseries :
+    - `engine` explicite ("decimal"|"numpy"|"auto") sinon DASHMONEY_TIMESERIES_ENGINE
+    - "auto" => numpy si installé et n_transactions >= DASHMONEY_NUMPY_MIN_TRANSACTIONS
+    """
+    settings = get_engine_settings()
+    choice = (engine or settings.timeseries_engine).lower()
+
+    if choice == "decimal":
+        return "decimal"
+
+    if choice == "numpy":
+        if not numpy_available():
+            raise RuntimeError("numpy timeseries engine requested but numpy is not installed")
+        return "numpy"
+
+    if choice == "auto":
+        if n_transactions >= settings.numpy_min_transactions and numpy_available():
+            return "numpy"
+        return "decimal"
+
+    raise ValueError(f"unknown timeseries engine '{choice}'")
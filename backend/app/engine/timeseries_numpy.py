@@ -0,0 +1,256 @@
+"""
+Moteur de timeseries vectorisé (numpy), résultats identiques au moteur Decimal.
+
+Les montants sont convertis en centimes int64 (SignedMoney est déjà quantifié à 2 décimales),
+donc les sommes sont exactes. Le formatage Decimal est reproduit à l'identique :
+- income / expense : "0" si aucune tx du kind dans le bucket, sinon 2 décimales
+- net : "0" si ni income ni expense dans le bucket, sinon 2 décimales
+- balance_start / balance_end : toujours 2 décimales
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.domain.account import Account, AccountType
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import KINDS, TransactionFrame, to_cents
+from app.engine.account_timeseries import Granularity, iter_buckets, timeseries_point
+
+
+KIND_INCOME = 0
+KIND_EXPENSE = 1
+KIND_OTHER = 2
+
+_KIND_CODES = {TransactionKind.INCOME: KIND_INCOME, TransactionKind.EXPENSE: KIND_EXPENSE}
+
+
+@dataclass(frozen=True)
+class TransactionArrays:
+    """
+    Transactions en colonnes :
+    - cents: montant signé en centimes (int64)
+    - ordinals: date.toordinal() (int64)
+    - kinds: KIND_INCOME | KIND_EXPENSE | KIND_OTHER (int8)
+    - accounts: index dans account_ids (int32)
+    """
+    cents: np.ndarray
+    ordinals: np.ndarray
+    kinds: np.ndarray
+    accounts: np.ndarray
+    account_ids: list[str]
+
+    @classmethod
+    def from_frame(cls, frame: TransactionFrame) -> "TransactionArrays":
+        # colonnes déjà en array : copie directe du buffer, pas de boucle Python par tx
+        kind_map = np.array([_KIND_CODES.get(k, KIND_OTHER) for k in KINDS], dtype=np.int8)
+        return cls(
+            cents=np.frombuffer(frame.cents, dtype=np.int64).copy(),
+            ordinals=np.frombuffer(frame.ordinals, dtype=np.int64).copy(),
+            kinds=kind_map[np.frombuffer(frame.kind_codes, dtype=np.uint8)],
+            accounts=np.frombuffer(frame.account_codes, dtype=np.uint32).astype(np.int32),
+            account_ids=list(frame.account_ids),
+        )
+
+    @classmethod
+    def from_transactions(cls, transactions: list[Transaction] | TransactionFrame) -> "TransactionArrays":
+        if isinstance(transactions, TransactionFrame):
+            return cls.from_frame(transactions)
+
+        n = len(transactions)
+        codes: dict[str, int] = {}
+
+        cents = np.fromiter((to_cents(t.amount.amount) for t in transactions), dtype=np.int64, count=n)
+        ordinals = np.fromiter((t.date.toordinal() for t in transactions), dtype=np.int64, count=n)
+        kinds = np.fromiter((_KIND_CODES.get(t.kind, KIND_OTHER) for t in transactions), dtype=np.int8, count=n)
+        accounts = np.fromiter(
+            (codes.setdefault(t.account_id, len(codes)) for t in transactions), dtype=np.int32, count=n
+        )
+
+        return cls(cents=cents, ordinals=ordinals, kinds=kinds, accounts=accounts, account_ids=list(codes))
+
+
+def _grouped_sum(keys: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """
+    out[k] = somme des values de clé k (int64 exact, via tri + np.add.reduceat).
+    """
+    out = np.zeros(size, dtype=np.int64)
+    if keys.size == 0:
+        return out
+
+    order = np.argsort(keys, kind="stable")
+    k = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], k[1:] != k[:-1])))
+    out[k[starts]] = np.add.reduceat(values[order], starts)
+    return out
+
+
+@dataclass(frozen=True)
+class _AccountMatrix:
+    """
+    Une ligne par compte (code de TransactionArrays), une colonne par bucket.
+    """
+    labels: list[str]
+    income: np.ndarray
+    expense: np.ndarray
+    n_income: np.ndarray
+    n_expense: np.ndarray
+    signed: np.ndarray
+    before: np.ndarray  # somme des tx avant date_from, par compte
+
+
+def _account_matrix(
+    arrays: TransactionArrays,
+    *,
+    date_from: dt.date,
+    date_to: dt.date,
+    granularity: Granularity,
+) -> _AccountMatrix:
+    buckets = list(iter_buckets(granularity, date_from, date_to))
+    labels = [b[0] for b in buckets]
+    starts = np.array([b[1].toordinal() for b in buckets], dtype=np.int64)
+
+    n_accounts = len(arrays.account_ids)
+    n_buckets = len(buckets)
+    size = n_accounts * n_buckets
+
+    lo, hi = date_from.toordinal(), date_to.toordinal()
+    in_range = (arrays.ordinals >= lo) & (arrays.ordinals <= hi)
+    before = arrays.ordinals < lo
+
+    bucket_idx = np.searchsorted(starts, arrays.ordinals[in_range], side="right") - 1
+    keys = arrays.accounts[in_range].astype(np.int64) * n_buckets + bucket_idx
+
+    cents = arrays.cents[in_range]
+    kinds = arrays.kinds[in_range]
+    is_income = kinds == KIND_INCOME
+    is_expense = kinds == KIND_EXPENSE
+    magnitude = np.abs(cents)
+
+    shape = (n_accounts, n_buckets)
+    return _AccountMatrix(
+        labels=labels,
+        income=_grouped_sum(keys[is_income], magnitude[is_income], size).reshape(shape),
+        expense=_grouped_sum(keys[is_expense], magnitude[is_expense], size).reshape(shape),
+        n_income=np.bincount(keys[is_income], minlength=size).reshape(shape),
+        n_expense=np.bincount(keys[is_expense], minlength=size).reshape(shape),
+        signed=_grouped_sum(keys, cents, size).reshape(shape),
+        before=_grouped_sum(arrays.accounts[before].astype(np.int64), arrays.cents[before], n_accounts),
+    )
+
+
+def _points(
+    m: _AccountMatrix,
+    *,
+    rows: list[int],
+    openings: list[int],
+) -> list[dict]:
+    """
+    Agrège les lignes `rows` (-1 = compte sans tx) et produit les points au format Decimal.
+    """
+    n_buckets = len(m.labels)
+    income = np.zeros(n_buckets, dtype=np.int64)
+    expense = np.zeros(n_buckets, dtype=np.int64)
+    n_income = np.zeros(n_buckets, dtype=np.int64)
+    n_expense = np.zeros(n_buckets, dtype=np.int64)
+    balance_end = np.zeros(n_buckets, dtype=np.int64)
+    balance_start = np.zeros(n_buckets, dtype=np.int64)
+
+    for row, opening in zip(rows, openings):
+        if row < 0:
+            balance_end += opening
+            balance_start += opening
+            continue
+
+        signed = m.signed[row]
+        end = opening + int(m.before[row]) + np.cumsum(signed)
+        balance_end += end
+        balance_start += end - signed
+        income += m.income[row]
+        expense += m.expense[row]
+        n_income += m.n_income[row]
+        n_expense += m.n_expense[row]
+
+    return [
+        timeseries_point(
+            bucket,
+            income=int(income[i]),
+            expense=int(expense[i]),
+            n_income=int(n_income[i]),
+            n_expense=int(n_expense[i]),
+            balance_start=int(balance_start[i]),
+            balance_end=int(balance_end[i]),
+        )
+        for i, bucket in enumerate(m.labels)
+    ]
+
+
+def compute_timeseries_np(
+    *,
+    opening_balance: SignedMoney,
+    transactions: list[Transaction] | TransactionFrame,
+    date_from: dt.date,
+    date_to: dt.date,
+    granularity: Granularity,
+) -> list[dict]:
+    """
+    Même contrat que account_timeseries.compute_timeseries (toutes les tx sont celles du compte).
+    """
+    if date_from > date_to:
+        raise ValueError("date_from must be <= date_to")
+
+    arrays = TransactionArrays.from_transactions(transactions)
+    # un seul "compte" : toutes les tx
+    arrays = TransactionArrays(
+        cents=arrays.cents,
+        ordinals=arrays.ordinals,
+        kinds=arrays.kinds,
+        accounts=np.zeros(arrays.cents.size, dtype=np.int32),
+        account_ids=["_"],
+    )
+    m = _account_matrix(arrays, date_from=date_from, date_to=date_to, granularity=granularity)
+    return _points(m, rows=[0], openings=[to_cents(opening_balance.amount)])
+
+
+def sweep_timeseries_np(
+    *,
+    accounts: list[Account],
+    transactions: list[Transaction] | TransactionFrame,
+    date_from: dt.date,
+    date_to: dt.date,
+    granularity: Granularity,
+    with_groups: bool,
+) -> tuple[list[dict], dict[str, list[dict]]]:
+    """
+    Équivalent vectorisé de net_worth._sweep_timeseries : (total, {AccountType -> points}).
+    Les tx de comptes hors `accounts` sont ignorées.
+    """
+    if date_from > date_to:
+        raise ValueError("date_from must be <= date_to")
+
+    arrays = TransactionArrays.from_transactions(transactions)
+    m = _account_matrix(arrays, date_from=date_from, date_to=date_to, granularity=granularity)
+    codes = {aid: i for i, aid in enumerate(arrays.account_ids)}
+
+    def aggregate(group_accounts: list[Account]) -> list[dict]:
+        if not group_accounts:
+            return []
+        return _points(
+            m,
+            rows=[codes.get(a.id, -1) for a in group_accounts],
+            openings=[to_cents(a.opening_balance.amount) for a in group_accounts],
+        )
+
+    total = aggregate(accounts)
+    groups: dict[str, list[dict]] = {}
+    if with_groups:
+        for t in AccountType:
+            group_accounts = [a for a in accounts if a.account_type == t]
+            if group_accounts:
+                groups[t.value] = aggregate(group_accounts)
+
+    return total, groups
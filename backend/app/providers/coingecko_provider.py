@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 import datetime as dt
 from decimal import Decimal
+from typing import Mapping
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
@@ -29,45 +31,73 @@ _COINGECKO_IDS: dict[str, str] = {
 
 class CoinGeckoPriceProvider:
     BASE = "https://api.coingecko.com/api/v3/simple/price"
+    # /simple/price accepte des listes d'ids ; on découpe pour garder des URLs raisonnables
+    MAX_IDS_PER_REQUEST = 100
 
-    def __init__(self, *, timeout_sec: int = 15, retries: int = 3, backoff_sec: float = 1.0) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_sec: int = 15,
+        retries: int = 3,
+        backoff_sec: float = 1.0,
+        base_url: str | None = None,
+    ) -> None:
         self._timeout = timeout_sec
         self._retries = retries
         self._backoff = backoff_sec
+        self._base = base_url or os.getenv("DASHMONEY_COINGECKO_BASE_URL") or self.BASE
 
     def fetch(self, *, symbol: str, day_utc: dt.date, vs: Currency) -> PricePoint | None:
         sym = symbol.strip().upper()
-        cg_id = _COINGECKO_IDS.get(sym)
-        if cg_id is None:
-            return None
+        return self.fetch_many(symbols={sym: vs}, day_utc=day_utc).get(sym)
 
-        vs_cur = vs.value.lower()
-        params = urlencode({"ids": cg_id, "vs_currencies": vs_cur})
-        url = f"{self.BASE}?{params}"
+    def fetch_many(self, *, symbols: Mapping[str, Currency], day_utc: dt.date) -> dict[str, PricePoint]:
+        """
+        Prix de plusieurs cryptos (symbole -> devise) en une requête par paquet de MAX_IDS_PER_REQUEST :
+        ids et vs_currencies séparés par des virgules. Symboles inconnus / sans prix : absents du résultat.
+        """
+        wanted: dict[str, tuple[str, str, Currency]] = {}  # symbole -> (cg_id, vs, devise)
+        for symbol, vs in symbols.items():
+            sym = symbol.strip().upper()
+            cg_id = _COINGECKO_IDS.get(sym)
+            if cg_id is not None:
+                wanted[sym] = (cg_id, vs.value.lower(), vs)
 
-        last_err: Exception | None = None
-        for attempt in range(1, self._retries + 1):
-            try:
-                req = Request(url, headers={"Accept": "application/json", "User-Agent": "dashmoney/0.1"})
-                with urlopen(req, timeout=self._timeout) as resp:
-                    payload = json.loads(resp.read().decode("utf-8"))
-
-                if cg_id not in payload or vs_cur not in payload[cg_id]:
-                    return None
-
-                price = Decimal(str(payload[cg_id][vs_cur]))
-                captured_at = dt.datetime.now(dt.timezone.utc)
+        out: dict[str, PricePoint] = {}
+        items = list(wanted.items())
+        for i in range(0, len(items), self.MAX_IDS_PER_REQUEST):
+            chunk = items[i:i + self.MAX_IDS_PER_REQUEST]
+            ids = sorted({cg_id for _, (cg_id, _, _) in chunk})
+            vs_currencies = sorted({vs_cur for _, (_, vs_cur, _) in chunk})
+            payload = self._get_json({"ids": ",".join(ids), "vs_currencies": ",".join(vs_currencies)})
+            if payload is None:
+                continue
 
-                return PricePoint(
+            captured_at = dt.datetime.now(dt.timezone.utc)
+            for sym, (cg_id, vs_cur, vs) in chunk:
+                value = (payload.get(cg_id) or {}).get(vs_cur)
+                if value is None:
+                    continue
+                out[sym] = PricePoint(
                     symbol=sym,
                     day=day_utc,
-                    price=price,
+                    price=Decimal(str(value)),
                     currency=vs,
                     source="coingecko",
                     captured_at=captured_at,
                 )
-            except Exception as e:
-                last_err = e
+        return out
+
+    def _get_json(self, params: dict[str, str]) -> dict | None:
+        url = f"{self._base}?{urlencode(params)}"
+
+        for attempt in range(1, self._retries + 1):
+            try:
+                req = Request(url, headers={"Accept": "application/json", "User-Agent": "dashmoney/0.1"})
+                with urlopen(req, timeout=self._timeout) as resp:
+                    payload = json.loads(resp.read().decode("utf-8"))
+                return payload if isinstance(payload, dict) else None
+            except Exception:
                 time.sleep(self._backoff * attempt)
 
         return None
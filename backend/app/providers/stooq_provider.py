@@ -2,32 +2,159 @@ from __future__ import annotations
 
 import csv
 import io
+from itertools import chain
 import time
 import datetime as dt
 from decimal import Decimal
+from typing import Iterator
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from app.domain.money import Currency
 from app.domain.price_point import PricePoint
+from app.providers.stooq_symbol_cache import StooqSymbolCache
+
+
+class StooqUnavailable(Exception):
+    """Stooq injoignable / réponse illisible après tous les retries (≠ pas de données)."""
 
 
 class StooqEodPriceProvider:
-    def __init__(self, *, timeout_sec: int = 15, retries: int = 3, backoff_sec: float = 1.0) -> None:
+    BASE = "https://stooq.com"
+
+    def __init__(
+        self,
+        *,
+        timeout_sec: int = 15,
+        retries: int = 3,
+        backoff_sec: float = 1.0,
+        symbol_cache: StooqSymbolCache | None = None,
+        base_url: str | None = None,
+    ) -> None:
         self._timeout = timeout_sec
         self._retries = retries
         self._backoff = backoff_sec
+        self._cache = symbol_cache
+        self._base = (base_url or self.BASE).rstrip("/")
 
     def fetch(self, *, symbol: str, day_utc: dt.date, currency: Currency) -> PricePoint | None:
+        """
+        Avec cache : symbole déjà résolu => une seule requête ; échec connu (TTL) => aucune.
+        """
         sym = symbol.strip().upper()
+        cache = self._cache
+
+        if cache is not None:
+            known = cache.resolved(sym)
+            if known is not None:
+                try:
+                    pp = self._fetch_one(symbol=sym, stooq_symbol=known, day_utc=day_utc, currency=currency)
+                except StooqUnavailable:
+                    return None
+                if pp is not None:
+                    return pp
+                # le suffixe ne répond plus : nouvelle résolution complète
+                cache.forget(sym)
+            elif cache.is_known_miss(sym):
+                return None
+
+        unavailable = False
         for stooq_sym in _candidate_stooq_symbols(sym):
-            pp = self._fetch_one(symbol=sym, stooq_symbol=stooq_sym, day_utc=day_utc, currency=currency)
+            try:
+                pp = self._fetch_one(symbol=sym, stooq_symbol=stooq_sym, day_utc=day_utc, currency=currency)
+            except StooqUnavailable:
+                unavailable = True
+                continue
             if pp is not None:
+                if cache is not None:
+                    cache.remember(sym, stooq_sym)
                 return pp
+
+        # on ne mémorise l'échec que si Stooq a bien répondu "pas de données" partout
+        if cache is not None and not unavailable:
+            cache.remember_miss(sym)
         return None
 
+    def iter_history(
+        self,
+        *,
+        symbol: str,
+        date_from: dt.date,
+        date_to: dt.date,
+        currency: Currency,
+    ) -> Iterator[PricePoint]:
+        """
+        Historique journalier (clôtures) via l'export CSV q/d/l, lu en streaming.
+        Résolution du suffixe comme fetch() (cache d'abord) ; un symbole sans données
+        sur la période ne produit rien (pas de cache négatif : la période peut précéder la cotation).
+        """
+        if date_from > date_to:
+            raise ValueError("date_from must be <= date_to")
+
+        sym = symbol.strip().upper()
+        known = self._cache.resolved(sym) if self._cache is not None else None
+        candidates = [known] if known is not None else _candidate_stooq_symbols(sym)
+
+        for stooq_sym in candidates:
+            rows = self._history_rows(stooq_symbol=stooq_sym, date_from=date_from, date_to=date_to)
+            first = next(rows, None)
+            if first is None:
+                continue
+            if self._cache is not None and known is None:
+                self._cache.remember(sym, stooq_sym)
+
+            captured_at = dt.datetime.now(dt.timezone.utc)
+            for day, close in chain((first,), rows):
+                yield PricePoint(
+                    symbol=sym,
+                    day=day,
+                    price=close,
+                    currency=currency,
+                    source="stooq",
+                    captured_at=captured_at,
+                )
+            return
+
+    def _history_rows(
+        self, *, stooq_symbol: str, date_from: dt.date, date_to: dt.date
+    ) -> Iterator[tuple[dt.date, Decimal]]:
+        query = urlencode(
+            {
+                "s": stooq_symbol.lower(),
+                "d1": date_from.strftime("%Y%m%d"),
+                "d2": date_to.strftime("%Y%m%d"),
+                "i": "d",
+            }
+        )
+        url = f"{self._base}/q/d/l/?{query}"
+
+        last_err: Exception | None = None
+        for attempt in range(1, self._retries + 1):
+            try:
+                resp = urlopen(Request(url, headers={"User-Agent": "dashmoney/0.1"}), timeout=self._timeout)
+                break
+            except Exception as e:
+                last_err = e
+                time.sleep(self._backoff * attempt)
+        else:
+            raise StooqUnavailable(f"{stooq_symbol}: {last_err}")
+
+        with resp:
+            # "Date,Open,High,Low,Close,Volume" ; symbole inconnu => "No data"
+            reader = csv.DictReader(io.TextIOWrapper(resp, encoding="utf-8", errors="replace", newline=""))
+            for row in reader:
+                try:
+                    day = dt.date.fromisoformat((row.get("Date") or "").strip())
+                    close = Decimal((row.get("Close") or "").strip())
+                except (ValueError, ArithmeticError):
+                    continue
+                if date_from <= day <= date_to:
+                    yield day, close
+
     def _fetch_one(self, *, symbol: str, stooq_symbol: str, day_utc: dt.date, currency: Currency) -> PricePoint | None:
-        url = f"https://stooq.com/q/l/?s={stooq_symbol.lower()}&i=d"
+        url = f"{self._base}/q/l/?s={stooq_symbol.lower()}&i=d"
 
+        last_err: Exception | None = None
         for attempt in range(1, self._retries + 1):
             try:
                 req = Request(url, headers={"User-Agent": "dashmoney/0.1"})
@@ -44,7 +171,7 @@ class StooqEodPriceProvider:
                 if close_str is None:
                     return None
                 close_str = close_str.strip()
-                if not close_str or close_str in ("N/A", "-"):
+                if not close_str or close_str in ("N/A", "N/D", "-"):
                     return None
 
                 price = Decimal(close_str)
@@ -57,10 +184,11 @@ class StooqEodPriceProvider:
                     source="stooq",
                     captured_at=captured_at,
                 )
-            except Exception:
+            except Exception as e:
+                last_err = e
                 time.sleep(self._backoff * attempt)
 
-        return None
+        raise StooqUnavailable(f"{stooq_symbol}: {last_err}")
 
 
 def _candidate_stooq_symbols(symbol: str) -> list[str]:
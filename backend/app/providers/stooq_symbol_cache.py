@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_NEGATIVE_TTL = dt.timedelta(days=7)
+
+
+class StooqSymbolCache:
+    """
+    Cache persistant (JSON) de la résolution symbole -> symbole Stooq (suffixe .US, .PA, ...).
+    - positif : le symbole Stooq qui a fonctionné, réutilisé tel quel ;
+    - négatif : aucun candidat n'a de données, mémorisé `negative_ttl` puis réessayé.
+    Thread-safe (fetchs concurrents) ; fichier réécrit atomiquement à chaque changement.
+    """
+
+    def __init__(self, path: Path, *, negative_ttl: dt.timedelta = DEFAULT_NEGATIVE_TTL) -> None:
+        self._path = path
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None
+
+    def resolved(self, symbol: str) -> str | None:
+        with self._lock:
+            entry = self._load().get(symbol)
+        return None if entry is None else entry.get("stooq_symbol")
+
+    def is_known_miss(self, symbol: str, *, now: dt.datetime | None = None) -> bool:
+        with self._lock:
+            entry = self._load().get(symbol)
+        if entry is None or "miss_at" not in entry:
+            return False
+        now = now or dt.datetime.now(dt.timezone.utc)
+        return now - dt.datetime.fromisoformat(entry["miss_at"]) < self._negative_ttl
+
+    def remember(self, symbol: str, stooq_symbol: str) -> None:
+        self._set(symbol, {"stooq_symbol": stooq_symbol, "resolved_at": _now_iso()})
+
+    def remember_miss(self, symbol: str) -> None:
+        self._set(symbol, {"miss_at": _now_iso()})
+
+    def forget(self, symbol: str) -> None:
+        with self._lock:
+            if self._load().pop(symbol, None) is not None:
+                self._save()
+
+    def _set(self, symbol: str, entry: dict) -> None:
+        with self._lock:
+            entries = self._load()
+            current = entries.get(symbol) or {}
+            if "stooq_symbol" in entry and current.get("stooq_symbol") == entry["stooq_symbol"]:
+                return  # déjà connu : pas de réécriture
+            entries[symbol] = entry
+            self._save()
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+                self._entries = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError):
+                log.warning("unreadable Stooq symbol cache %s, starting empty", self._path)
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        assert self._entries is not None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(tmp, self._path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            log.warning("cannot write Stooq symbol cache %s", self._path, exc_info=True)
+
+
+def _now_iso() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat()
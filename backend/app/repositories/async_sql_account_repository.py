@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from app.db_async import new_async_session
+from app.domain.account import Account
+from app.repositories.sql_account_repository import AccountRow, SqlAccountRepository
+
+
+class AsyncSqlAccountRepository:
+    """
+    Lectures de comptes en asyncio (routes async) ; mêmes requêtes que SqlAccountRepository.
+    """
+
+    async def list_accounts(self) -> list[Account]:
+        async with new_async_session() as s:
+            rows = (await s.execute(SqlAccountRepository._list_stmt())).scalars().all()
+            return [SqlAccountRepository._to_domain(r) for r in rows]
+
+    async def get_account(self, account_id: str) -> Account:
+        target = SqlAccountRepository._clean_id(account_id)
+        async with new_async_session() as s:
+            return SqlAccountRepository._found(await s.get(AccountRow, target), target)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Sequence
+
+from app.db_async import get_async_engine, new_async_session
+from app.domain.price_point import PricePoint
+from app.repositories.price_repository import AsOfPrices
+from app.repositories.sql_price_repository import SqlPriceRepository
+
+
+class AsyncSqlPriceRepository:
+    """
+    Lectures de prix en asyncio (routes async) ; mêmes requêtes que SqlPriceRepository.
+    """
+
+    async def list(self, *, symbol: str | None = None) -> list[PricePoint]:
+        async with new_async_session() as s:
+            rows = (await s.execute(SqlPriceRepository._list_stmt(symbol))).scalars().all()
+        return [SqlPriceRepository._to_domain(r) for r in rows]
+
+    async def list_between(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> list[PricePoint]:
+        stmt = SqlPriceRepository._between_stmt(symbol, date_from, date_to)
+        async with new_async_session() as s:
+            rows = (await s.execute(stmt)).scalars().all()
+        return [SqlPriceRepository._to_domain(r) for r in rows]
+
+    async def latest(self, *, symbol: str) -> PricePoint | None:
+        async with new_async_session() as s:
+            row = (await s.execute(SqlPriceRepository._latest_stmt(symbol))).scalars().first()
+        return None if row is None else SqlPriceRepository._to_domain(row)
+
+    async def prices_as_of(self, *, symbols: Sequence[str], days: Sequence[dt.date]) -> AsOfPrices:
+        syms = sorted({s.strip().upper() for s in symbols})
+        wanted = sorted(set(days))
+        if not syms or not wanted:
+            return {}
+
+        dialect = get_async_engine().dialect.name
+        async with new_async_session() as s:
+            result = await s.execute(SqlPriceRepository._as_of_stmt(dialect, syms, wanted))
+            return SqlPriceRepository._as_of_from_rows(dialect, result, wanted)
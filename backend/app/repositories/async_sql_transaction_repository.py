@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.db_async import new_async_session
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction
+from app.domain.transaction_frame import TransactionFrame
+from app.engine.account_balance import AccountBalance
+from app.engine.running_balance import TransactionWithBalance
+from app.repositories.sql_transaction_repository import SqlTransactionRepository
+
+
+class AsyncSqlTransactionRepository:
+    """
+    Lectures "chaudes" (listes, frames, soldes) en asyncio pour les routes async :
+    mêmes requêtes et conversions que SqlTransactionRepository, sans thread bloqué pendant l'I/O.
+    Les conversions O(n) (lignes -> domaine / frame) passent par le threadpool : un compte
+    volumineux ne bloque pas la boucle d'événements.
+    """
+
+    async def list(self, account_id: str | None = None) -> list[Transaction]:
+        async with new_async_session() as s:
+            rows = (await s.execute(SqlTransactionRepository._list_stmt(account_id))).scalars().all()
+        return await run_in_threadpool(SqlTransactionRepository._sorted_domain, rows)
+
+    async def list_frame(self, account_ids: Iterable[str] | None = None) -> TransactionFrame:
+        stmt = SqlTransactionRepository._frame_stmt(account_ids)
+        if stmt is None:
+            return TransactionFrame.empty()
+        async with new_async_session() as s:
+            rows = (await s.execute(stmt)).all()
+        return await run_in_threadpool(SqlTransactionRepository._frame_from_rows, rows)
+
+    async def balances_at(
+        self,
+        *,
+        at: dt.date | None,
+        account_ids: Iterable[str] | None = None,
+    ) -> list[AccountBalance]:
+        stmt = SqlTransactionRepository._balances_stmt(at=at, account_ids=account_ids)
+        if stmt is None:
+            return []
+        async with new_async_session() as s:
+            rows = (await s.execute(stmt)).all()
+        return SqlTransactionRepository._balances_from_rows(rows)
+
+    async def list_with_running_balance(
+        self,
+        *,
+        account_id: str,
+        opening_balance: SignedMoney,
+        limit: int = 100,
+        offset: int = 0,
+        descending: bool = False,
+    ) -> tuple[list[TransactionWithBalance], int]:
+        count_stmt, page_stmt = SqlTransactionRepository._running_balance_stmts(
+            account_id=account_id, limit=limit, offset=offset, descending=descending
+        )
+        async with new_async_session() as s:
+            total = (await s.execute(count_stmt)).scalar_one()
+            rows = (await s.execute(page_stmt)).all()
+            page = SqlTransactionRepository._running_balance_page(rows, opening_balance)
+        return page, int(total)
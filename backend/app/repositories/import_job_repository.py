@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Protocol, Sequence
+from uuid import UUID
+
+from app.domain.import_job import ImportJob, ImportJobError, ImportJobStatus
+
+
+class ImportJobRepository(Protocol):
+    def add(self, job: ImportJob) -> None: ...
+    def get(self, job_id: UUID) -> ImportJob: ...
+    def mark_running(self, job_id: UUID) -> None: ...
+    def record_progress(
+        self,
+        job_id: UUID,
+        *,
+        rows_parsed: int,
+        imported: int,
+        duplicates_skipped: int,
+        errors_count: int,
+        new_errors: Sequence[tuple[int, str]] = (),
+    ) -> None: ...
+    def finish(self, job_id: UUID, *, status: ImportJobStatus, message: str | None = None) -> None: ...
+    def list_errors(self, job_id: UUID, *, limit: int, offset: int) -> tuple[list[ImportJobError], int]: ...
+    def fail_unfinished(self, *, message: str) -> int: ...
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import datetime as dt
+from typing import Iterable, Sequence
 from uuid import UUID
 
 from app.domain.transaction import Transaction
+from app.domain.transaction_fingerprint import transaction_fingerprint
+from app.domain.transaction_frame import TransactionFrame
+from app.engine.budget import BudgetTotals, budget_totals
 
 
 @dataclass
@@ -22,6 +26,23 @@ class InMemoryTransactionRepository:
             raise ValueError(f"Transaction with id {tx.id} already exists")
         self._items.append(tx)
 
+    def add_many(self, txs: Sequence[Transaction]) -> list[Transaction]:
+        out: list[Transaction] = []
+        for t in txs:
+            stored = replace(t, sequence=self.next_sequence(t.account_id, t.date))
+            self.add(stored)
+            out.append(stored)
+        return out
+
+    def fingerprint_counts(self, fingerprints: Iterable[str]) -> dict[str, int]:
+        wanted = set(fingerprints)
+        counts: dict[str, int] = {}
+        for t in self._items:
+            fp = transaction_fingerprint(t)
+            if fp in wanted:
+                counts[fp] = counts.get(fp, 0) + 1
+        return counts
+
     def list(self, account_id: str | None = None) -> list[Transaction]:
         items = self._items
         if account_id is not None:
@@ -33,6 +54,22 @@ class InMemoryTransactionRepository:
             key=lambda t: (t.date, t.sequence, t.created_at, str(t.id)),
         )
 
+    def list_frame(self, account_ids: Iterable[str] | None = None) -> TransactionFrame:
+        items = self.list()
+        if account_ids is not None:
+            wanted = set(account_ids)
+            items = [t for t in items if t.account_id in wanted]
+        return TransactionFrame.from_transactions(items)
+
+    def budget_totals(
+        self,
+        *,
+        account_id: str,
+        date_from: dt.date | None = None,
+        date_to: dt.date | None = None,
+    ) -> BudgetTotals:
+        return budget_totals(self.list(account_id=account_id), date_from=date_from, date_to=date_to)
+
     def get(self, tx_id: UUID) -> Transaction | None:
         for t in self._items:
             if t.id == tx_id:
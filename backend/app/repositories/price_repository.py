@@ -2,14 +2,48 @@ from __future__ import annotations
 
 import datetime as dt
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from typing import Iterable, Sequence
 
 from app.domain.price_point import PricePoint
 
 
+# (symbol, jour demandé) -> dernier prix au plus tard ce jour-là
+AsOfPrices = dict[tuple[str, dt.date], PricePoint]
+
+
+def pick_as_of(points: Iterable[PricePoint], days: Sequence[dt.date]) -> AsOfPrices:
+    """
+    Résolution "as-of" en mémoire : pour chaque symbole et chaque jour, le prix du jour
+    le plus récent <= jour (à jour égal, la dernière capture, comme latest()).
+    """
+    by_symbol: dict[str, list[PricePoint]] = {}
+    for p in points:
+        by_symbol.setdefault(p.symbol, []).append(p)
+
+    out: AsOfPrices = {}
+    for sym, pts in by_symbol.items():
+        pts.sort(key=lambda p: (p.day, p.captured_at))
+        pt_days = [p.day for p in pts]
+        for day in days:
+            i = bisect_right(pt_days, day)
+            if i:
+                out[(sym, day)] = pts[i - 1]
+    return out
+
+
 class PriceRepository(ABC):
     @abstractmethod
     def add(self, price: PricePoint) -> None: ...
 
+    def add_many(self, prices: Sequence[PricePoint]) -> int:
+        """
+        Écriture en lot ; par défaut une par une (les repos SQL surchargent).
+        """
+        for p in prices:
+            self.add(p)
+        return len(prices)
+
     @abstractmethod
     def list(self, *, symbol: str | None = None) -> list[PricePoint]: ...
 
@@ -18,3 +52,34 @@ class PriceRepository(ABC):
 
     @abstractmethod
     def latest(self, *, symbol: str) -> PricePoint | None: ...
+
+    def price_days(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> set[dt.date]:
+        """
+        Jours ayant au moins un prix (toutes sources) : détection des trous avant backfill.
+        """
+        return {p.day for p in self.list_between(symbol=symbol, date_from=date_from, date_to=date_to)}
+
+    def closed_days(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> set[dt.date]:
+        """
+        Jours ouvrés connus sans cotation (fériés...) : pas des trous à combler.
+        Par défaut aucun (rien n'est mémorisé).
+        """
+        return set()
+
+    def add_closed_days(self, *, symbol: str, days: Iterable[dt.date]) -> int:
+        """
+        Mémorise des jours sans cotation ; par défaut ignoré (les repos SQL surchargent).
+        """
+        return 0
+
+    def prices_as_of(self, *, symbols: Sequence[str], days: Sequence[dt.date]) -> AsOfPrices:
+        """
+        Prix de chaque symbole à chaque jour (dernier prix <= jour), symboles × jours.
+        Les couples sans prix antérieur sont absents du résultat.
+        """
+        syms = sorted({s.strip().upper() for s in symbols})
+        if not syms or not days:
+            return {}
+        last = max(days)
+        points = [p for sym in syms for p in self.list(symbol=sym) if p.day <= last]
+        return pick_as_of(points, days)
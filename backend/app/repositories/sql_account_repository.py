@@ -3,10 +3,10 @@ from __future__ import annotations
 import datetime as dt
 from decimal import Decimal
 
-from sqlalchemy import Date, Numeric, String, select, ForeignKey
+from sqlalchemy import Date, Numeric, Select, String, select, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.account import Account, AccountType
 from app.domain.money import Currency
@@ -44,35 +44,43 @@ class SqlAccountRepository(AccountRepository):
     - update(): parity method (exists in JsonAccountRepository)
     """
 
-    def __init__(self) -> None:
-        init_db()
-
     def list_accounts(self) -> list[Account]:
-        with new_session() as s:
-            rows = s.execute(
-                select(AccountRow)
-                .where(AccountRow.profile_id == DEFAULT_PROFILE_ID)
-                .order_by(AccountRow.id.asc())
-            ).scalars().all()
-
+        with session_scope() as s:
+            rows = s.execute(self._list_stmt()).scalars().all()
             return [self._to_domain(r) for r in rows]
 
     def get_account(self, account_id: str) -> Account:
+        target = self._clean_id(account_id)
+        with session_scope() as s:
+            return self._found(s.get(AccountRow, target), target)
+
+    # partagés avec AsyncSqlAccountRepository
+
+    @staticmethod
+    def _list_stmt() -> Select:
+        return (
+            select(AccountRow)
+            .where(AccountRow.profile_id == DEFAULT_PROFILE_ID)
+            .order_by(AccountRow.id.asc())
+        )
+
+    @staticmethod
+    def _clean_id(account_id: str) -> str:
         if not isinstance(account_id, str) or not account_id.strip():
             raise ValueError("account_id cannot be empty")
-        target = account_id.strip()
+        return account_id.strip()
 
-        with new_session() as s:
-            row = s.get(AccountRow, target)
-            if row is None or row.profile_id != DEFAULT_PROFILE_ID:
-                raise KeyError(f"unknown account_id '{target}'")
-            return self._to_domain(row)
+    @classmethod
+    def _found(cls, row: AccountRow | None, target: str) -> Account:
+        if row is None or row.profile_id != DEFAULT_PROFILE_ID:
+            raise KeyError(f"unknown account_id '{target}'")
+        return cls._to_domain(row)
 
     def add(self, account: Account) -> None:
         if not isinstance(account, Account):
             raise TypeError("account must be an Account")
 
-        with new_session() as s:
+        with session_scope() as s:
             existing = s.get(AccountRow, account.id)
             if existing is not None:
                 raise ValueError(f"account id '{account.id}' already exists")
@@ -87,19 +95,17 @@ class SqlAccountRepository(AccountRepository):
                 profile_id=DEFAULT_PROFILE_ID,
             )
             s.add(row)
-            s.commit()
 
     def delete(self, *, account_id: str) -> bool:
         if not isinstance(account_id, str) or not account_id.strip():
             return False
         target = account_id.strip()
 
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(AccountRow, target)
             if row is None:
                 return False
             s.delete(row)
-            s.commit()
             return True
 
     def update(
@@ -113,7 +119,7 @@ class SqlAccountRepository(AccountRepository):
             raise ValueError("account_id cannot be empty")
         target = account_id.strip()
 
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(AccountRow, target)
             if row is None:
                 raise KeyError(f"unknown account_id '{target}'")
@@ -127,7 +133,7 @@ class SqlAccountRepository(AccountRepository):
             if account_type is not None:
                 row.account_type = account_type.value
 
-            s.commit()
+            s.flush()
             s.refresh(row)
             return self._to_domain(row)
 
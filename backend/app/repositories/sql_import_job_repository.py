@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, func, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import new_session
+from app.db_base import Base
+from app.domain.import_job import ImportJob, ImportJobError, ImportJobStatus
+from app.identity.defaults import DEFAULT_PROFILE_ID
+from app.repositories.import_job_repository import ImportJobRepository
+from app.repositories.sql_identity_models import ProfileRow  # noqa: F401
+from app.repositories.sql_account_repository import AccountRow  # noqa: F401
+
+MESSAGE_MAX_LEN = 1024
+
+
+class ImportJobRow(Base):
+    __tablename__ = "import_jobs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    account_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    format: Mapped[str] = mapped_column(String(16), nullable=False)
+    filename: Mapped[str] = mapped_column(String(256), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), index=True, nullable=False)
+    skip_duplicates: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    rows_parsed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duplicates_skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    message: Mapped[str | None] = mapped_column(String(MESSAGE_MAX_LEN), nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    started_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    profile_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("profiles.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+
+
+class ImportJobErrorRow(Base):
+    __tablename__ = "import_job_errors"
+    __table_args__ = (
+        Index("ix_import_job_errors_job_line", "job_id", "line_no"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("import_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    line_no: Mapped[int] = mapped_column(Integer, nullable=False)
+    message: Mapped[str] = mapped_column(String(MESSAGE_MAX_LEN), nullable=False)
+
+
+def _now() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
+
+
+def _aware(value: dt.datetime | None) -> dt.datetime | None:
+    # timestamptz ; un backend sans tz (ex: SQLite) rend un datetime naïf => UTC
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=dt.timezone.utc)
+
+
+class SqlImportJobRepository(ImportJobRepository):
+    """
+    Jobs d'import : état + compteurs dans import_jobs, erreurs ligne à ligne dans import_job_errors.
+    Hors unité de travail (sessions dédiées, commit immédiat) : l'état doit être visible du worker
+    et du polling dès l'écriture, pas à la fin de la requête qui crée le job.
+    """
+
+    def add(self, job: ImportJob) -> None:
+        with new_session() as s:
+            s.add(
+                ImportJobRow(
+                    id=str(job.id),
+                    account_id=job.account_id,
+                    format=job.format,
+                    filename=job.filename[:256],
+                    status=job.status.value,
+                    skip_duplicates=job.skip_duplicates,
+                    rows_parsed=job.rows_parsed,
+                    imported=job.imported,
+                    duplicates_skipped=job.duplicates_skipped,
+                    errors_count=job.errors_count,
+                    message=job.message,
+                    created_at=job.created_at,
+                    started_at=job.started_at,
+                    finished_at=job.finished_at,
+                    profile_id=DEFAULT_PROFILE_ID,
+                )
+            )
+            s.commit()
+
+    def get(self, job_id: UUID) -> ImportJob:
+        with new_session() as s:
+            row = s.get(ImportJobRow, str(job_id))
+            if row is None or row.profile_id != DEFAULT_PROFILE_ID:
+                raise KeyError(f"unknown import job '{job_id}'")
+            return self._to_domain(row)
+
+    def mark_running(self, job_id: UUID) -> None:
+        self._update(job_id, status=ImportJobStatus.RUNNING.value, started_at=_now())
+
+    def record_progress(
+        self,
+        job_id: UUID,
+        *,
+        rows_parsed: int,
+        imported: int,
+        duplicates_skipped: int,
+        errors_count: int,
+        new_errors: Sequence[tuple[int, str]] = (),
+    ) -> None:
+        with new_session() as s:
+            s.execute(
+                update(ImportJobRow)
+                .where(ImportJobRow.id == str(job_id))
+                .values(
+                    rows_parsed=rows_parsed,
+                    imported=imported,
+                    duplicates_skipped=duplicates_skipped,
+                    errors_count=errors_count,
+                )
+            )
+            if new_errors:
+                s.add_all(
+                    ImportJobErrorRow(job_id=str(job_id), line_no=line_no, message=msg[:MESSAGE_MAX_LEN])
+                    for line_no, msg in new_errors
+                )
+            s.commit()
+
+    def finish(self, job_id: UUID, *, status: ImportJobStatus, message: str | None = None) -> None:
+        if not status.is_finished:
+            raise ValueError(f"not a final status: {status.value}")
+        self._update(
+            job_id,
+            status=status.value,
+            message=message[:MESSAGE_MAX_LEN] if message else None,
+            finished_at=_now(),
+        )
+
+    def list_errors(self, job_id: UUID, *, limit: int, offset: int) -> tuple[list[ImportJobError], int]:
+        jid = str(job_id)
+        with new_session() as s:
+            total = s.execute(
+                select(func.count()).select_from(ImportJobErrorRow).where(ImportJobErrorRow.job_id == jid)
+            ).scalar_one()
+            rows = s.execute(
+                select(ImportJobErrorRow.line_no, ImportJobErrorRow.message)
+                .where(ImportJobErrorRow.job_id == jid)
+                .order_by(ImportJobErrorRow.line_no, ImportJobErrorRow.id)
+                .limit(limit)
+                .offset(offset)
+            ).all()
+        return [ImportJobError(line_no=line_no, message=msg) for line_no, msg in rows], int(total)
+
+    def fail_unfinished(self, *, message: str) -> int:
+        """
+        Jobs PENDING / RUNNING d'un process précédent (redémarrage) => FAILED.
+        """
+        with new_session() as s:
+            res = s.execute(
+                update(ImportJobRow)
+                .where(ImportJobRow.profile_id == DEFAULT_PROFILE_ID)
+                .where(ImportJobRow.status.in_([ImportJobStatus.PENDING.value, ImportJobStatus.RUNNING.value]))
+                .values(status=ImportJobStatus.FAILED.value, message=message, finished_at=_now())
+            )
+            s.commit()
+            return int(res.rowcount or 0)
+
+    def _update(self, job_id: UUID, **values) -> None:
+        with new_session() as s:
+            res = s.execute(update(ImportJobRow).where(ImportJobRow.id == str(job_id)).values(**values))
+            if res.rowcount == 0:
+                raise KeyError(f"unknown import job '{job_id}'")
+            s.commit()
+
+    @staticmethod
+    def _to_domain(row: ImportJobRow) -> ImportJob:
+        return ImportJob(
+            id=UUID(row.id),
+            account_id=row.account_id,
+            format=row.format,
+            filename=row.filename,
+            status=ImportJobStatus(row.status),
+            created_at=_aware(row.created_at),
+            skip_duplicates=row.skip_duplicates,
+            rows_parsed=row.rows_parsed,
+            imported=row.imported,
+            duplicates_skipped=row.duplicates_skipped,
+            errors_count=row.errors_count,
+            message=row.message,
+            started_at=_aware(row.started_at),
+            finished_at=_aware(row.finished_at),
+        )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from sqlalchemy import String, select
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.instrument import Instrument, InstrumentKind
 from app.domain.money import Currency
@@ -20,17 +20,14 @@ class InstrumentRow(Base):
 
 class SqlInstrumentRepository(InstrumentRepository):
 
-    def __init__(self) -> None:
-        init_db()
-
     def list(self) -> list[Instrument]:
-        with new_session() as s:
+        with session_scope() as s:
             rows = s.execute(select(InstrumentRow)).scalars().all()
             return [self._to_domain(r) for r in rows]
 
     def get(self, symbol: str) -> Instrument:
         sym = symbol.strip().upper()
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(InstrumentRow, sym)
             if row is None:
                 raise KeyError(f"unknown instrument symbol '{sym}'")
@@ -39,7 +36,7 @@ class SqlInstrumentRepository(InstrumentRepository):
     def add(self, instrument: Instrument) -> None:
         sym = instrument.symbol.strip().upper()
 
-        with new_session() as s:
+        with session_scope() as s:
             existing = s.get(InstrumentRow, sym)
             if existing is not None:
                 raise ValueError(f"instrument '{sym}' already exists")
@@ -50,16 +47,14 @@ class SqlInstrumentRepository(InstrumentRepository):
                 currency=instrument.currency.value,
             )
             s.add(row)
-            s.commit()
 
     def delete(self, *, symbol: str) -> bool:
         sym = symbol.strip().upper()
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(InstrumentRow, sym)
             if row is None:
                 return False
             s.delete(row)
-            s.commit()
             return True
 
     @staticmethod
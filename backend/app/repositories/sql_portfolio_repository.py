@@ -6,13 +6,14 @@ from uuid import UUID
 from sqlalchemy import Date, String, select, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.money import Currency
 from app.domain.portfolio import Portfolio, PortfolioType
 from app.repositories.portfolio_repository import PortfolioRepository
 from app.identity.defaults import DEFAULT_PROFILE_ID
 from app.repositories.sql_identity_models import ProfileRow  # noqa: F401
+from app.repositories.sql_account_repository import AccountRow  # noqa: F401
 
 
 
@@ -40,13 +41,10 @@ class PortfolioRow(Base):
 
 class SqlPortfolioRepository(PortfolioRepository):
 
-    def __init__(self) -> None:
-        init_db()
-
     # -------- list --------
 
     def list(self) -> list[Portfolio]:
-        with new_session() as s:
+        with session_scope() as s:
             rows = s.execute(
                 select(PortfolioRow).where(PortfolioRow.profile_id == DEFAULT_PROFILE_ID)
             ).scalars().all()
@@ -56,7 +54,7 @@ class SqlPortfolioRepository(PortfolioRepository):
     # -------- get --------
 
     def get(self, portfolio_id: UUID) -> Portfolio:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(PortfolioRow, str(portfolio_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 raise KeyError(f"unknown portfolio_id '{portfolio_id}'")
@@ -66,22 +64,20 @@ class SqlPortfolioRepository(PortfolioRepository):
     # -------- add --------
 
     def add(self, portfolio: Portfolio) -> None:
-        with new_session() as s:
+        with session_scope() as s:
             if s.get(PortfolioRow, str(portfolio.id)) is not None:
                 raise ValueError(f"portfolio id '{portfolio.id}' already exists")
 
             s.add(self._to_row(portfolio))
-            s.commit()
 
     # -------- delete --------
 
     def delete(self, *, portfolio_id: UUID) -> bool:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(PortfolioRow, str(portfolio_id))
             if row is None:
                 return False
             s.delete(row)
-            s.commit()
             return True
 
     # -------- update (présent dans JSON repo) --------
@@ -94,7 +90,7 @@ class SqlPortfolioRepository(PortfolioRepository):
         portfolio_type: PortfolioType | None = None,
     ) -> Portfolio:
 
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(PortfolioRow, str(portfolio_id))
             if row is None:
                 raise KeyError("portfolio not found")
@@ -108,7 +104,7 @@ class SqlPortfolioRepository(PortfolioRepository):
             if portfolio_type is not None:
                 row.portfolio_type = portfolio_type.value
 
-            s.commit()
+            s.flush()
             s.refresh(row)
             return self._to_domain(row)
 
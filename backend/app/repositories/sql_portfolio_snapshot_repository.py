@@ -7,13 +7,14 @@ from uuid import UUID
 from sqlalchemy import Date, Numeric, String, select, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.money import Currency, Money
 from app.domain.portfolio import PortfolioSnapshot
 from app.repositories.portfolio_snapshot_repository import PortfolioSnapshotRepository
 from app.identity.defaults import DEFAULT_PROFILE_ID
 from app.repositories.sql_identity_models import ProfileRow  # noqa: F401
+from app.repositories.sql_portfolio_repository import PortfolioRow  # noqa: F401
 
 
 
@@ -42,19 +43,15 @@ class PortfolioSnapshotRow(Base):
 
 class SqlPortfolioSnapshotRepository(PortfolioSnapshotRepository):
 
-    def __init__(self) -> None:
-        init_db()
-
     def add(self, snapshot: PortfolioSnapshot) -> None:
-        with new_session() as s:
+        with session_scope() as s:
             if s.get(PortfolioSnapshotRow, str(snapshot.id)) is not None:
                 raise ValueError(f"snapshot id '{snapshot.id}' already exists")
 
             s.add(self._to_row(snapshot))
-            s.commit()
 
     def list(self, portfolio_id: UUID | None = None) -> list[PortfolioSnapshot]:
-        with new_session() as s:
+        with session_scope() as s:
             stmt = select(PortfolioSnapshotRow)
             stmt = stmt.where(PortfolioSnapshotRow.profile_id == DEFAULT_PROFILE_ID)
 
@@ -70,7 +67,7 @@ class SqlPortfolioSnapshotRepository(PortfolioSnapshotRepository):
         if date_from > date_to:
             raise ValueError("date_from must be <= date_to")
 
-        with new_session() as s:
+        with session_scope() as s:
             stmt = (
                 select(PortfolioSnapshotRow)
                 .where(PortfolioSnapshotRow.portfolio_id == str(portfolio_id))
@@ -2,22 +2,43 @@ from __future__ import annotations
 
 import datetime as dt
 from decimal import Decimal
+from typing import Iterable, Sequence
 
-from sqlalchemy import Date, DateTime, Integer, Numeric, String, select, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    Result,
+    Select,
+    String,
+    UniqueConstraint,
+    bindparam,
+    func,
+    select,
+    true,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, aliased, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.money import Currency
 from app.domain.price_point import PricePoint
-from app.repositories.price_repository import PriceRepository
-
-
+from app.repositories.price_repository import AsOfPrices, PriceRepository, pick_as_of
+from app.repositories.sql_instrument_repository import InstrumentRow  # noqa: F401
 
+# lignes par INSERT (postgres : 65535 paramètres max par requête)
+UPSERT_CHUNK = 5_000
 
 
 class PricePointRow(Base):
     __tablename__ = "price_points"
+    __table_args__ = (
+        UniqueConstraint("symbol", "day", "source", name="uq_price_points_symbol_day_source"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     symbol: Mapped[str] = mapped_column(
@@ -34,74 +55,227 @@ class PricePointRow(Base):
     captured_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
 
 
-class SqlPriceRepository(PriceRepository):
-    def __init__(self) -> None:
-        # ensure tables exist (V1 simple). Later we can move to migrations.
-        init_db()
+class PriceClosedDayRow(Base):
+    """
+    Jours ouvrés sans cotation (fériés de la place, avant cotation) constatés par un backfill :
+    exclus des trous aux backfills suivants.
+    """
+    __tablename__ = "price_closed_days"
+
+    symbol: Mapped[str] = mapped_column(
+        String(32),
+        ForeignKey("instruments.symbol", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[dt.date] = mapped_column(Date, primary_key=True)
 
+
+# lookups "as-of" (dernier prix <= jour) : parcours d'index, même ordre que latest()
+Index(
+    "ix_price_points_symbol_day_desc",
+    PricePointRow.symbol,
+    PricePointRow.day.desc(),
+    PricePointRow.captured_at.desc(),
+)
+
+
+class SqlPriceRepository(PriceRepository):
     def add(self, price: PricePoint) -> None:
-        row = PricePointRow(
-            symbol=price.symbol.strip().upper(),
-            day=price.day,
-            price=price.price,
-            currency=price.currency.value,
-            source=price.source,
-            captured_at=price.captured_at,
-        )
-        with new_session() as s:
-            s.add(row)
-            s.commit()
+        self.add_many([price])
 
-    def list(self, *, symbol: str | None = None) -> list[PricePoint]:
-        stmt = select(PricePointRow)
-        if symbol is not None:
-            stmt = stmt.where(PricePointRow.symbol == symbol.strip().upper())
-        stmt = stmt.order_by(PricePointRow.symbol, PricePointRow.day, PricePointRow.captured_at)
+    def add_many(self, prices: Sequence[PricePoint]) -> int:
+        """
+        Upsert en masse sur (symbol, day, source) : INSERT ... ON CONFLICT DO UPDATE,
+        le prix capturé le plus récemment gagne (captured_at), en base comme dans le lot :
+        rejouer une source plus ancienne n'écrase pas un prix plus récent.
+        Une seule transaction ; retourne le nb de lignes écrites (insérées ou mises à jour).
+        """
+        # une même clé deux fois dans un INSERT ferait échouer ON CONFLICT : on garde la plus récente
+        # (à captured_at égal, la dernière du lot)
+        latest: dict[tuple, dict] = {}
+        for v in map(self._to_values, prices):
+            key = (v["symbol"], v["day"], v["source"])
+            kept = latest.get(key)
+            if kept is None or v["captured_at"] >= kept["captured_at"]:
+                latest[key] = v
+        values = list(latest.values())
+        if not values:
+            return 0
 
-        with new_session() as s:
-            rows = s.execute(stmt).scalars().all()
+        written = 0
+        with session_scope() as s:
+            insert = postgresql.insert if s.get_bind().dialect.name == "postgresql" else sqlite.insert
+            for i in range(0, len(values), UPSERT_CHUNK):
+                stmt = insert(PricePointRow).values(values[i : i + UPSERT_CHUNK])
+                res = s.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["symbol", "day", "source"],
+                        set_={
+                            "price": stmt.excluded.price,
+                            "currency": stmt.excluded.currency,
+                            "captured_at": stmt.excluded.captured_at,
+                        },
+                        where=PricePointRow.captured_at <= stmt.excluded.captured_at,
+                    )
+                )
+                written += res.rowcount
+        return written
 
+    def list(self, *, symbol: str | None = None) -> list[PricePoint]:
+        with session_scope() as s:
+            rows = s.execute(self._list_stmt(symbol)).scalars().all()
         return [self._to_domain(r) for r in rows]
 
     def list_between(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> list[PricePoint]:
+        with session_scope() as s:
+            rows = s.execute(self._between_stmt(symbol, date_from, date_to)).scalars().all()
+        return [self._to_domain(r) for r in rows]
+
+    def latest(self, *, symbol: str) -> PricePoint | None:
+        with session_scope() as s:
+            row = s.execute(self._latest_stmt(symbol)).scalars().first()
+        return None if row is None else self._to_domain(row)
+
+    def prices_as_of(self, *, symbols: Sequence[str], days: Sequence[dt.date]) -> AsOfPrices:
+        """
+        Symboles × jours en un aller-retour.
+        Postgres : unnest(symboles) × unnest(jours) JOIN LATERAL (... ORDER BY day DESC LIMIT 1),
+        une descente d'index par couple. Autres backends : une requête bornée (day <= max(jours))
+        puis résolution en mémoire.
+        """
+        syms = sorted({s.strip().upper() for s in symbols})
+        wanted = sorted(set(days))
+        if not syms or not wanted:
+            return {}
+
+        with session_scope() as s:
+            dialect = s.get_bind().dialect.name
+            return self._as_of_from_rows(dialect, s.execute(self._as_of_stmt(dialect, syms, wanted)), wanted)
+
+    # requêtes partagées avec AsyncSqlPriceRepository
+
+    @staticmethod
+    def _list_stmt(symbol: str | None) -> Select:
+        stmt = select(PricePointRow)
+        if symbol is not None:
+            stmt = stmt.where(PricePointRow.symbol == symbol.strip().upper())
+        return stmt.order_by(PricePointRow.symbol, PricePointRow.day, PricePointRow.captured_at)
+
+    @staticmethod
+    def _between_stmt(symbol: str, date_from: dt.date, date_to: dt.date) -> Select:
         if date_from > date_to:
             raise ValueError("date_from must be <= date_to")
 
-        sym = symbol.strip().upper()
-        stmt = (
+        return (
             select(PricePointRow)
-            .where(PricePointRow.symbol == sym)
+            .where(PricePointRow.symbol == symbol.strip().upper())
             .where(PricePointRow.day >= date_from)
             .where(PricePointRow.day <= date_to)
             .order_by(PricePointRow.day, PricePointRow.captured_at)
         )
 
-        with new_session() as s:
-            rows = s.execute(stmt).scalars().all()
+    @staticmethod
+    def _latest_stmt(symbol: str) -> Select:
+        return (
+            select(PricePointRow)
+            .where(PricePointRow.symbol == symbol.strip().upper())
+            .order_by(PricePointRow.day.desc(), PricePointRow.captured_at.desc())
+            .limit(1)
+        )
 
-        return [self._to_domain(r) for r in rows]
+    @staticmethod
+    def _as_of_stmt(dialect: str, syms: list[str], wanted: list[dt.date]) -> Select:
+        if dialect != "postgresql":
+            return (
+                select(PricePointRow)
+                .where(PricePointRow.symbol.in_(syms))
+                .where(PricePointRow.day <= wanted[-1])
+            )
 
-    def latest(self, *, symbol: str) -> PricePoint | None:
-        sym = symbol.strip().upper()
-        stmt = (
+        sym_t = func.unnest(
+            bindparam("symbols", syms, type_=postgresql.ARRAY(String))
+        ).table_valued("symbol").render_derived(name="s")
+        day_t = func.unnest(
+            bindparam("days", wanted, type_=postgresql.ARRAY(Date))
+        ).table_valued("day").render_derived(name="d")
+        best = (
             select(PricePointRow)
-            .where(PricePointRow.symbol == sym)
+            .where(PricePointRow.symbol == sym_t.c.symbol)
+            .where(PricePointRow.day <= day_t.c.day)
             .order_by(PricePointRow.day.desc(), PricePointRow.captured_at.desc())
             .limit(1)
+            .lateral("p")
+        )
+        point = aliased(PricePointRow, best)
+        return (
+            select(day_t.c.day, point)
+            .select_from(sym_t)
+            .join(day_t, true())
+            .join(best, true())
         )
 
-        with new_session() as s:
-            row = s.execute(stmt).scalars().first()
+    @classmethod
+    def _as_of_from_rows(cls, dialect: str, result: Result, wanted: list[dt.date]) -> AsOfPrices:
+        if dialect != "postgresql":
+            return pick_as_of((cls._to_domain(r) for r in result.scalars()), wanted)
+        return {(row.symbol, as_of): cls._to_domain(row) for as_of, row in result}
 
-        return None if row is None else self._to_domain(row)
+    def price_days(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> set[dt.date]:
+        if date_from > date_to:
+            raise ValueError("date_from must be <= date_to")
+
+        stmt = (
+            select(PricePointRow.day)
+            .distinct()
+            .where(PricePointRow.symbol == symbol.strip().upper())
+            .where(PricePointRow.day >= date_from)
+            .where(PricePointRow.day <= date_to)
+        )
+        with session_scope() as s:
+            return set(s.execute(stmt).scalars().all())
+
+    def closed_days(self, *, symbol: str, date_from: dt.date, date_to: dt.date) -> set[dt.date]:
+        stmt = (
+            select(PriceClosedDayRow.day)
+            .where(PriceClosedDayRow.symbol == symbol.strip().upper())
+            .where(PriceClosedDayRow.day >= date_from)
+            .where(PriceClosedDayRow.day <= date_to)
+        )
+        with session_scope() as s:
+            return set(s.execute(stmt).scalars().all())
+
+    def add_closed_days(self, *, symbol: str, days: Iterable[dt.date]) -> int:
+        values = [{"symbol": symbol.strip().upper(), "day": d} for d in sorted(set(days))]
+        if not values:
+            return 0
+        with session_scope() as s:
+            insert = postgresql.insert if s.get_bind().dialect.name == "postgresql" else sqlite.insert
+            for i in range(0, len(values), UPSERT_CHUNK):
+                s.execute(insert(PriceClosedDayRow).values(values[i : i + UPSERT_CHUNK]).on_conflict_do_nothing())
+        return len(values)
+
+    @staticmethod
+    def _to_values(price: PricePoint) -> dict:
+        return {
+            "symbol": price.symbol.strip().upper(),
+            "day": price.day,
+            "price": price.price,
+            "currency": price.currency.value,
+            "source": price.source,
+            "captured_at": price.captured_at,
+        }
 
     @staticmethod
     def _to_domain(r: PricePointRow) -> PricePoint:
+        captured_at = r.captured_at
+        if captured_at.tzinfo is None:
+            # timestamptz ; un backend sans tz (ex: SQLite) rend un datetime naïf => UTC
+            captured_at = captured_at.replace(tzinfo=dt.timezone.utc)
         return PricePoint(
             symbol=r.symbol,
             day=r.day,
             price=Decimal(r.price),
             currency=Currency(r.currency),
             source=r.source,
-            captured_at=r.captured_at,
+            captured_at=captured_at,
         )
\ No newline at end of file
@@ -7,13 +7,16 @@ from uuid import UUID
 from sqlalchemy import Date, String, Numeric, select, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.money import Currency
 from app.domain.trade import Trade, TradeSide
 from app.repositories.trade_repository import TradeRepository
 from app.identity.defaults import DEFAULT_PROFILE_ID
 from app.repositories.sql_identity_models import ProfileRow  # noqa: F401
+from app.repositories.sql_instrument_repository import InstrumentRow  # noqa: F401
+from app.repositories.sql_portfolio_repository import PortfolioRow  # noqa: F401
+from app.repositories.sql_transaction_repository import TransactionRow  # noqa: F401
 
 
 
@@ -54,23 +57,19 @@ class TradeRow(Base):
 
 class SqlTradeRepository(TradeRepository):
 
-    def __init__(self) -> None:
-        init_db()
-
     # -------- add --------
 
     def add(self, trade: Trade) -> None:
-        with new_session() as s:
+        with session_scope() as s:
             if s.get(TradeRow, str(trade.id)) is not None:
                 raise ValueError(f"trade {trade.id} already exists")
 
             s.add(self._to_row(trade))
-            s.commit()
 
     # -------- list --------
 
     def list(self, *, portfolio_id: UUID | None = None) -> list[Trade]:
-        with new_session() as s:
+        with session_scope() as s:
             stmt = select(TradeRow)
             stmt = stmt.where(TradeRow.profile_id == DEFAULT_PROFILE_ID)
 
@@ -86,7 +85,7 @@ class SqlTradeRepository(TradeRepository):
         if date_from > date_to:
             raise ValueError("date_from must be <= date_to")
 
-        with new_session() as s:
+        with session_scope() as s:
             stmt = (
                 select(TradeRow)
                 .where(TradeRow.portfolio_id == str(portfolio_id))
@@ -104,7 +103,7 @@ class SqlTradeRepository(TradeRepository):
     # -------- get --------
 
     def get(self, trade_id: UUID) -> Trade:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TradeRow, str(trade_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 raise KeyError("trade not found")
@@ -116,7 +115,7 @@ class SqlTradeRepository(TradeRepository):
     # -------- delete (physique en SQL) --------
 
     def delete(self, *, trade_id: UUID) -> bool:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TradeRow, str(trade_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 return False
@@ -124,13 +123,12 @@ class SqlTradeRepository(TradeRepository):
             if row is None:
                 return False
             s.delete(row)
-            s.commit()
             return True
 
     # -------- update (remplace JSONL merge) --------
 
     def update(self, *, trade_id: UUID, patch: dict) -> Trade:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TradeRow, str(trade_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 raise KeyError("trade not found")
@@ -156,7 +154,7 @@ class SqlTradeRepository(TradeRepository):
             if "currency" in patch:
                 row.currency = patch["currency"].value
 
-            s.commit()
+            s.flush()
             s.refresh(row)
             return self._to_domain(row)
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import datetime as dt
+from dataclasses import replace
 from decimal import Decimal
+from typing import Iterable, Iterator, Sequence
 from uuid import UUID
 
 from sqlalchemy import (
@@ -11,24 +13,39 @@ from sqlalchemy import (
     Numeric,
     String,
     ForeignKey,
+    Row,
+    Select,
     UniqueConstraint,
     select,
     func,
+    extract,
+    and_,
+    insert,
+    update,
+    bindparam,
 )
+from sqlalchemy.engine import Connection
 
-from sqlalchemy.orm import Mapped, mapped_column, Session
+from sqlalchemy.orm import Mapped, mapped_column, Session, aliased
 
 from app.identity.defaults import DEFAULT_PROFILE_ID
 
 
-from app.db import init_db, new_session
+from app.db import session_scope
 from app.db_base import Base
 from app.domain.money import Currency
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_fingerprint import FINGERPRINT_LEN, fingerprint, transaction_fingerprint
+from app.domain.transaction_frame import TransactionFrame, TransactionFrameBuilder
+from app.domain.account import AccountType
+from app.engine.account_balance import AccountBalance
+from app.engine.budget import BudgetTotals
+from app.engine.running_balance import TransactionWithBalance
 from app.repositories.account_repository import AccountRepository
 from app.repositories.transaction_repository import TransactionRepository
 from app.repositories.sql_identity_models import ProfileRow  # noqa: F401
+from app.repositories.sql_account_repository import AccountRow
 
 class TransactionRow(Base):
     __tablename__ = "transactions"
@@ -54,6 +71,8 @@ class TransactionRow(Base):
     label: Mapped[str | None] = mapped_column(String(256), nullable=True)
     created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
     transfer_id: Mapped[str | None] = mapped_column(String(36), index=True, nullable=True)
+    # déduplication des imports (cf. transaction_fingerprint) ; rempli pour l'existant par la migration
+    fingerprint: Mapped[str | None] = mapped_column(String(FINGERPRINT_LEN), index=True, nullable=True)
     profile_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("profiles.id", ondelete="CASCADE"),
@@ -62,11 +81,63 @@ class TransactionRow(Base):
     )
 
 
+FINGERPRINT_CHUNK = 5_000  # paramètres par requête IN (...)
+
+
+def backfill_fingerprints(
+    conn: Connection | Session, *, batch_size: int = 5_000, recompute: bool = False
+) -> Iterator[int]:
+    """
+    Remplit transactions.fingerprint par lots (pagination par clé sur id, pas d'OFFSET) ;
+    produit le nombre de lignes écrites par lot (l'appelant peut committer entre deux lots).
+    recompute : toutes les lignes, pas seulement les NULL (après un changement de normalisation).
+    Core seulement (pas d'ORM) : utilisable depuis une migration Alembic (op.get_bind()).
+    """
+    t = TransactionRow.__table__
+    write = (
+        update(t)
+        .where(t.c.id == bindparam("b_id"))
+        .values(fingerprint=bindparam("b_fingerprint"))
+    )
+    last_id = ""
+    while True:
+        stmt = (
+            select(t.c.id, t.c.account_id, t.c.date, t.c.amount, t.c.category, t.c.label)
+            .where(t.c.id > last_id)
+            .order_by(t.c.id)
+            .limit(batch_size)
+        )
+        if not recompute:
+            stmt = stmt.where(t.c.fingerprint.is_(None))
+
+        rows = conn.execute(stmt).all()
+        if not rows:
+            return
+
+        conn.execute(
+            write,
+            [
+                {
+                    "b_id": tx_id,
+                    "b_fingerprint": fingerprint(
+                        account_id=account_id,
+                        date=day,
+                        amount=Decimal(amount),
+                        category=category,
+                        label=label,
+                    ),
+                }
+                for tx_id, account_id, day, amount, category, label in rows
+            ],
+        )
+        last_id = rows[-1][0]
+        yield len(rows)
+
+
 class SqlTransactionRepository(TransactionRepository):
 
     def __init__(self, *, tx_account_repo: AccountRepository) -> None:
         self._accounts = tx_account_repo
-        init_db()
 
     def add(self, tx: Transaction) -> None:
         acc = self._accounts.get_account(tx.account_id)
@@ -76,30 +147,333 @@ class SqlTransactionRepository(TransactionRepository):
                 f"tx={tx.amount.currency} account={acc.currency}"
             )
 
-        with new_session() as s:
+        with session_scope() as s:
             existing = s.get(TransactionRow, str(tx.id))
             if existing is not None:
                 raise ValueError(f"Transaction with id {tx.id} already exists")
 
             s.add(self._to_row(tx))
-            s.commit()
+
+    def add_many(self, txs: Sequence[Transaction]) -> list[Transaction]:
+        """
+        Insertion en lot (import) dans une seule transaction SQL.
+        Les séquences sont réattribuées par (compte, date) à la suite du MAX existant
+        (une seule requête GROUP BY), dans l'ordre de `txs`. Retourne les tx insérées.
+        """
+        if not txs:
+            return []
+
+        currencies = {aid: self._accounts.get_account(aid).currency for aid in {t.account_id for t in txs}}
+        for tx in txs:
+            if tx.amount.currency != currencies[tx.account_id]:
+                raise ValueError(
+                    f"currency mismatch for account '{tx.account_id}': "
+                    f"tx={tx.amount.currency} account={currencies[tx.account_id]}"
+                )
+
+        with session_scope() as s:
+            stmt = (
+                select(TransactionRow.account_id, TransactionRow.day, func.max(TransactionRow.sequence))
+                .where(TransactionRow.profile_id == DEFAULT_PROFILE_ID)
+                .where(TransactionRow.account_id.in_(list(currencies)))
+                .where(TransactionRow.day.between(min(t.date for t in txs), max(t.date for t in txs)))
+                .group_by(TransactionRow.account_id, TransactionRow.day)
+            )
+            last_seq = {(aid, day): int(seq) for aid, day, seq in s.execute(stmt)}
+
+            out: list[Transaction] = []
+            for tx in txs:
+                key = (tx.account_id, tx.date)
+                seq = last_seq.get(key, 0) + 1
+                last_seq[key] = seq
+                out.append(replace(tx, sequence=seq))
+
+            # executemany => INSERT multi-lignes (insertmanyvalues) côté SQLAlchemy
+            s.execute(insert(TransactionRow), [self._to_values(tx) for tx in out])
+        return out
+
+    def fingerprint_counts(self, fingerprints: Iterable[str]) -> dict[str, int]:
+        """
+        {empreinte -> nb de tx en base} pour les empreintes demandées (absentes = 0),
+        requête ensembliste sur l'index fingerprint (par paquets de FINGERPRINT_CHUNK).
+        """
+        wanted = list(set(fingerprints))
+        counts: dict[str, int] = {}
+        with session_scope() as s:
+            for i in range(0, len(wanted), FINGERPRINT_CHUNK):
+                stmt = (
+                    select(TransactionRow.fingerprint, func.count())
+                    .where(TransactionRow.profile_id == DEFAULT_PROFILE_ID)
+                    .where(TransactionRow.fingerprint.in_(wanted[i:i + FINGERPRINT_CHUNK]))
+                    .group_by(TransactionRow.fingerprint)
+                )
+                counts.update((fp, int(n)) for fp, n in s.execute(stmt))
+        return counts
 
     def list(self, account_id: str | None = None) -> list[Transaction]:
-        with new_session() as s:
-            stmt = select(TransactionRow)
-            if account_id is not None:
-                aid = account_id.strip()
-                stmt = stmt.where(TransactionRow.account_id == aid)
-                stmt = stmt.where(TransactionRow.profile_id == DEFAULT_PROFILE_ID)
+        with session_scope() as s:
+            rows = s.execute(self._list_stmt(account_id)).scalars().all()
+            return self._sorted_domain(rows)
+
+    @staticmethod
+    def _list_stmt(account_id: str | None) -> Select:
+        stmt = select(TransactionRow)
+        if account_id is not None:
+            aid = account_id.strip()
+            stmt = stmt.where(TransactionRow.account_id == aid)
+            stmt = stmt.where(TransactionRow.profile_id == DEFAULT_PROFILE_ID)
+        return stmt
+
+    @classmethod
+    def _sorted_domain(cls, rows: Iterable[TransactionRow]) -> list[Transaction]:
+        txs = [cls._to_domain(r) for r in rows]
+        txs.sort(key=lambda t: (t.date, t.sequence))
+        return txs
+
+    def list_frame(self, account_ids: Iterable[str] | None = None) -> TransactionFrame:
+        """
+        Tx en colonnes (TransactionFrame), construites directement depuis les rows :
+        pas d'objets ORM ni de Transaction. Une seule requête pour N comptes.
+        """
+        stmt = self._frame_stmt(account_ids)
+        if stmt is None:
+            return TransactionFrame.empty()
+        with session_scope() as s:
+            return self._frame_from_rows(s.execute(stmt))
+
+    @staticmethod
+    def _frame_stmt(account_ids: Iterable[str] | None) -> Select | None:
+        """None : liste de comptes vide (aucune requête)."""
+        stmt = (
+            select(
+                TransactionRow.account_id,
+                TransactionRow.day,
+                TransactionRow.sequence,
+                TransactionRow.amount,
+                TransactionRow.currency,
+                TransactionRow.kind,
+                TransactionRow.category,
+                TransactionRow.subcategory,
+            )
+            .where(TransactionRow.profile_id == DEFAULT_PROFILE_ID)
+            .order_by(TransactionRow.day, TransactionRow.sequence)
+        )
+        if account_ids is not None:
+            ids = [a.strip() for a in account_ids]
+            if not ids:
+                return None
+            stmt = stmt.where(TransactionRow.account_id.in_(ids))
+        return stmt
+
+    @staticmethod
+    def _frame_from_rows(rows: Iterable[Row]) -> TransactionFrame:
+        b = TransactionFrameBuilder()
+        for account_id, day, sequence, amount, currency, kind, category, subcategory in rows:
+            b.append(
+                account_id=account_id,
+                date=day,
+                sequence=sequence,
+                amount=amount,
+                currency=currency,
+                kind=kind,
+                category=category,
+                subcategory=subcategory,
+            )
+        return b.build()
+
+    def budget_totals(
+        self,
+        *,
+        account_id: str,
+        date_from: dt.date | None = None,
+        date_to: dt.date | None = None,
+    ) -> BudgetTotals:
+        """
+        Agrégats du budget calculés en SQL (GROUP BY) : seules les lignes agrégées remontent.
+        """
+        aid = account_id.strip()
+        where = [TransactionRow.account_id == aid, TransactionRow.profile_id == DEFAULT_PROFILE_ID]
+        if date_from is not None:
+            where.append(TransactionRow.day >= date_from)
+        if date_to is not None:
+            where.append(TransactionRow.day <= date_to)
+        expense = [*where, TransactionRow.kind == TransactionKind.EXPENSE.value]
+
+        total = func.sum(TransactionRow.amount)
+
+        with session_scope() as s:
+            by_kind = s.execute(
+                select(TransactionRow.kind, total).where(*where).group_by(TransactionRow.kind)
+            ).all()
+
+            by_category = s.execute(
+                select(TransactionRow.category, total)
+                .where(*expense)
+                .group_by(TransactionRow.category)
+                .order_by(TransactionRow.category)
+            ).all()
+
+            by_subcategory = s.execute(
+                select(TransactionRow.category, TransactionRow.subcategory, total)
+                .where(*expense, TransactionRow.subcategory.is_not(None))
+                .group_by(TransactionRow.category, TransactionRow.subcategory)
+                .order_by(TransactionRow.category, TransactionRow.subcategory)
+            ).all()
+
+            if s.get_bind().dialect.name == "postgresql":
+                month = func.date_trunc("month", TransactionRow.day)
+                by_month = [
+                    (m.year, m.month, kind, v)
+                    for m, kind, v in s.execute(
+                        select(month, TransactionRow.kind, total)
+                        .where(*where)
+                        .group_by(month, TransactionRow.kind)
+                    )
+                ]
+            else:
+                # pas de date_trunc (ex: sqlite) : (année, mois) via EXTRACT
+                year = extract("year", TransactionRow.day)
+                month_num = extract("month", TransactionRow.day)
+                by_month = s.execute(
+                    select(year, month_num, TransactionRow.kind, total)
+                    .where(*where)
+                    .group_by(year, month_num, TransactionRow.kind)
+                ).all()
+
+        return BudgetTotals(
+            by_kind={TransactionKind(k): Decimal(v) for k, v in by_kind},
+            by_category={c: Decimal(v) for c, v in by_category},
+            by_subcategory={(c, sc): Decimal(v) for c, sc, v in by_subcategory},
+            by_month_kind={(int(y), int(m), TransactionKind(k)): Decimal(v) for y, m, k, v in by_month},
+        )
+
+    def balances_at(
+        self,
+        *,
+        at: dt.date | None,
+        account_ids: Iterable[str] | None = None,
+    ) -> list[AccountBalance]:
+        """
+        Solde de chaque compte à `at` (incluse, None => tout) en UNE requête :
+        accounts LEFT JOIN transactions, SUM(amount) / COUNT ... GROUP BY account.
+        Ordre : account_id (comme list_accounts).
+        """
+        stmt = self._balances_stmt(at=at, account_ids=account_ids)
+        if stmt is None:
+            return []
+        with session_scope() as s:
+            return self._balances_from_rows(s.execute(stmt).all())
+
+    @staticmethod
+    def _balances_stmt(*, at: dt.date | None, account_ids: Iterable[str] | None) -> Select | None:
+        join_on = [
+            TransactionRow.account_id == AccountRow.id,
+            TransactionRow.profile_id == DEFAULT_PROFILE_ID,
+        ]
+        if at is not None:
+            join_on.append(TransactionRow.day <= at)
 
+        stmt = (
+            select(
+                AccountRow.id,
+                AccountRow.account_type,
+                AccountRow.currency,
+                AccountRow.opening_balance,
+                func.coalesce(func.sum(TransactionRow.amount), 0),
+                func.count(TransactionRow.id),
+            )
+            .outerjoin(TransactionRow, and_(*join_on))
+            .where(AccountRow.profile_id == DEFAULT_PROFILE_ID)
+            .group_by(AccountRow.id, AccountRow.account_type, AccountRow.currency, AccountRow.opening_balance)
+            .order_by(AccountRow.id)
+        )
+        if account_ids is not None:
+            ids = [a.strip() for a in account_ids]
+            if not ids:
+                return None
+            stmt = stmt.where(AccountRow.id.in_(ids))
+        return stmt
+
+    @staticmethod
+    def _balances_from_rows(rows: Iterable[Row]) -> list[AccountBalance]:
+        out: list[AccountBalance] = []
+        for account_id, account_type, currency, opening, tx_sum, tx_count in rows:
+            c = Currency(currency)
+            out.append(
+                AccountBalance(
+                    account_id=account_id,
+                    account_type=AccountType(account_type),
+                    opening_balance=SignedMoney(amount=Decimal(opening), currency=c),
+                    tx_sum=SignedMoney(amount=Decimal(tx_sum), currency=c),
+                    tx_count=int(tx_count),
+                )
+            )
+        return out
+
+    def list_with_running_balance(
+        self,
+        *,
+        account_id: str,
+        opening_balance: SignedMoney,
+        limit: int = 100,
+        offset: int = 0,
+        descending: bool = False,
+    ) -> tuple[list[TransactionWithBalance], int]:
+        """
+        Page de tx d'un compte avec le solde après chaque tx, calculé par Postgres :
+        SUM(amount) OVER (PARTITION BY account_id ORDER BY date, sequence).
+        La fenêtre porte sur tout le compte (sous-requête), la pagination sur le résultat.
+        Retourne (page, nombre total de tx du compte).
+        """
+        count_stmt, page_stmt = self._running_balance_stmts(
+            account_id=account_id, limit=limit, offset=offset, descending=descending
+        )
+        with session_scope() as s:
+            total = s.execute(count_stmt).scalar_one()
+            page = self._running_balance_page(s.execute(page_stmt).all(), opening_balance)
+        return page, int(total)
 
-            rows = s.execute(stmt).scalars().all()
-            txs = [self._to_domain(r) for r in rows]
-            txs.sort(key=lambda t: (t.date, t.sequence))
-            return txs
+    @staticmethod
+    def _running_balance_stmts(
+        *, account_id: str, limit: int, offset: int, descending: bool
+    ) -> tuple[Select, Select]:
+        """(COUNT des tx du compte, page avec somme glissante)"""
+        aid = account_id.strip()
+        where = [TransactionRow.account_id == aid, TransactionRow.profile_id == DEFAULT_PROFILE_ID]
+
+        running = (
+            func.sum(TransactionRow.amount)
+            .over(
+                partition_by=TransactionRow.account_id,
+                order_by=(TransactionRow.day, TransactionRow.sequence),
+                rows=(None, 0),
+            )
+            .label("running_sum")
+        )
+        sub = select(TransactionRow, running).where(*where).subquery()
+        tx = aliased(TransactionRow, sub)
+
+        order = (tx.day.desc(), tx.sequence.desc()) if descending else (tx.day, tx.sequence)
+        stmt = select(tx, sub.c.running_sum).order_by(*order).limit(limit).offset(offset)
+        return select(func.count()).select_from(TransactionRow).where(*where), stmt
+
+    @classmethod
+    def _running_balance_page(
+        cls, rows: Iterable[Row], opening_balance: SignedMoney
+    ) -> list[TransactionWithBalance]:
+        return [
+            TransactionWithBalance(
+                transaction=cls._to_domain(row),
+                balance_after=SignedMoney(
+                    amount=opening_balance.amount + Decimal(running_sum),
+                    currency=opening_balance.currency,
+                ),
+            )
+            for row, running_sum in rows
+        ]
 
     def get(self, tx_id: UUID) -> Transaction | None:
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TransactionRow, str(tx_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 return None
@@ -108,7 +482,7 @@ class SqlTransactionRepository(TransactionRepository):
 
     def next_sequence(self, account_id: str, date: dt.date) -> int:
         aid = account_id.strip()
-        with new_session() as s:
+        with session_scope() as s:
             return self._next_sequence_in_session(s, account_id=aid, date=date)
 
     def delete(self, *, account_id: str, tx_id: UUID) -> bool:
@@ -116,7 +490,7 @@ class SqlTransactionRepository(TransactionRepository):
         if not aid:
             return False
 
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TransactionRow, str(tx_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID:
                 return False
@@ -127,7 +501,6 @@ class SqlTransactionRepository(TransactionRepository):
                 return False
 
             s.delete(row)
-            s.commit()
             return True
 
     def update(
@@ -146,7 +519,7 @@ class SqlTransactionRepository(TransactionRepository):
         if not aid:
             raise ValueError("account_id cannot be empty")
 
-        with new_session() as s:
+        with session_scope() as s:
             row = s.get(TransactionRow, str(tx_id))
             if row is None or row.profile_id != DEFAULT_PROFILE_ID or row.account_id != aid:
                 raise KeyError("Transaction not found")
@@ -195,7 +568,8 @@ class SqlTransactionRepository(TransactionRepository):
                     raise ValueError("label must be null or non-empty string")
                 row.label = lb
 
-            s.commit()
+            row.fingerprint = self._row_fingerprint(row)
+            s.flush()
             s.refresh(row)
             return self._to_domain(row)
 
@@ -209,7 +583,7 @@ class SqlTransactionRepository(TransactionRepository):
         subcategory: str | None = None,
         label: str | None = None,
     ) -> tuple[Transaction, Transaction]:
-        with new_session() as s:
+        with session_scope() as s:
             tid = str(transfer_id)
             rows = s.execute(
             select(TransactionRow)
@@ -282,14 +656,16 @@ class SqlTransactionRepository(TransactionRepository):
             row_from.label = pick(row_from.label, label, "label")
             row_to.label = pick(row_to.label, label, "label")
 
-            s.commit()
+            row_from.fingerprint = self._row_fingerprint(row_from)
+            row_to.fingerprint = self._row_fingerprint(row_to)
+            s.flush()
             s.refresh(row_from)
             s.refresh(row_to)
 
             return self._to_domain(row_from), self._to_domain(row_to)
 
     def delete_transfer(self, *, transfer_id: UUID) -> tuple[UUID, UUID]:
-        with new_session() as s:
+        with session_scope() as s:
             tid = str(transfer_id)
             rows = s.execute(
                 select(TransactionRow).where(TransactionRow.transfer_id == tid)
@@ -306,7 +682,6 @@ class SqlTransactionRepository(TransactionRepository):
 
             s.delete(rows[0])
             s.delete(rows[1])
-            s.commit()
             return id1, id2
 
     @staticmethod
@@ -323,7 +698,11 @@ class SqlTransactionRepository(TransactionRepository):
 
     @staticmethod
     def _to_row(tx: Transaction) -> TransactionRow:
-        return TransactionRow(
+        return TransactionRow(**SqlTransactionRepository._to_values(tx))
+
+    @staticmethod
+    def _to_values(tx: Transaction) -> dict:
+        return dict(
             id=str(tx.id),
             account_id=tx.account_id,
             day=tx.date,
@@ -336,10 +715,21 @@ class SqlTransactionRepository(TransactionRepository):
             label=tx.label,
             created_at=tx.created_at,
             transfer_id=str(tx.transfer_id) if tx.transfer_id else None,
+            fingerprint=transaction_fingerprint(tx),
             profile_id=DEFAULT_PROFILE_ID,
 
         )
 
+    @staticmethod
+    def _row_fingerprint(row: TransactionRow) -> str:
+        return fingerprint(
+            account_id=row.account_id,
+            date=row.day,
+            amount=Decimal(row.amount),
+            category=row.category,
+            label=row.label,
+        )
+
     @staticmethod
     def _to_domain(row: TransactionRow) -> Transaction:
         currency = Currency(row.currency)
@@ -354,6 +744,10 @@ class SqlTransactionRepository(TransactionRepository):
             category=row.category,
             subcategory=row.subcategory,
             label=row.label,
-            created_at=row.created_at,
+            # timestamptz ; un backend sans tz (ex: SQLite) rend un datetime naïf => UTC
+            created_at=(
+                row.created_at if row.created_at.tzinfo is not None
+                else row.created_at.replace(tzinfo=dt.timezone.utc)
+            ),
             transfer_id=UUID(row.transfer_id) if row.transfer_id else None,
         )
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Protocol, Iterable, Optional
+from typing import Protocol, Iterable, Optional, Sequence
 import datetime as dt
 from uuid import UUID
 
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame
 from app.domain.signed_money import SignedMoney
+from app.engine.budget import BudgetTotals
 
 
 
@@ -14,9 +16,31 @@ class TransactionRepository(Protocol):
     def add(self, tx: Transaction) -> None:
         ...
 
+    def add_many(self, txs: Sequence[Transaction]) -> list[Transaction]:
+        """Bulk insert; sequences are reassigned per (account, date). Returns the stored txs."""
+        ...
+
+    def fingerprint_counts(self, fingerprints: Iterable[str]) -> dict[str, int]:
+        """Stored tx count per import fingerprint (missing = 0), for duplicate detection."""
+        ...
+
     def list(self, account_id: Optional[str] = None) -> list[Transaction]:
         ...
 
+    def list_frame(self, account_ids: Optional[Iterable[str]] = None) -> TransactionFrame:
+        """Same rows as list(), columnar (for the engines)."""
+        ...
+
+    def budget_totals(
+        self,
+        *,
+        account_id: str,
+        date_from: dt.date | None = None,
+        date_to: dt.date | None = None,
+    ) -> BudgetTotals:
+        """Raw budget aggregates (kind / category / subcategory / month x kind) for one account."""
+        ...
+
     def get(self, tx_id: UUID) -> Transaction | None:
         ...
 
@@ -0,0 +1,235 @@
+# app/services/import_formats.py
+"""
+Formats d'import de relevés : CSV strict (en-têtes) et export Excel "Victor".
+Chaque format produit une ImportSource (lignes numérotées + parse_row) pour import_transactions.
+"""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+import datetime as dt
+import re
+from typing import Any, Callable, Iterable, Literal, TextIO
+
+from app.domain.account import Account
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.services.transaction_import_service import PENDING_SEQUENCE, UPLOAD_CHUNK_SIZE
+
+ImportFormat = Literal["csv", "victor"]
+
+FILE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "csv": (".csv",),
+    "victor": (".csv", ".txt", ".tsv"),  # export Excel
+}
+
+
+class ImportFormatError(ValueError):
+    """Fichier inexploitable dans son ensemble (en-têtes, fichier vide...)."""
+
+
+@dataclass(frozen=True)
+class ImportSource:
+    rows: Iterable[tuple[int, Any]]  # (numéro de ligne, ligne brute)
+    parse_row: Callable[[Any], Transaction | None]
+    delimiter: str | None = None
+
+
+def check_filename(fmt: ImportFormat, filename: str | None) -> None:
+    extensions = FILE_EXTENSIONS[fmt]
+    if not (filename or "").lower().endswith(extensions):
+        raise ImportFormatError(f"Invalid file type (expected {'/'.join(extensions)})")
+
+
+def open_source(fmt: ImportFormat, text: TextIO, account: Account) -> ImportSource:
+    if fmt == "csv":
+        return standard_csv_source(text, account)
+    if fmt == "victor":
+        return victor_source(text, account)
+    raise ImportFormatError(f"unknown import format '{fmt}'")
+
+
+# ---------- CSV strict ----------
+
+REQUIRED_CSV_HEADERS = {"date", "kind", "amount", "category"}
+
+
+def standard_csv_source(text: TextIO, account: Account) -> ImportSource:
+    """
+    En-têtes attendus : date, kind, amount, category (+ subcategory, label optionnels).
+    """
+    reader = csv.DictReader(text)
+    if reader.fieldnames is None:
+        raise ImportFormatError("CSV has no header row")
+
+    # on tolère l'absence de subcategory/label mais on veut au minimum ces 4-là
+    if not REQUIRED_CSV_HEADERS.issubset(set(reader.fieldnames)):
+        raise ImportFormatError(f"CSV missing required headers: {sorted(REQUIRED_CSV_HEADERS)}")
+
+    def parse_row(row: dict) -> Transaction:
+        date = dt.date.fromisoformat((row.get("date") or "").strip())
+        kind = TransactionKind((row.get("kind") or "").strip())
+        amount = SignedMoney.from_str((row.get("amount") or "").strip(), account.currency)
+        category = (row.get("category") or "").strip()
+        if not category:
+            raise ValueError("category empty")
+
+        subcategory = (row.get("subcategory") or "").strip() or None
+        label = (row.get("label") or "").strip() or None
+
+        return Transaction.create(
+            account_id=account.id,
+            date=date,
+            sequence=PENDING_SEQUENCE,
+            amount=amount,
+            kind=kind,
+            category=category,
+            subcategory=subcategory,
+            label=label,
+        )
+
+    # ligne 1 = header
+    return ImportSource(rows=enumerate(reader, start=2), parse_row=parse_row)
+
+
+# ---------- Format Victor ----------
+
+_DATE_FR_RE = re.compile(r"^\s*(\d{2})/(\d{2})/(\d{4})\s*$")
+
+
+def parse_date_fr(value: str) -> dt.date:
+    m = _DATE_FR_RE.match(value or "")
+    if not m:
+        raise ValueError(f"invalid FR date (expected DD/MM/YYYY): '{value}'")
+    dd, mm, yyyy = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return dt.date(yyyy, mm, dd)
+
+
+def normalize_amount_fr(value: str) -> str:
+    """
+    Convertit "-75,16 €" -> "-75.16"
+    Convertit "145,40 €" -> "145.40"
+    Convertit "-0,99" -> "-0.99"
+    """
+    if value is None:
+        raise ValueError("amount missing")
+
+    s = value.strip()
+
+    # enlever euro + espaces insécables/espaces
+    s = s.replace("€", "").replace("\u00a0", " ").strip()
+
+    # enlever espaces au milieu (ex: "1 234,56")
+    s = s.replace(" ", "")
+
+    # virgule -> point
+    s = s.replace(",", ".")
+
+    # sanity
+    if s in ("", ".", "-", "+"):
+        raise ValueError(f"invalid amount: '{value}'")
+
+    return s
+
+
+def map_type_to_kind(type_excel: str, amount_str: str):
+    """
+    Mapping Victor -> TransactionKind.
+    On utilise surtout le libellé, mais on peut aussi fallback sur le signe.
+    """
+    t = (type_excel or "").strip().lower()
+
+    if "dépense" in t or "depense" in t:
+        return TransactionKind.EXPENSE
+    if "revenu" in t:
+        return TransactionKind.INCOME
+    if "invest" in t:
+        return TransactionKind.INVESTMENT
+    if "ajust" in t:
+        return TransactionKind.ADJUSTMENT
+
+    # fallback : signe du montant
+    if amount_str.startswith("-"):
+        return TransactionKind.EXPENSE
+    return TransactionKind.INCOME
+
+
+def looks_like_header(row: list[str]) -> bool:
+    """
+    Détecte une éventuelle ligne header du genre:
+    Date | Type | Catégorie | Sous-catégorie | Montant
+    """
+    joined = " ".join((c or "").lower() for c in row)
+    keywords = ["date", "type", "cat", "montant", "amount"]
+    return sum(k in joined for k in keywords) >= 2
+
+
+def sniff_delimiter(text: str) -> str:
+    """
+    Détecte tab / ; / , (dans cet ordre de préférence).
+    """
+    candidates = ["\t", ";", ","]
+    counts = {d: text.count(d) for d in candidates}
+    # choisir le délimiteur le plus fréquent
+    best = max(counts, key=counts.get)
+    return best
+
+
+def victor_source(text: TextIO, account: Account) -> ImportSource:
+    """
+    Format attendu (5 colonnes) : date_fr, type_excel, category, subcategory, amount_fr
+    Délimiteur détecté sur le début du fichier, puis lecture en streaming.
+    """
+    head = text.read(UPLOAD_CHUNK_SIZE)
+    if not head.strip():
+        raise ImportFormatError("Empty file")
+
+    delim = sniff_delimiter(head)
+    text.seek(0)
+    reader = csv.reader(text, delimiter=delim)
+
+    def numbered_rows():
+        for line_no, row in enumerate(reader, start=1):
+            # sauter lignes vides
+            if not row or all((c or "").strip() == "" for c in row):
+                continue
+            # si header détecté en première ligne -> skip
+            if line_no == 1 and looks_like_header(row):
+                continue
+            yield line_no, row
+
+    def parse_row(row: list[str]) -> Transaction:
+        # nettoyer cellules
+        cells = [c.strip() for c in row]
+        if len(cells) < 5:
+            raise ValueError(f"expected 5 columns, got {len(cells)}")
+
+        date_fr = cells[0]
+        type_excel = cells[1]
+        category = cells[2].strip()
+        subcategory = cells[3].strip() or None
+        amount_fr = cells[4]
+
+        if not category:
+            raise ValueError("category empty")
+
+        date = parse_date_fr(date_fr)
+        amount_norm = normalize_amount_fr(amount_fr)
+        kind = map_type_to_kind(type_excel, amount_norm)
+
+        # devise implicite = devise du compte
+        amount = SignedMoney.from_str(amount_norm, account.currency)
+
+        # sequence auto (par date) : attribuée à l'insertion en lot
+        return Transaction.create(
+            account_id=account.id,
+            date=date,
+            sequence=PENDING_SEQUENCE,
+            amount=amount,
+            kind=kind,
+            category=category,
+            subcategory=subcategory,
+            label=None,
+        )
+
+    return ImportSource(rows=numbered_rows(), parse_row=parse_row, delimiter=delim)
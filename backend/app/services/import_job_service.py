@@ -0,0 +1,115 @@
+# app/services/import_job_service.py
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import datetime as dt
+from functools import lru_cache
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import BinaryIO
+from uuid import uuid4
+
+from app.domain.account import Account
+from app.domain.import_job import ImportJob, ImportJobStatus
+from app.repositories.import_job_repository import ImportJobRepository
+from app.repositories.transaction_repository import TransactionRepository
+from app.services.import_formats import ImportFormat, open_source
+from app.services.transaction_import_service import ImportResult, import_transactions, open_upload_text
+from app.settings import get_import_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_import_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=get_import_settings().workers, thread_name_prefix="import-job")
+
+
+def submit_import_job(
+    *,
+    jobs: ImportJobRepository,
+    tx_repo: TransactionRepository,
+    account: Account,
+    fmt: ImportFormat,
+    filename: str,
+    upload: BinaryIO,
+    skip_duplicates: bool = False,
+    executor: Executor | None = None,
+) -> tuple[ImportJob, Future]:
+    """
+    Copie l'upload sur disque (il est fermé à la fin de la requête), crée le job PENDING
+    et le confie au pool de workers. Retourne immédiatement.
+    """
+    fd, tmp = tempfile.mkstemp(prefix="dashmoney-import-", suffix=Path(filename).suffix)
+    with os.fdopen(fd, "wb") as out:
+        shutil.copyfileobj(upload, out)
+
+    job = ImportJob(
+        id=uuid4(),
+        account_id=account.id,
+        format=fmt,
+        filename=filename,
+        status=ImportJobStatus.PENDING,
+        created_at=dt.datetime.now(dt.timezone.utc),
+        skip_duplicates=skip_duplicates,
+    )
+    try:
+        jobs.add(job)
+        future = (executor or get_import_executor()).submit(
+            run_import_job,
+            jobs=jobs,
+            tx_repo=tx_repo,
+            account=account,
+            job=job,
+            path=Path(tmp),
+        )
+    except Exception:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return job, future
+
+
+def run_import_job(
+    *,
+    jobs: ImportJobRepository,
+    tx_repo: TransactionRepository,
+    account: Account,
+    job: ImportJob,
+    path: Path,
+    batch_size: int | None = None,
+) -> None:
+    """
+    Exécution d'un job (thread worker) : progression et erreurs enregistrées après chaque lot.
+    """
+    def on_progress(result: ImportResult, new_errors: list[tuple[int, str]]) -> None:
+        jobs.record_progress(
+            job.id,
+            rows_parsed=result.rows_parsed,
+            imported=result.imported,
+            duplicates_skipped=result.duplicates_skipped,
+            errors_count=result.errors_count,
+            new_errors=new_errors,
+        )
+
+    try:
+        jobs.mark_running(job.id)
+        with path.open("rb") as raw:
+            source = open_source(job.format, open_upload_text(raw), account)
+            import_transactions(
+                tx_repo,
+                source.rows,
+                source.parse_row,
+                batch_size=batch_size or get_import_settings().batch_size,
+                on_progress=on_progress,
+                skip_duplicates=job.skip_duplicates,
+            )
+        jobs.finish(job.id, status=ImportJobStatus.SUCCEEDED)
+    except Exception as e:
+        # les lots déjà insérés restent en base (compteurs à jour), le job est marqué FAILED
+        logger.exception("Import job %s failed", job.id)
+        jobs.finish(job.id, status=ImportJobStatus.FAILED, message=str(e) or type(e).__name__)
+    finally:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import datetime as dt
+import logging
+from typing import Iterable
+
+from app.domain.instrument import Instrument, InstrumentKind
+from app.domain.price_point import PricePoint
+from app.engine.price_gaps import gap_ranges, missing_days
+from app.providers.stooq_provider import StooqEodPriceProvider, StooqUnavailable
+from app.providers.stooq_symbol_cache import StooqSymbolCache
+from app.repositories.instrument_repository import InstrumentRepository
+from app.repositories.price_repository import PriceRepository
+from app.services.update_prices_service import STOOQ_SYMBOL_CACHE_FILE
+from app.settings import get_settings
+
+
+log = logging.getLogger(__name__)
+
+WRITE_BATCH_SIZE = 1_000
+
+
+def backfill_prices(
+    *,
+    instrument_repo: InstrumentRepository,
+    price_repo: PriceRepository,
+    date_from: dt.date,
+    date_to: dt.date,
+    symbols: Iterable[str] | None = None,
+    max_workers: int = 4,
+    timeout_sec: int = 30,
+    retries: int = 3,
+    backoff_sec: float = 1.0,
+    stooq: StooqEodPriceProvider | None = None,
+) -> dict:
+    """
+    Historique journalier des STOCK / ETF (Stooq) sur [date_from, date_to], trous uniquement :
+    - jours ouvrés sans aucun prix en base => plages manquantes ;
+    - une requête d'historique par instrument couvrant la première à la dernière plage,
+      lue en streaming, seuls les jours manquants sont écrits (add_many par lots) ;
+    - les jours manquants que la source n'a pas renvoyés (fériés) sont mémorisés comme fermés
+      (add_closed_days) : ils ne relancent pas de requête aux passages suivants.
+    Les CRYPTO ne sont pas couvertes (pas d'historique CoinGecko ici) : comptées dans skipped.
+    """
+    if date_from > date_to:
+        raise ValueError("date_from must be <= date_to")
+
+    stq = stooq or StooqEodPriceProvider(
+        timeout_sec=timeout_sec,
+        retries=retries,
+        backoff_sec=backoff_sec,
+        symbol_cache=StooqSymbolCache(get_settings().data_dir / STOOQ_SYMBOL_CACHE_FILE),
+    )
+
+    wanted = {s.strip().upper() for s in symbols} if symbols is not None else None
+    instruments = [
+        i for i in instrument_repo.list()
+        if wanted is None or i.symbol.strip().upper() in wanted
+    ]
+    eligible = [i for i in instruments if i.kind in (InstrumentKind.STOCK, InstrumentKind.ETF)]
+
+    def backfill_one(inst: Instrument) -> tuple[int, bool]:
+        """(prix écrits, requête faite)"""
+        sym = inst.symbol.strip().upper()
+        known = price_repo.price_days(symbol=sym, date_from=date_from, date_to=date_to)
+        known |= price_repo.closed_days(symbol=sym, date_from=date_from, date_to=date_to)
+        missing = missing_days(known, date_from, date_to)
+        if not missing:
+            return 0, False
+
+        gaps = gap_ranges(missing)
+        todo = set(missing)
+        returned: set[dt.date] = set()
+        stored = 0
+        batch: list[PricePoint] = []
+        for pp in stq.iter_history(symbol=sym, date_from=gaps[0][0], date_to=gaps[-1][1], currency=inst.currency):
+            returned.add(pp.day)
+            if pp.day not in todo:
+                continue
+            batch.append(pp)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                stored += price_repo.add_many(batch)
+                batch = []
+        if batch:
+            stored += price_repo.add_many(batch)
+
+        # jours manquants antérieurs au dernier cours renvoyé : place fermée (férié, avant cotation).
+        # Après ce cours, le prix n'est peut-être pas encore publié : redemandé au prochain passage.
+        closed = [d for d in todo - returned if returned and d < max(returned)]
+        price_repo.add_closed_days(symbol=sym, days=closed)
+
+        log.info("backfill %s: %d gap(s), %d price(s) stored, %d closed day(s)", sym, len(gaps), stored, len(closed))
+        return stored, True
+
+    stored = 0
+    fetched = 0
+    failed: list[str] = []
+
+    if eligible:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(eligible))), thread_name_prefix="backfill") as pool:
+            futures = {inst.symbol: pool.submit(backfill_one, inst) for inst in eligible}
+            for sym, fut in futures.items():
+                try:
+                    n, requested = fut.result()
+                except StooqUnavailable:
+                    log.warning("backfill %s: Stooq unavailable", sym)
+                    failed.append(sym)
+                    continue
+                stored += n
+                fetched += int(requested)
+
+    return {
+        "date_from": date_from.isoformat(),
+        "date_to": date_to.isoformat(),
+        "instruments": len(eligible),
+        "fetched": fetched,
+        "up_to_date": len(eligible) - fetched - len(failed),
+        "stored": stored,
+        "skipped": len(instruments) - len(eligible),
+        "failed": sorted(failed),
+    }
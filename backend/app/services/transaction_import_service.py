@@ -0,0 +1,173 @@
+# app/services/transaction_import_service.py
+from __future__ import annotations
+
+import codecs
+from dataclasses import dataclass, field
+import io
+import logging
+from typing import BinaryIO, Callable, Iterable, TextIO, TypeVar
+
+from app.db import unit_of_work
+from app.domain.transaction import Transaction
+from app.domain.transaction_fingerprint import transaction_fingerprint
+from app.repositories.transaction_repository import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+Row = TypeVar("Row")
+
+# les séquences sont attribuées par le repo (add_many), cette valeur n'est jamais stockée
+PENDING_SEQUENCE = 1
+
+UPLOAD_ENCODINGS = ("utf-8-sig", "cp1252")  # cp1252 : fallback fréquent Excel FR
+UPLOAD_CHUNK_SIZE = 64 * 1024
+DEFAULT_BATCH_SIZE = 5_000
+MAX_ERRORS_KEPT = 100  # on compte toutes les erreurs mais on n'en garde que les premières
+
+
+@dataclass
+class ImportResult:
+    rows_parsed: int = 0
+    imported: int = 0
+    duplicates_skipped: int = 0
+    errors_count: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def add_error(self, msg: str) -> None:
+        self.errors_count += 1
+        if len(self.errors) < MAX_ERRORS_KEPT:
+            self.errors.append(msg)
+
+    def summary(self, *, preview: int) -> dict:
+        return {
+            "imported": self.imported,
+            "duplicates_skipped": self.duplicates_skipped,
+            "errors_count": self.errors_count,
+            "errors_preview": self.errors[:preview],
+        }
+
+
+# (résultat courant, erreurs (ligne, message) depuis le dernier appel)
+ProgressCallback = Callable[[ImportResult, list[tuple[int, str]]], None]
+
+
+def detect_encoding(raw: BinaryIO, *, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """
+    Premier encodage de UPLOAD_ENCODINGS qui décode tout le flux (décodage incrémental,
+    mémoire bornée). Le flux est rembobiné ; ValueError si aucun ne convient.
+    """
+    for encoding in UPLOAD_ENCODINGS:
+        raw.seek(0)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            while chunk := raw.read(chunk_size):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        raw.seek(0)
+        return encoding
+
+    raw.seek(0)
+    raise ValueError(
+        f"Decode error (utf-8/cp1252). Export CSV UTF-8 depuis Excel. First bytes: {raw.read(20)!r}"
+    )
+
+
+def open_upload_text(raw: BinaryIO) -> TextIO:
+    """
+    Vue texte (streaming) d'un upload binaire, à passer directement à `csv`.
+    """
+    return io.TextIOWrapper(raw, encoding=detect_encoding(raw), newline="")
+
+
+class DuplicateFilter:
+    """
+    Écarte les tx déjà en base, par empreinte et en comptant les occurrences :
+    si le fichier contient 3 fois la même tx et la base 2, seule la 3e est importée.
+    Une requête (tx_repo.fingerprint_counts) par lot.
+    """
+
+    def __init__(self, tx_repo: TransactionRepository) -> None:
+        self._repo = tx_repo
+        self._seen: dict[str, int] = {}  # occurrences dans le fichier
+        self._inserted: dict[str, int] = {}  # insérées par cet import (déjà comptées en base)
+
+    def new_only(self, batch: list[Transaction]) -> list[Transaction]:
+        fps = [transaction_fingerprint(t) for t in batch]
+        stored = self._repo.fingerprint_counts(fps)
+        preexisting = {fp: stored.get(fp, 0) - self._inserted.get(fp, 0) for fp in set(fps)}
+
+        kept: list[Transaction] = []
+        for tx, fp in zip(batch, fps):
+            occurrence = self._seen.get(fp, 0)
+            self._seen[fp] = occurrence + 1
+            if occurrence < preexisting[fp]:
+                continue
+            kept.append(tx)
+            self._inserted[fp] = self._inserted.get(fp, 0) + 1
+        return kept
+
+
+def import_transactions(
+    tx_repo: TransactionRepository,
+    rows: Iterable[tuple[int, Row]],
+    parse_row: Callable[[Row], Transaction | None],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_progress: ProgressCallback | None = None,
+    skip_duplicates: bool = False,
+) -> ImportResult:
+    """
+    Import en streaming :
+    - chaque ligne est validée (parse_row -> Transaction, None = ligne ignorée),
+      les lignes invalides sont reportées "line N: ..." ;
+    - les lignes valides sont insérées par lots de `batch_size`, mémoire bornée ;
+      une transaction SQL par lot (commit à la fin du lot, même appelé depuis une requête HTTP) :
+      en cas d'échec, les lots déjà importés restent en base ;
+    - on_progress est appelé après chaque lot (et à la fin) avec toutes les erreurs du lot ;
+    - skip_duplicates : les tx déjà présentes en base (même empreinte) ne sont pas réimportées.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    result = ImportResult()
+    batch: list[Transaction] = []
+    batch_errors: list[tuple[int, str]] = []
+    duplicates = DuplicateFilter(tx_repo) if skip_duplicates else None
+
+    def flush() -> None:
+        nonlocal batch, batch_errors
+        if batch:
+            # unité de travail dédiée au lot, y compris sous celle d'une requête HTTP :
+            # pas de transaction (ni de verrous) ouverte pendant tout l'upload
+            with unit_of_work():
+                if duplicates is not None:
+                    kept = duplicates.new_only(batch)
+                    result.duplicates_skipped += len(batch) - len(kept)
+                    batch = kept
+                if batch:
+                    result.imported += len(tx_repo.add_many(batch))
+        if on_progress is not None:
+            on_progress(result, batch_errors)
+        batch, batch_errors = [], []
+
+    for line_no, row in rows:
+        result.rows_parsed += 1
+        try:
+            tx = parse_row(row)
+        except Exception as e:
+            msg = f"line {line_no}: {e}"
+            result.add_error(msg)
+            batch_errors.append((line_no, str(e)))
+            logger.warning("Import error %s", msg)
+        else:
+            if tx is not None:
+                batch.append(tx)
+
+        if len(batch) >= batch_size or len(batch_errors) >= batch_size:
+            flush()
+
+    if batch or batch_errors or on_progress is not None:
+        flush()
+    return result
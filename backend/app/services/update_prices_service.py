@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import datetime as dt
 import logging
+import threading
+from typing import Callable
 
 from app.domain.instrument import InstrumentKind
 from app.domain.money import Currency
+from app.domain.price_point import PricePoint
 from app.repositories.instrument_repository import InstrumentRepository
 from app.repositories.price_repository import PriceRepository
 from app.providers.coingecko_provider import CoinGeckoPriceProvider
 from app.providers.stooq_provider import StooqEodPriceProvider
+from app.providers.stooq_symbol_cache import StooqSymbolCache
+from app.settings import get_settings
 
 
 log = logging.getLogger(__name__)
 
+# requêtes simultanées max par fournisseur (rate limits)
+DEFAULT_PROVIDER_CONCURRENCY: dict[str, int] = {"coingecko": 4, "stooq": 8}
+
+# résolution des suffixes Stooq (AAPL -> AAPL.US), dans data_dir
+STOOQ_SYMBOL_CACHE_FILE = "stooq_symbols.json"
+
 
 def update_prices_for_day(
     *,
@@ -22,35 +34,94 @@ def update_prices_for_day(
     timeout_sec: int = 15,
     retries: int = 3,
     backoff_sec: float = 1.0,
+    max_workers: int = 16,
+    provider_concurrency: dict[str, int] | None = None,
+    deadline_sec: float = 60.0,
+    coingecko: CoinGeckoPriceProvider | None = None,
+    stooq: StooqEodPriceProvider | None = None,
 ) -> dict:
-    cg = CoinGeckoPriceProvider(timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
-    stooq = StooqEodPriceProvider(timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
+    """
+    Fetch concurrent (pool de threads borné, sémaphore par fournisseur) puis écriture en un lot.
+    Les cryptos sont pricées ensemble (CoinGecko fetch_many : une requête par paquet d'ids).
+    Les fetchs non terminés à `deadline_sec` sont abandonnés (comptés dans skipped et timed_out).
+    """
+    cg = coingecko or CoinGeckoPriceProvider(timeout_sec=timeout_sec, retries=retries, backoff_sec=backoff_sec)
+    stq = stooq or StooqEodPriceProvider(
+        timeout_sec=timeout_sec,
+        retries=retries,
+        backoff_sec=backoff_sec,
+        symbol_cache=StooqSymbolCache(get_settings().data_dir / STOOQ_SYMBOL_CACHE_FILE),
+    )
+
+    limits = {**DEFAULT_PROVIDER_CONCURRENCY, **(provider_concurrency or {})}
+    semaphores = {name: threading.BoundedSemaphore(n) for name, n in limits.items()}
+
+    Fetch = Callable[[], list[PricePoint]]
 
-    stored = 0
+    def limited(provider: str, fetch: Fetch) -> Fetch:
+        def run() -> list[PricePoint]:
+            with semaphores[provider]:
+                return fetch()
+        return run
+
+    def stooq_fetch(sym: str, currency: Currency) -> Fetch:
+        def run() -> list[PricePoint]:
+            pp = stq.fetch(symbol=sym, day_utc=day_utc, currency=currency)
+            return [] if pp is None else [pp]
+        return limited("stooq", run)
+
+    # (symboles couverts, fetch) ; toutes les cryptos en un seul fetch batch CoinGecko
+    tasks: list[tuple[list[str], Fetch]] = []
+    crypto: dict[str, Currency] = {}
     skipped = 0
 
     for inst in instrument_repo.list():
         sym = inst.symbol.strip().upper()
 
         if inst.kind == InstrumentKind.CRYPTO:
-            pp = cg.fetch(symbol=sym, day_utc=day_utc, vs=inst.currency)
-            if pp is None:
-                skipped += 1
-                continue
-            price_repo.add(pp)
-            stored += 1
-            continue
-
-        if inst.kind in (InstrumentKind.STOCK, InstrumentKind.ETF):
-            pp = stooq.fetch(symbol=sym, day_utc=day_utc, currency=inst.currency)
-            if pp is None:
-                skipped += 1
-                continue
-            price_repo.add(pp)
-            stored += 1
-            continue
-
-        # OTHER: ignore
-        skipped += 1
-
-    return {"day": day_utc.isoformat(), "stored": stored, "skipped": skipped}
+            crypto[sym] = inst.currency
+        elif inst.kind in (InstrumentKind.STOCK, InstrumentKind.ETF):
+            tasks.append(([sym], stooq_fetch(sym, inst.currency)))
+        else:
+            # OTHER: ignore
+            skipped += 1
+
+    if crypto:
+        tasks.append((
+            list(crypto),
+            limited("coingecko", lambda: list(cg.fetch_many(symbols=crypto, day_utc=day_utc).values())),
+        ))
+
+    points: list[PricePoint] = []
+    timed_out = 0
+
+    if tasks:
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))), thread_name_prefix="prices")
+        try:
+            futures: dict[Future, list[str]] = {pool.submit(fetch): symbols for symbols, fetch in tasks}
+            done, not_done = wait(futures, timeout=deadline_sec)
+
+            for fut in done:
+                try:
+                    fetched = fut.result()
+                except Exception:
+                    log.exception("price fetch failed for %s", ", ".join(futures[fut]))
+                    fetched = []
+                points.extend(fetched)
+                skipped += len(futures[fut]) - len(fetched)
+
+            for fut in not_done:
+                fut.cancel()
+                log.warning(
+                    "price fetch for %s exceeded the %.0fs deadline", ", ".join(futures[fut]), deadline_sec
+                )
+                timed_out += len(futures[fut])
+            skipped += timed_out
+        finally:
+            # ne pas attendre les fetchs encore en cours (retries / backoff) au-delà de la deadline
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    points.sort(key=lambda p: p.symbol)
+    stored = price_repo.add_many(points)
+
+    return {"day": day_utc.isoformat(), "stored": stored, "skipped": skipped, "timed_out": timed_out}
@@ -23,3 +23,85 @@ def get_settings() -> Settings:
     # Le dossier data peut être créé automatiquement (ça ne viole pas le "strict")
     p.mkdir(parents=True, exist_ok=True)
     return Settings(data_dir=p)
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    # "auto" | "decimal" | "numpy"
+    timeseries_engine: str
+    # en "auto", seuil (nb de tx) à partir duquel le moteur numpy est utilisé
+    numpy_min_transactions: int
+
+
+def get_engine_settings() -> EngineSettings:
+    engine = (os.getenv("DASHMONEY_TIMESERIES_ENGINE") or "auto").strip().lower()
+    if engine not in ("auto", "decimal", "numpy"):
+        raise ValueError(f"invalid DASHMONEY_TIMESERIES_ENGINE '{engine}' (auto|decimal|numpy)")
+
+    threshold = int(os.getenv("DASHMONEY_NUMPY_MIN_TRANSACTIONS") or "20000")
+    return EngineSettings(timeseries_engine=engine, numpy_min_transactions=threshold)
+
+
+@dataclass(frozen=True)
+class ImportSettings:
+    # threads dédiés aux imports en arrière-plan (jobs)
+    workers: int
+    # nb de tx insérées par lot (une transaction SQL par lot)
+    batch_size: int
+
+
+def get_import_settings() -> ImportSettings:
+    workers = int(os.getenv("DASHMONEY_IMPORT_WORKERS") or "2")
+    batch_size = int(os.getenv("DASHMONEY_IMPORT_BATCH_SIZE") or "5000")
+    if workers < 1 or batch_size < 1:
+        raise ValueError("DASHMONEY_IMPORT_WORKERS and DASHMONEY_IMPORT_BATCH_SIZE must be >= 1")
+    return ImportSettings(workers=workers, batch_size=batch_size)
+
+
+@dataclass(frozen=True)
+class DbPoolSettings:
+    # connexions max par process et par engine = pool_size + max_overflow
+    # (x workers uvicorn, x2 si le moteur asyncio est utilisé) : à comparer à max_connections
+    pool_size: int
+    max_overflow: int
+    # secondes d'attente d'une connexion libre avant erreur
+    pool_timeout: float
+    # secondes avant recyclage d'une connexion (-1 : jamais)
+    pool_recycle: int
+    # SELECT 1 avant chaque checkout (connexions coupées par Postgres / un proxy)
+    pre_ping: bool
+
+
+def get_db_pool_settings() -> DbPoolSettings:
+    pool_size = int(os.getenv("DASHMONEY_DB_POOL_SIZE") or "5")
+    max_overflow = int(os.getenv("DASHMONEY_DB_MAX_OVERFLOW") or "10")
+    pool_timeout = float(os.getenv("DASHMONEY_DB_POOL_TIMEOUT") or "30")
+    pool_recycle = int(os.getenv("DASHMONEY_DB_POOL_RECYCLE") or "1800")
+    pre_ping = (os.getenv("DASHMONEY_DB_POOL_PRE_PING") or "true").strip().lower() in ("1", "true", "yes", "on")
+    if pool_size < 1 or max_overflow < 0 or pool_timeout <= 0:
+        raise ValueError(
+            "DASHMONEY_DB_POOL_SIZE must be >= 1, DASHMONEY_DB_MAX_OVERFLOW >= 0 and DASHMONEY_DB_POOL_TIMEOUT > 0"
+        )
+    return DbPoolSettings(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pre_ping=pre_ping,
+    )
+
+
+@dataclass(frozen=True)
+class QueryStatsSettings:
+    # warning si une requête HTTP exécute plus de N requêtes SQL (None : désactivé)
+    warn_threshold: int | None
+
+
+def get_query_stats_settings() -> QueryStatsSettings:
+    raw = (os.getenv("DASHMONEY_QUERY_WARN_THRESHOLD") or "").strip()
+    if not raw:
+        return QueryStatsSettings(warn_threshold=None)
+    threshold = int(raw)
+    if threshold < 1:
+        raise ValueError("DASHMONEY_QUERY_WARN_THRESHOLD must be >= 1")
+    return QueryStatsSettings(warn_threshold=threshold)
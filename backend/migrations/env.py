@@ -44,7 +44,8 @@ from app.repositories.sql_instrument_repository import InstrumentRow  # noqa: F4
 from app.repositories.sql_trade_repository import TradeRow  # noqa: F401
 from app.repositories.sql_portfolio_repository import PortfolioRow  # noqa: F401
 from app.repositories.sql_portfolio_snapshot_repository import PortfolioSnapshotRow  # noqa: F401
-from app.repositories.sql_price_repository import PricePointRow  # noqa: F401
+from app.repositories.sql_price_repository import PricePointRow, PriceClosedDayRow  # noqa: F401
+from app.repositories.sql_import_job_repository import ImportJobRow, ImportJobErrorRow  # noqa: F401
 
 
 
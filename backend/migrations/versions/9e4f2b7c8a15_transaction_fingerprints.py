@@ -0,0 +1,43 @@
+"""transaction fingerprints (import dedup)
+
+Revision ID: 9e4f2b7c8a15
+Revises: 7c1e5a9d3b42
+Create Date: 2026-10-17 14:03:51.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.repositories.sql_transaction_repository import backfill_fingerprints
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f2b7c8a15'
+down_revision: Union[str, Sequence[str], None] = '7c1e5a9d3b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transactions', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    # tx existantes remplies ici : sinon skip_duplicates réimporterait les recouvrements en silence.
+    # Avant l'index : pas de maintenance d'index pendant les UPDATE.
+    # (mode --sql : pas de connexion, lancer scripts/backfill_transaction_fingerprints.py ensuite)
+    if not context.is_offline_mode():
+        for _ in backfill_fingerprints(op.get_bind()):
+            pass
+    op.create_index(op.f('ix_transactions_fingerprint'), 'transactions', ['fingerprint'], unique=False)
+
+    op.add_column('import_jobs', sa.Column('skip_duplicates', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('import_jobs', sa.Column('duplicates_skipped', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('import_jobs', 'duplicates_skipped')
+    op.drop_column('import_jobs', 'skip_duplicates')
+    op.drop_index(op.f('ix_transactions_fingerprint'), table_name='transactions')
+    op.drop_column('transactions', 'fingerprint')
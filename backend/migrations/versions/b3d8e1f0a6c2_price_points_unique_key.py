@@ -0,0 +1,44 @@
+"""price_points unique (symbol, day, source)
+
+Revision ID: b3d8e1f0a6c2
+Revises: 9e4f2b7c8a15
+Create Date: 2026-10-17 16:22:40.518903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8e1f0a6c2'
+down_revision: Union[str, Sequence[str], None] = '9e4f2b7c8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # les doublons existants doivent être compactés avant (scripts/compact_price_points.py)
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT COUNT(*) FROM ("
+            " SELECT 1 FROM price_points GROUP BY symbol, day, source HAVING COUNT(*) > 1"
+            ") d"
+        )
+    ).scalar_one()
+    if duplicates:
+        raise RuntimeError(
+            f"price_points has {duplicates} duplicated (symbol, day, source) keys: "
+            "run scripts/compact_price_points.py first"
+        )
+
+    op.create_unique_constraint(
+        'uq_price_points_symbol_day_source', 'price_points', ['symbol', 'day', 'source']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_price_points_symbol_day_source', 'price_points', type_='unique')
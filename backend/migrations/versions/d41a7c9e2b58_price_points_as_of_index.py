@@ -0,0 +1,33 @@
+"""price_points (symbol, day DESC, captured_at DESC) index for as-of lookups
+
+Revision ID: d41a7c9e2b58
+Revises: b3d8e1f0a6c2
+Create Date: 2026-10-17 17:05:12.334871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7c9e2b58'
+down_revision: Union[str, Sequence[str], None] = 'b3d8e1f0a6c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_price_points_symbol_day_desc',
+        'price_points',
+        ['symbol', sa.text('day DESC'), sa.text('captured_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_price_points_symbol_day_desc', table_name='price_points')
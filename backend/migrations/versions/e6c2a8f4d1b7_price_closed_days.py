@@ -0,0 +1,34 @@
+"""price_closed_days: trading days without a quote (holidays), skipped by backfills
+
+Revision ID: e6c2a8f4d1b7
+Revises: d41a7c9e2b58
+Create Date: 2026-10-17 19:42:08.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c2a8f4d1b7'
+down_revision: Union[str, Sequence[str], None] = 'd41a7c9e2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'price_closed_days',
+        sa.Column('symbol', sa.String(length=32), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(['symbol'], ['instruments.symbol'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('symbol', 'day'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('price_closed_days')
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+
+from app.repositories.sql_instrument_repository import SqlInstrumentRepository
+from app.repositories.sql_price_repository import SqlPriceRepository
+from app.services.price_backfill_service import backfill_prices
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill daily price history (Stooq), missing days only.")
+    parser.add_argument("--from", dest="date_from", type=dt.date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="date_to", type=dt.date.fromisoformat, default=None, help="default: today UTC")
+    parser.add_argument("--symbol", action="append", default=None, help="repeatable; default: all STOCK / ETF")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    res = backfill_prices(
+        instrument_repo=SqlInstrumentRepository(),
+        price_repo=SqlPriceRepository(),
+        date_from=args.date_from,
+        date_to=args.date_to or dt.datetime.now(dt.timezone.utc).date(),
+        symbols=args.symbol,
+        max_workers=args.workers,
+    )
+    print(res)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
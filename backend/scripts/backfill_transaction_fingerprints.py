@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import argparse
+
+from app.db import new_session
+from app.repositories.sql_transaction_repository import backfill_fingerprints
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fill transactions.fingerprint (import dedup) by batches.")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--all", action="store_true", help="recompute every row (after a normalization change)")
+    args = parser.parse_args()
+
+    total = 0
+    with new_session() as s:
+        for written in backfill_fingerprints(s, batch_size=args.batch_size, recompute=args.all):
+            # chaque lot est une transaction courte
+            s.commit()
+            total += written
+            print(f"{total} transactions updated")
+
+    print(f"Done. {total} fingerprints written.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import time
+from decimal import Decimal
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame
+from app.engine.account_timeseries import compute_timeseries
+from app.engine.net_worth import compute_net_worth_timeseries_grouped
+from app.engine.timeseries_engine import numpy_available
+
+
+def _make_dataset(n_accounts: int, n_txs: int, date_from: dt.date, days: int, seed: int):
+    rnd = random.Random(seed)
+    types = list(AccountType)
+
+    accounts = [
+        Account(
+            id=f"acc_{i:03d}",
+            name=f"Account {i}",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney(amount=Decimal("1000.00"), currency=Currency.EUR),
+            opened_on=date_from,
+            account_type=types[i % len(types)],
+        )
+        for i in range(n_accounts)
+    ]
+
+    created_at = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    txs: list[Transaction] = []
+    for i in range(n_txs):
+        cents = rnd.randint(1, 50_000)
+        if rnd.random() < 0.3:
+            kind, amount = TransactionKind.INCOME, Decimal(cents).scaleb(-2)
+        else:
+            kind, amount = TransactionKind.EXPENSE, Decimal(-cents).scaleb(-2)
+        txs.append(
+            Transaction.create(
+                account_id=accounts[rnd.randrange(n_accounts)].id,
+                date=date_from + dt.timedelta(days=rnd.randrange(days)),
+                sequence=i + 1,
+                amount=SignedMoney(amount=amount, currency=Currency.EUR),
+                kind=kind,
+                category="bench",
+                created_at=created_at,
+            )
+        )
+
+    return accounts, txs
+
+
+def _legacy_timeseries_grouped(*, accounts, transactions, date_from, date_to, granularity):
+    """
+    Ancienne stratégie : filtre O(comptes × tx), répétée pour le total puis pour chaque AccountType.
+    """
+    def aggregate(group_accounts):
+        aggregated: dict[str, dict] = {}
+        for account in group_accounts:
+            account_txs = [t for t in transactions if t.account_id == account.id]
+            points = compute_timeseries(
+                opening_balance=account.opening_balance,
+                transactions=account_txs,
+                date_from=date_from,
+                date_to=date_to,
+                granularity=granularity,
+            )
+            for p in points:
+                agg = aggregated.setdefault(
+                    p["bucket"],
+                    {k: Decimal("0") for k in ("income", "expense", "net", "balance_start", "balance_end")},
+                )
+                for k in agg:
+                    agg[k] += p[k]
+        return [{"bucket": b, **aggregated[b]} for b in sorted(aggregated)]
+
+    total = aggregate(accounts)
+    groups = {}
+    for t in AccountType:
+        group_accounts = [a for a in accounts if a.account_type == t]
+        if group_accounts:
+            groups[t.value] = aggregate(group_accounts)
+    return total, groups
+
+
+def _timed(fn, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark net-worth timeseries (legacy vs single-pass partition).")
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--transactions", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--granularity", default="monthly")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    date_from = dt.date(2025, 1, 1)
+    date_to = date_from + dt.timedelta(days=args.days - 1)
+
+    t0 = time.perf_counter()
+    accounts, txs = _make_dataset(args.accounts, args.transactions, date_from, args.days, args.seed)
+    print(f"dataset: {len(accounts)} accounts, {len(txs)} transactions ({time.perf_counter() - t0:.1f}s to build)")
+
+    kwargs = dict(
+        accounts=accounts,
+        transactions=txs,
+        date_from=date_from,
+        date_to=date_to,
+        granularity=args.granularity,
+    )
+
+    legacy_s, legacy = _timed(lambda: _legacy_timeseries_grouped(**kwargs), args.repeat)
+    new_s, new = _timed(lambda: compute_net_worth_timeseries_grouped(engine="decimal", **kwargs), args.repeat)
+
+    if legacy != new:
+        raise SystemExit("results differ between legacy and single-pass engines")
+
+    print(f"legacy (filter per account x per group): {legacy_s:.2f}s")
+    print(f"single-pass partition:                  {new_s:.2f}s")
+    print(f"speedup: x{legacy_s / new_s:.1f}")
+
+    frame = TransactionFrame.from_transactions(txs)
+    frame_kwargs = {**kwargs, "transactions": frame}
+    frame_s, frame_result = _timed(
+        lambda: compute_net_worth_timeseries_grouped(engine="decimal", **frame_kwargs), args.repeat
+    )
+    if frame_result != new:
+        raise SystemExit("results differ between list and TransactionFrame inputs")
+    print(f"TransactionFrame (decimal engine):      {frame_s:.2f}s (x{legacy_s / frame_s:.1f})")
+
+    if numpy_available():
+        np_s, np_result = _timed(lambda: compute_net_worth_timeseries_grouped(engine="numpy", **kwargs), args.repeat)
+        if np_result != new:
+            raise SystemExit("results differ between decimal and numpy engines")
+        print(f"numpy engine:                           {np_s:.2f}s (x{legacy_s / np_s:.1f})")
+
+        np_s, np_result = _timed(
+            lambda: compute_net_worth_timeseries_grouped(engine="numpy", **frame_kwargs), args.repeat
+        )
+        if np_result != new:
+            raise SystemExit("results differ between decimal and numpy engines (TransactionFrame)")
+        print(f"numpy engine + TransactionFrame:        {np_s:.2f}s (x{legacy_s / np_s:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+from pathlib import Path
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.error import URLError
+from urllib.request import urlopen
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# exécuté dans un interpréteur neuf : import de l'app, lifespan (vérif base), première requête
+_CHILD = """
+import json, time
+t0 = time.perf_counter()
+from app.api.main import app
+import_s = time.perf_counter() - t0
+from fastapi.testclient import TestClient  # httpx : hors mesure
+t1 = time.perf_counter()
+with TestClient(app) as client:
+    t2 = time.perf_counter()
+    status = client.get({path!r}).status_code
+    t3 = time.perf_counter()
+print(json.dumps({{"import": import_s, "startup": t2 - t1, "first_request": t3 - t2, "status": status}}))
+"""
+
+
+def _env() -> dict[str, str]:
+    if not os.getenv("DASHMONEY_DATABASE_URL"):
+        raise SystemExit("DASHMONEY_DATABASE_URL is required")
+    return {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+
+
+def _run_in_process(path: str) -> dict[str, float]:
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(path=path)],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    res = json.loads(out.stdout.strip().splitlines()[-1])
+    if res.pop("status") != 200:
+        raise SystemExit(f"GET {path} did not return 200")
+    return res | {"total": time.perf_counter() - t0}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _run_uvicorn(path: str, timeout_sec: float, command: list[str]) -> dict[str, float]:
+    """
+    Cas systemd : lancement de uvicorn jusqu'à la première réponse 200 (sondage toutes les 5 ms).
+    `command` : exécutable lancé par l'unité (ex: <venv>/bin/uvicorn, ou poetry run uvicorn).
+    """
+    port = _free_port()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [*command, "app.api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=_env(),
+    )
+    try:
+        while time.perf_counter() - t0 < timeout_sec:
+            if proc.poll() is not None:
+                raise SystemExit(f"uvicorn exited with code {proc.returncode}")
+            try:
+                with urlopen(f"http://127.0.0.1:{port}{path}", timeout=1) as resp:
+                    if resp.status == 200:
+                        return {"total": time.perf_counter() - t0}
+            except (URLError, ConnectionError):
+                time.sleep(0.005)
+        raise SystemExit(f"no answer from uvicorn after {timeout_sec:.0f}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark API cold start (import, startup, first request).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--path", default="/health", help="first request")
+    parser.add_argument("--uvicorn", action="store_true", help="time a real uvicorn process instead of TestClient")
+    parser.add_argument(
+        "--uvicorn-cmd",
+        default=None,
+        help='with --uvicorn, command to start uvicorn (default: "python -m uvicorn"), e.g. "$DASHMONEY_VENV/bin/uvicorn"',
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    command = shlex.split(args.uvicorn_cmd) if args.uvicorn_cmd else [sys.executable, "-m", "uvicorn"]
+    runs = [
+        _run_uvicorn(args.path, args.timeout, command) if args.uvicorn else _run_in_process(args.path)
+        for _ in range(args.repeat)
+    ]
+
+    print(f"{args.repeat} cold start(s), GET {args.path}" + (" (uvicorn)" if args.uvicorn else ""))
+    for key in runs[0]:
+        values = [r[key] * 1000 for r in runs]
+        print(f"{key:<14} median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
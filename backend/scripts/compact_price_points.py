@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import delete, func, select
+
+from app.db import new_session
+from app.repositories.sql_price_repository import PricePointRow
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Remove duplicated price_points (same symbol, day, source), keeping the latest capture."
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    with new_session() as s:
+        symbols = s.execute(select(PricePointRow.symbol).distinct().order_by(PricePointRow.symbol)).scalars().all()
+
+    total = 0
+    for symbol in symbols:
+        # une transaction courte par symbole
+        with new_session() as s:
+            ranked = (
+                select(
+                    PricePointRow.id,
+                    func.row_number()
+                    .over(
+                        partition_by=(PricePointRow.day, PricePointRow.source),
+                        order_by=(PricePointRow.captured_at.desc(), PricePointRow.id.desc()),
+                    )
+                    .label("rn"),
+                )
+                .where(PricePointRow.symbol == symbol)
+                .subquery()
+            )
+            stale = select(ranked.c.id).where(ranked.c.rn > 1)
+
+            if args.dry_run:
+                n = s.execute(select(func.count()).select_from(stale.subquery())).scalar_one()
+            else:
+                n = s.execute(delete(PricePointRow).where(PricePointRow.id.in_(stale))).rowcount or 0
+                s.commit()
+
+        if n:
+            print(f"{symbol}: {n} duplicate(s){' (dry run)' if args.dry_run else ' removed'}")
+        total += n
+
+    print(f"Done. {total} duplicate price point(s){' found' if args.dry_run else ' removed'}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -18,9 +18,9 @@ def main() -> int:
     src = JsonlPriceRepository(prices_path=src_path)
     dst = SqlPriceRepository()
 
+    # upsert en masse : relancer la migration ne crée pas de doublons
     items = src.list()
-    for p in items:
-        dst.add(p)
+    dst.add_many(items)
 
     print({"migrated": len(items), "from": str(src_path)})
     return 0
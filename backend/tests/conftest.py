@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+_SERVER_TIMING_DB = re.compile(r'\bdb;dur=[0-9.]+;desc="(\d+) queries"')
+
+
+def query_count(response) -> int:
+    """
+    Requêtes SQL d'une réponse de l'API (en-tête Server-Timing posé par QueryStatsMiddleware).
+    """
+    match = _SERVER_TIMING_DB.search(response.headers.get("server-timing", ""))
+    if match is None:
+        raise AssertionError("no db entry in Server-Timing (QueryStatsMiddleware missing?)")
+    return int(match.group(1))
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    assert_max_queries(client.get(...), 3) : l'endpoint a exécuté au plus 3 requêtes SQL
+    (garde-fou contre les N+1).
+    """
+
+    def check(response, max_queries: int) -> int:
+        n = query_count(response)
+        assert n <= max_queries, f"{response.request.method} {response.request.url.path}: {n} SQL queries > {max_queries}"
+        return n
+
+    return check
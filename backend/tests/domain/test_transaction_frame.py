@@ -0,0 +1,78 @@
+import datetime as dt
+from decimal import Decimal
+
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import NO_SUBCATEGORY, TransactionFrame, TransactionFrameBuilder
+
+
+def _tx(account_id: str, day: int, amount: str, kind: TransactionKind, category: str, sub: str | None = None):
+    return Transaction.create(
+        account_id=account_id,
+        date=dt.date(2026, 1, day),
+        sequence=day,
+        amount=SignedMoney.from_str(amount, Currency.EUR),
+        kind=kind,
+        category=category,
+        subcategory=sub,
+    )
+
+
+TXS = [
+    _tx("a", 1, "100.00", TransactionKind.INCOME, "Salaire"),
+    _tx("b", 2, "-12.34", TransactionKind.EXPENSE, "Courses", "Bio"),
+    _tx("a", 3, "-5.00", TransactionKind.EXPENSE, "Courses"),
+    _tx("a", 4, "-0.01", TransactionKind.TRANSFER, "Virement"),
+]
+
+
+def test_from_transactions_dictionary_encodes_columns():
+    f = TransactionFrame.from_transactions(TXS)
+
+    assert len(f) == 4
+    assert f.account_ids == ["a", "b"]
+    assert f.categories == ["Salaire", "Courses", "Virement"]
+    assert f.subcategories == ["Bio"]
+    assert list(f.category_codes) == [0, 1, 1, 2]
+    assert list(f.subcategory_codes) == [NO_SUBCATEGORY, 0, NO_SUBCATEGORY, NO_SUBCATEGORY]
+    assert list(f.cents) == [10000, -1234, -500, -1]
+    assert f.currencies == [Currency.EUR]
+
+    assert f.amount(1) == Decimal("-12.34")
+    assert f.kind(3) == TransactionKind.TRANSFER
+    assert f.date(2) == dt.date(2026, 1, 3)
+    assert f.account_id(1) == "b"
+
+
+def test_builder_accepts_raw_row_values():
+    b = TransactionFrameBuilder()
+    # valeurs telles que renvoyées par SQL : Numeric(24, 10), kind/currency en str
+    b.append(
+        account_id="a",
+        date=dt.date(2026, 1, 1),
+        sequence=1,
+        amount=Decimal("-1.2350000000"),
+        currency="EUR",
+        kind="EXPENSE",
+        category="c",
+        subcategory=None,
+    )
+    f = b.build()
+
+    assert list(f.cents) == [-124]  # ROUND_HALF_UP, comme SignedMoney
+    assert f.kind(0) == TransactionKind.EXPENSE
+
+
+def test_partition_and_between_share_dictionaries():
+    f = TransactionFrame.from_transactions(TXS)
+
+    parts = f.partition_by_account()
+    assert {k: len(v) for k, v in parts.items()} == {"a": 3, "b": 1}
+    assert parts["a"].categories is f.categories
+    assert list(parts["a"].cents) == [10000, -500, -1]
+
+    window = f.between(dt.date(2026, 1, 2), dt.date(2026, 1, 3))
+    assert [window.account_id(i) for i in range(len(window))] == ["b", "a"]
+    assert f.between(None, None) is f
+    assert len(TransactionFrame.empty()) == 0
@@ -0,0 +1,78 @@
+import datetime as dt
+from decimal import Decimal
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.engine.account_balance import BalanceIndex, build_balance_indexes, compute_balance
+from app.engine.net_worth import compute_net_worth, compute_net_worth_grouped
+
+
+def eur(s: str) -> SignedMoney:
+    return SignedMoney.from_str(s, Currency.EUR)
+
+
+def _tx(account_id: str, date: dt.date, seq: int, amount: str, kind: TransactionKind) -> Transaction:
+    return Transaction.create(
+        account_id=account_id,
+        date=date,
+        sequence=seq,
+        amount=eur(amount),
+        kind=kind,
+        category="cat",
+    )
+
+
+def _account(account_id: str, opening: str, account_type: AccountType = AccountType.CHECKING) -> Account:
+    return Account(
+        id=account_id,
+        name=account_id,
+        currency=Currency.EUR,
+        opening_balance=eur(opening),
+        opened_on=dt.date(2020, 1, 1),
+        account_type=account_type,
+    )
+
+
+TXS = [
+    _tx("a", dt.date(2026, 1, 3), 1, "-20.00", TransactionKind.EXPENSE),
+    _tx("a", dt.date(2026, 1, 1), 1, "100.00", TransactionKind.INCOME),
+    _tx("a", dt.date(2026, 1, 1), 2, "-5.50", TransactionKind.EXPENSE),
+    _tx("b", dt.date(2026, 1, 2), 1, "300.00", TransactionKind.TRANSFER),
+]
+
+
+def test_balance_index_sum_at_dates():
+    index = BalanceIndex.from_transactions([t for t in TXS if t.account_id == "a"])
+
+    assert index.sum_at(dt.date(2025, 12, 31)) == (Decimal("0"), 0)
+    assert index.sum_at(dt.date(2026, 1, 1)) == (Decimal("94.50"), 2)
+    assert index.sum_at(dt.date(2026, 1, 2)) == (Decimal("94.50"), 2)
+    assert index.sum_at(dt.date(2026, 1, 3)) == (Decimal("74.50"), 3)
+    assert index.sum_at(None) == (Decimal("74.50"), 3)
+
+
+def test_compute_balance_with_index_matches_list():
+    txs = [t for t in TXS if t.account_id == "a"]
+    index = BalanceIndex.from_transactions(txs)
+
+    for at in (None, dt.date(2025, 1, 1), dt.date(2026, 1, 1), dt.date(2026, 1, 3)):
+        assert compute_balance(opening_balance=eur("10"), transactions=txs, at=at) == compute_balance(
+            opening_balance=eur("10"), at=at, index=index
+        )
+
+
+def test_net_worth_with_shared_indexes():
+    accounts = [_account("a", "10.00"), _account("b", "0.00", AccountType.SAVINGS), _account("c", "1.00")]
+    indexes = build_balance_indexes(TXS)
+
+    assert set(indexes) == {"a", "b"}
+
+    nw = compute_net_worth(accounts=accounts, at=dt.date(2026, 1, 2), indexes=indexes)
+    assert nw.amount == Decimal("405.50")  # 10 + 94.50 + 300 + 1
+    assert nw == compute_net_worth(accounts=accounts, transactions=TXS, at=dt.date(2026, 1, 2))
+
+    groups = compute_net_worth_grouped(accounts=accounts, at=None, indexes=indexes)
+    assert groups["CHECKING"].amount == Decimal("85.50")
+    assert groups["SAVINGS"].amount == Decimal("300.00")
@@ -0,0 +1,79 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.engine.account_timeseries import _bucket_label, compute_timeseries, iter_buckets
+
+
+def _day_walk_labels(g: str, date_from: dt.date, date_to: dt.date) -> list[str]:
+    # référence : ancienne marche jour par jour
+    labels: list[str] = []
+    cur = date_from
+    while cur <= date_to:
+        b = _bucket_label(g, cur)
+        if not labels or labels[-1] != b:
+            labels.append(b)
+        cur += dt.timedelta(days=1)
+    return labels
+
+
+@pytest.mark.parametrize("g", ["daily", "weekly", "monthly", "yearly"])
+@pytest.mark.parametrize(
+    "date_from,date_to",
+    [
+        (dt.date(2020, 12, 28), dt.date(2021, 1, 10)),  # semaine ISO à cheval sur l'année
+        (dt.date(2024, 2, 15), dt.date(2024, 3, 1)),  # 29 février
+        (dt.date(2019, 6, 30), dt.date(2026, 1, 1)),
+        (dt.date(2026, 1, 1), dt.date(2026, 1, 1)),
+    ],
+)
+def test_iter_buckets_matches_day_walk(g, date_from, date_to):
+    buckets = list(iter_buckets(g, date_from, date_to))
+
+    assert [b[0] for b in buckets] == _day_walk_labels(g, date_from, date_to)
+    assert buckets[0][1] == date_from
+    assert buckets[-1][2] == date_to
+    for (_, _, end), (_, start, _) in zip(buckets, buckets[1:]):
+        assert start == end + dt.timedelta(days=1)
+
+
+def test_iter_buckets_rejects_inverted_range():
+    with pytest.raises(ValueError):
+        list(iter_buckets("daily", dt.date(2026, 1, 2), dt.date(2026, 1, 1)))
+
+
+def test_compute_timeseries_unsorted_input_and_boundaries():
+    def tx(d: dt.date, amount: str, kind: TransactionKind) -> Transaction:
+        return Transaction.create(
+            account_id="main",
+            date=d,
+            sequence=1,
+            amount=SignedMoney.from_str(amount, Currency.EUR),
+            kind=kind,
+            category="cat",
+        )
+
+    txs = [
+        tx(dt.date(2026, 2, 1), "-10.00", TransactionKind.EXPENSE),
+        tx(dt.date(2025, 12, 31), "5.00", TransactionKind.INCOME),  # avant la plage
+        tx(dt.date(2026, 1, 31), "20.00", TransactionKind.INCOME),
+        tx(dt.date(2026, 3, 1), "99.00", TransactionKind.INCOME),  # après la plage
+    ]
+
+    points = compute_timeseries(
+        opening_balance=SignedMoney.from_str("100.00", Currency.EUR),
+        transactions=txs,
+        date_from=dt.date(2026, 1, 1),
+        date_to=dt.date(2026, 2, 28),
+        granularity="monthly",
+    )
+
+    assert [p["bucket"] for p in points] == ["2026-01", "2026-02"]
+    assert points[0]["balance_start"] == Decimal("105.00")
+    assert points[0]["income"] == Decimal("20.00")
+    assert points[1]["expense"] == Decimal("10.00")
+    assert points[1]["balance_end"] == Decimal("115.00")
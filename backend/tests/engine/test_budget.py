@@ -5,10 +5,13 @@ import datetime as dt
 from app.domain.money import Currency
 from app.domain.signed_money import SignedMoney
 from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame
 from app.engine.budget import (
     totals_by_kind,
     expense_totals_by_category,
+    expense_totals_by_subcategory,
     monthly_totals_by_kind,
+    summarize_budget,
 )
 
 
@@ -73,3 +76,29 @@ def test_monthly_totals_by_kind_groups_by_month():
     assert got[(2026, 1, TransactionKind.EXPENSE)] == SignedMoney.from_str("-15.00", Currency.EUR).amount
     assert got[(2026, 2, TransactionKind.EXPENSE)] == SignedMoney.from_str("-20.00", Currency.EUR).amount
     assert got[(2026, 2, TransactionKind.INCOME)] == SignedMoney.from_str("100.00", Currency.EUR).amount
+
+
+def test_summarize_budget_matches_separate_passes_with_date_filter():
+    txs = [
+        _tx(dt.date(2025, 12, 31), 1, "-99.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),  # hors plage
+        _tx(dt.date(2026, 1, 1), 1, "-10.00", TransactionKind.EXPENSE, "Transport & mobilité", "Carburant"),
+        _tx(dt.date(2026, 1, 15), 1, "-5.00", TransactionKind.EXPENSE, "Alimentation"),
+        _tx(dt.date(2026, 2, 1), 1, "-20.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),
+        _tx(dt.date(2026, 2, 2), 1, "100.00", TransactionKind.INCOME, "Salaire"),
+        _tx(dt.date(2026, 2, 3), 1, "-7.00", TransactionKind.TRANSFER, "Virement"),
+        _tx(dt.date(2026, 3, 1), 1, "-1.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),  # hors plage
+    ]
+    date_from, date_to = dt.date(2026, 1, 1), dt.date(2026, 2, 28)
+    in_range = [t for t in txs if date_from <= t.date <= date_to]
+
+    for source in (txs, TransactionFrame.from_transactions(txs)):
+        summary = summarize_budget(source, currency=Currency.EUR, date_from=date_from, date_to=date_to)
+
+        assert summary.by_kind == totals_by_kind(in_range, currency=Currency.EUR)
+        assert summary.by_category == expense_totals_by_category(in_range, currency=Currency.EUR)
+        assert summary.by_subcategory == expense_totals_by_subcategory(in_range, currency=Currency.EUR)
+        assert summary.by_month_kind == monthly_totals_by_kind(in_range, currency=Currency.EUR)
+
+    got = {x.category: x.total.amount for x in summary.by_category}
+    assert got == {"Alimentation": SignedMoney.from_str("-25.00", Currency.EUR).amount,
+                   "Transport & mobilité": SignedMoney.from_str("-10.00", Currency.EUR).amount}
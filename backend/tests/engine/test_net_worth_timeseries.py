@@ -0,0 +1,80 @@
+import datetime as dt
+from decimal import Decimal
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.engine.net_worth import (
+    compute_net_worth_timeseries,
+    compute_net_worth_timeseries_grouped,
+    partition_by_account,
+)
+
+
+def eur(s: str) -> SignedMoney:
+    return SignedMoney.from_str(s, Currency.EUR)
+
+
+def _account(account_id: str, opening: str, account_type: AccountType) -> Account:
+    return Account(
+        id=account_id,
+        name=account_id,
+        currency=Currency.EUR,
+        opening_balance=eur(opening),
+        opened_on=dt.date(2026, 1, 1),
+        account_type=account_type,
+    )
+
+
+def _tx(account_id: str, date: dt.date, amount: str, kind: TransactionKind) -> Transaction:
+    return Transaction.create(
+        account_id=account_id,
+        date=date,
+        sequence=1,
+        amount=eur(amount),
+        kind=kind,
+        category="cat",
+    )
+
+
+ACCOUNTS = [
+    _account("main", "100.00", AccountType.CHECKING),
+    _account("livret", "1000.00", AccountType.SAVINGS),
+    _account("joint", "50.00", AccountType.CHECKING),
+]
+
+TXS = [
+    _tx("main", dt.date(2026, 1, 5), "200.00", TransactionKind.INCOME),
+    _tx("livret", dt.date(2026, 1, 20), "-30.00", TransactionKind.EXPENSE),
+    _tx("joint", dt.date(2026, 2, 2), "-10.00", TransactionKind.EXPENSE),
+    _tx("ghost", dt.date(2026, 2, 3), "999.00", TransactionKind.INCOME),  # compte hors liste : ignoré
+]
+
+
+def test_partition_by_account_single_pass():
+    parts = partition_by_account(TXS)
+    assert {k: len(v) for k, v in parts.items()} == {"main": 1, "livret": 1, "joint": 1, "ghost": 1}
+
+
+def test_grouped_total_and_groups_match_per_group_engine():
+    kwargs = dict(
+        transactions=TXS,
+        date_from=dt.date(2026, 1, 1),
+        date_to=dt.date(2026, 2, 28),
+        granularity="monthly",
+    )
+
+    total, groups = compute_net_worth_timeseries_grouped(accounts=ACCOUNTS, **kwargs)
+
+    assert total == compute_net_worth_timeseries(accounts=ACCOUNTS, **kwargs)
+    assert list(groups) == ["CHECKING", "SAVINGS"]
+    assert groups["CHECKING"] == compute_net_worth_timeseries(
+        accounts=[a for a in ACCOUNTS if a.account_type == AccountType.CHECKING], **kwargs
+    )
+
+    assert [p["bucket"] for p in total] == ["2026-01", "2026-02"]
+    assert total[0]["balance_start"] == Decimal("1150.00")
+    assert total[0]["balance_end"] == Decimal("1320.00")
+    assert total[1]["balance_end"] == Decimal("1310.00")
+    assert groups["SAVINGS"][0]["expense"] == Decimal("30.00")
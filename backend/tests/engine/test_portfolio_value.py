@@ -0,0 +1,110 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency, Money
+from app.domain.portfolio import Portfolio, PortfolioSnapshot, PortfolioType
+from app.domain.signed_money import SignedMoney
+from app.engine.net_worth_full import compute_net_worth_full_timeseries
+from app.engine.portfolio_value import (
+    SnapshotIndex,
+    bucket_end_date,
+    compute_portfolios_value,
+    compute_portfolios_value_series,
+)
+
+
+def _portfolio(name: str, currency: Currency = Currency.EUR) -> Portfolio:
+    return Portfolio.create(
+        name=name,
+        currency=currency,
+        portfolio_type=PortfolioType.CTO,
+        opened_on=dt.date(2025, 1, 1),
+    )
+
+
+def _snap(p: Portfolio, d: dt.date, value: str, sid: int) -> PortfolioSnapshot:
+    return PortfolioSnapshot.create(
+        portfolio_id=p.id,
+        date=d,
+        value=Money.from_str(value, Currency.EUR),
+        id=UUID(int=sid),
+    )
+
+
+PEA = _portfolio("pea")
+CTO = _portfolio("cto")
+EMPTY = _portfolio("empty")
+
+SNAPSHOTS = [
+    _snap(CTO, dt.date(2026, 2, 10), "300.00", 5),
+    _snap(PEA, dt.date(2026, 1, 15), "100.00", 1),
+    _snap(PEA, dt.date(2026, 1, 15), "110.00", 2),  # même jour : id le plus grand gagne
+    _snap(PEA, dt.date(2026, 3, 1), "150.00", 3),
+    _snap(CTO, dt.date(2025, 12, 31), "250.00", 4),
+]
+
+
+def test_snapshot_index_keeps_last_of_day():
+    index = SnapshotIndex.from_snapshots([s for s in SNAPSHOTS if s.portfolio_id == PEA.id])
+    assert index.ordinals == [dt.date(2026, 1, 15).toordinal(), dt.date(2026, 3, 1).toordinal()]
+    assert index.values == [Decimal("110.00"), Decimal("150.00")]
+
+
+def test_series_matches_point_valuation():
+    portfolios = [PEA, CTO, EMPTY]
+    dates = [dt.date(2025, 12, 1) + dt.timedelta(days=i) for i in range(120)]
+
+    series = compute_portfolios_value_series(
+        portfolios=portfolios, snapshots=SNAPSHOTS, dates=dates, currency=Currency.EUR
+    )
+
+    assert series == [
+        compute_portfolios_value(portfolios=portfolios, snapshots=SNAPSHOTS, at=d, currency=Currency.EUR)
+        for d in dates
+    ]
+
+
+def test_series_rejects_currency_mismatch_and_unsorted_dates():
+    with pytest.raises(ValueError):
+        compute_portfolios_value_series(
+            portfolios=[_portfolio("usd", Currency.USD)], snapshots=[], dates=[], currency=Currency.EUR
+        )
+    with pytest.raises(ValueError):
+        compute_portfolios_value_series(
+            portfolios=[PEA],
+            snapshots=SNAPSHOTS,
+            dates=[dt.date(2026, 2, 1), dt.date(2026, 1, 1)],
+            currency=Currency.EUR,
+        )
+
+
+@pytest.mark.parametrize("granularity", ["daily", "weekly", "monthly"])
+def test_full_timeseries_uses_bucket_end_values(granularity):
+    account = Account(
+        id="main",
+        name="main",
+        currency=Currency.EUR,
+        opening_balance=SignedMoney.from_str("10.00", Currency.EUR),
+        opened_on=dt.date(2025, 1, 1),
+        account_type=AccountType.CHECKING,
+    )
+    date_from, date_to = dt.date(2026, 1, 1), dt.date(2026, 3, 10)
+
+    points = compute_net_worth_full_timeseries(
+        accounts=[account],
+        transactions=[],
+        portfolios=[PEA, CTO],
+        portfolio_snapshots=SNAPSHOTS,
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+    )
+
+    for p in points:
+        as_of = bucket_end_date(p["bucket"], granularity, date_from, date_to)
+        pv = compute_portfolios_value(portfolios=[PEA, CTO], snapshots=SNAPSHOTS, at=as_of, currency=Currency.EUR)
+        assert p["balance_end"] == Decimal("10.00") + pv.amount
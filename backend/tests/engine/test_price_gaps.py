@@ -0,0 +1,22 @@
+import datetime as dt
+
+import pytest
+
+from app.engine.price_gaps import gap_ranges, missing_days, trading_days
+
+
+def test_trading_days_skip_weekends():
+    # 2026-03-06 vendredi -> 2026-03-09 lundi
+    assert trading_days(dt.date(2026, 3, 6), dt.date(2026, 3, 9)) == [dt.date(2026, 3, 6), dt.date(2026, 3, 9)]
+    with pytest.raises(ValueError):
+        trading_days(dt.date(2026, 3, 9), dt.date(2026, 3, 6))
+
+
+def test_gaps_merge_across_weekends_only():
+    existing = [dt.date(2026, 3, 4)]
+    missing = missing_days(existing, dt.date(2026, 3, 2), dt.date(2026, 3, 10))
+    assert gap_ranges(missing) == [
+        (dt.date(2026, 3, 2), dt.date(2026, 3, 3)),
+        (dt.date(2026, 3, 5), dt.date(2026, 3, 10)),
+    ]
+    assert gap_ranges([]) == []
@@ -0,0 +1,134 @@
+import datetime as dt
+import random
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.engine.account_timeseries import compute_timeseries
+from app.engine.net_worth import compute_net_worth_timeseries, compute_net_worth_timeseries_grouped
+from app.engine.timeseries_engine import resolve_timeseries_engine
+
+
+GRANULARITIES = ["daily", "weekly", "monthly", "yearly"]
+DATE_FROM = dt.date(2025, 12, 20)
+DATE_TO = dt.date(2026, 3, 5)
+
+
+def _dataset(seed: int, n: int = 400):
+    rnd = random.Random(seed)
+    types = [AccountType.CHECKING, AccountType.SAVINGS, AccountType.CHECKING]
+    accounts = [
+        Account(
+            id=f"acc_{i}",
+            name=f"acc {i}",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney(amount=Decimal(rnd.randint(-5000, 500000)).scaleb(-2), currency=Currency.EUR),
+            opened_on=dt.date(2025, 1, 1),
+            account_type=types[i],
+        )
+        for i in range(3)
+    ]
+
+    txs = []
+    for i in range(n):
+        kind = rnd.choice([TransactionKind.INCOME, TransactionKind.EXPENSE, TransactionKind.TRANSFER])
+        cents = rnd.randint(1, 100_000)
+        if kind == TransactionKind.EXPENSE or (kind == TransactionKind.TRANSFER and rnd.random() < 0.5):
+            cents = -cents
+        txs.append(
+            Transaction.create(
+                # acc_3 n'est pas dans la liste des comptes : ses tx doivent être ignorées
+                account_id=f"acc_{rnd.randrange(4)}",
+                date=DATE_FROM + dt.timedelta(days=rnd.randrange(-40, 100)),
+                sequence=i + 1,
+                amount=SignedMoney(amount=Decimal(cents).scaleb(-2), currency=Currency.EUR),
+                kind=kind,
+                category="cat",
+            )
+        )
+    return accounts, txs
+
+
+def _as_str(points: list[dict]) -> list[dict]:
+    # les routes sérialisent avec str() : l'exposant Decimal ("0" vs "0.00") doit être identique
+    return [{k: str(v) for k, v in p.items()} for p in points]
+
+
+@pytest.mark.parametrize("granularity", GRANULARITIES)
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_compute_timeseries_parity(granularity, seed):
+    accounts, txs = _dataset(seed)
+    account_txs = [t for t in txs if t.account_id == "acc_0"]
+    kwargs = dict(
+        opening_balance=accounts[0].opening_balance,
+        transactions=account_txs,
+        date_from=DATE_FROM,
+        date_to=DATE_TO,
+        granularity=granularity,
+    )
+
+    expected = compute_timeseries(engine="decimal", **kwargs)
+    got = compute_timeseries(engine="numpy", **kwargs)
+
+    assert got == expected
+    assert _as_str(got) == _as_str(expected)
+
+
+@pytest.mark.parametrize("granularity", GRANULARITIES)
+@pytest.mark.parametrize("seed", [4, 5])
+def test_net_worth_timeseries_parity(granularity, seed):
+    accounts, txs = _dataset(seed)
+    kwargs = dict(accounts=accounts, transactions=txs, date_from=DATE_FROM, date_to=DATE_TO, granularity=granularity)
+
+    assert _as_str(compute_net_worth_timeseries(engine="numpy", **kwargs)) == _as_str(
+        compute_net_worth_timeseries(engine="decimal", **kwargs)
+    )
+
+    total_np, groups_np = compute_net_worth_timeseries_grouped(engine="numpy", **kwargs)
+    total_dec, groups_dec = compute_net_worth_timeseries_grouped(engine="decimal", **kwargs)
+    assert _as_str(total_np) == _as_str(total_dec)
+    assert list(groups_np) == list(groups_dec)
+    assert {k: _as_str(v) for k, v in groups_np.items()} == {k: _as_str(v) for k, v in groups_dec.items()}
+
+
+def test_parity_edge_cases():
+    accounts, _ = _dataset(6)
+    kwargs = dict(date_from=DATE_FROM, date_to=DATE_TO, granularity="weekly")
+
+    # aucune tx / aucun compte
+    assert _as_str(compute_net_worth_timeseries(accounts=accounts, transactions=[], engine="numpy", **kwargs)) == _as_str(
+        compute_net_worth_timeseries(accounts=accounts, transactions=[], engine="decimal", **kwargs)
+    )
+    assert compute_net_worth_timeseries(accounts=[], transactions=[], engine="numpy", **kwargs) == []
+
+    with pytest.raises(ValueError):
+        compute_timeseries(
+            opening_balance=accounts[0].opening_balance,
+            transactions=[],
+            date_from=DATE_TO,
+            date_to=DATE_FROM,
+            granularity="daily",
+            engine="numpy",
+        )
+
+
+def test_engine_selection(monkeypatch):
+    monkeypatch.setenv("DASHMONEY_NUMPY_MIN_TRANSACTIONS", "100")
+
+    monkeypatch.setenv("DASHMONEY_TIMESERIES_ENGINE", "auto")
+    assert resolve_timeseries_engine(99) == "decimal"
+    assert resolve_timeseries_engine(100) == "numpy"
+
+    monkeypatch.setenv("DASHMONEY_TIMESERIES_ENGINE", "decimal")
+    assert resolve_timeseries_engine(10_000) == "decimal"
+    assert resolve_timeseries_engine(0, "numpy") == "numpy"
+
+    monkeypatch.setenv("DASHMONEY_TIMESERIES_ENGINE", "gpu")
+    with pytest.raises(ValueError):
+        resolve_timeseries_engine(0)
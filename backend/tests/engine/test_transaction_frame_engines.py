@@ -0,0 +1,111 @@
+import datetime as dt
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame
+from app.engine.account_balance import BalanceIndex, build_balance_indexes
+from app.engine.account_timeseries import compute_timeseries
+from app.engine.budget import (
+    expense_totals_by_category,
+    expense_totals_by_subcategory,
+    monthly_totals_by_kind,
+    totals_by_kind,
+)
+from app.engine.net_worth import compute_net_worth_grouped, compute_net_worth_timeseries_grouped
+from app.repositories.in_memory_transaction_repository import InMemoryTransactionRepository
+
+
+def _dataset(seed: int = 7, n: int = 300):
+    rnd = random.Random(seed)
+    accounts = [
+        Account(
+            id=f"acc_{i}",
+            name=f"acc {i}",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney.from_str(f"{rnd.randint(0, 5000)}.{rnd.randint(0, 99):02d}", Currency.EUR),
+            opened_on=dt.date(2025, 1, 1),
+            account_type=t,
+        )
+        for i, t in enumerate([AccountType.CHECKING, AccountType.SAVINGS, AccountType.CHECKING])
+    ]
+
+    txs = []
+    for i in range(n):
+        kind = rnd.choice([TransactionKind.INCOME, TransactionKind.EXPENSE, TransactionKind.TRANSFER])
+        cents = rnd.randint(1, 50_000) * (-1 if kind == TransactionKind.EXPENSE else 1)
+        txs.append(
+            Transaction.create(
+                account_id=rnd.choice(accounts).id,
+                date=dt.date(2025, 11, 1) + dt.timedelta(days=rnd.randrange(150)),
+                sequence=i + 1,
+                amount=SignedMoney(amount=Decimal(cents).scaleb(-2), currency=Currency.EUR),
+                kind=kind,
+                category=rnd.choice(["Courses", "courses", "Loyer", "Loisirs"]),
+                subcategory=rnd.choice([None, "Bio", "Ciné"]),
+            )
+        )
+    return accounts, txs
+
+
+ACCOUNTS, TXS = _dataset()
+FRAME = TransactionFrame.from_transactions(TXS)
+
+
+@pytest.mark.parametrize(
+    "fn", [totals_by_kind, expense_totals_by_category, expense_totals_by_subcategory, monthly_totals_by_kind]
+)
+def test_budget_frame_matches_list(fn):
+    assert fn(FRAME, currency=Currency.EUR) == fn(TXS, currency=Currency.EUR)
+
+
+def test_balance_frame_matches_list():
+    assert build_balance_indexes(FRAME) == build_balance_indexes(TXS)
+    assert BalanceIndex.from_transactions(TransactionFrame.empty()) == BalanceIndex.from_transactions([])
+
+    at = dt.date(2026, 1, 15)
+    assert compute_net_worth_grouped(accounts=ACCOUNTS, transactions=FRAME, at=at) == compute_net_worth_grouped(
+        accounts=ACCOUNTS, transactions=TXS, at=at
+    )
+
+
+@pytest.mark.parametrize("granularity", ["daily", "weekly", "monthly"])
+def test_timeseries_frame_matches_list(granularity):
+    kwargs = dict(date_from=dt.date(2025, 12, 1), date_to=dt.date(2026, 2, 28), granularity=granularity)
+    account_txs = [t for t in TXS if t.account_id == "acc_0"]
+
+    expected = compute_timeseries(
+        opening_balance=ACCOUNTS[0].opening_balance, transactions=account_txs, engine="decimal", **kwargs
+    )
+    got = compute_timeseries(
+        opening_balance=ACCOUNTS[0].opening_balance,
+        transactions=TransactionFrame.from_transactions(account_txs),
+        engine="decimal",
+        **kwargs,
+    )
+    assert [{k: str(v) for k, v in p.items()} for p in got] == [{k: str(v) for k, v in p.items()} for p in expected]
+
+    total, groups = compute_net_worth_timeseries_grouped(accounts=ACCOUNTS, transactions=TXS, engine="decimal", **kwargs)
+    assert compute_net_worth_timeseries_grouped(
+        accounts=ACCOUNTS, transactions=FRAME, engine="decimal", **kwargs
+    ) == (total, groups)
+
+    pytest.importorskip("numpy")
+    assert compute_net_worth_timeseries_grouped(
+        accounts=ACCOUNTS, transactions=FRAME, engine="numpy", **kwargs
+    ) == (total, groups)
+
+
+def test_in_memory_repo_list_frame():
+    repo = InMemoryTransactionRepository()
+    for t in TXS:
+        repo.add(t)
+
+    frame = repo.list_frame(account_ids=["acc_1"])
+    assert len(frame) == len(repo.list(account_id="acc_1"))
+    assert frame.account_ids == ["acc_1"]
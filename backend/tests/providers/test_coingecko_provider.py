@@ -0,0 +1,87 @@
+import datetime as dt
+import json
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.domain.money import Currency
+from app.providers.coingecko_provider import CoinGeckoPriceProvider
+
+PRICES = {
+    "bitcoin": {"eur": 50000.5, "usd": 54000},
+    "ethereum": {"eur": 2500, "usd": 2700.25},
+    "solana": {"usd": 150},
+}
+
+
+@pytest.fixture
+def stub_coingecko():
+    """
+    Faux /simple/price local : répond pour les ids / vs_currencies demandés, journalise les requêtes.
+    """
+    requests: list[dict[str, list[str]]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            requests.append(query)
+            ids = query["ids"][0].split(",")
+            vs = query["vs_currencies"][0].split(",")
+            body = {
+                cg_id: {v: PRICES[cg_id][v] for v in vs if v in PRICES[cg_id]}
+                for cg_id in ids
+                if cg_id in PRICES
+            }
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/simple/price", requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_many_prices_all_symbols_in_one_request(stub_coingecko):
+    url, requests = stub_coingecko
+    provider = CoinGeckoPriceProvider(base_url=url, retries=1, backoff_sec=0)
+    day = dt.date(2026, 3, 2)
+
+    out = provider.fetch_many(
+        symbols={"BTC": Currency.EUR, "eth": Currency.USD, "SOL": Currency.EUR, "NOPE": Currency.EUR},
+        day_utc=day,
+    )
+
+    assert len(requests) == 1
+    assert requests[0]["ids"] == ["bitcoin,ethereum,solana"]
+    assert requests[0]["vs_currencies"] == ["eur,usd"]
+    assert {sym: (p.price, p.currency) for sym, p in out.items()} == {
+        "BTC": (Decimal("50000.5"), Currency.EUR),
+        "ETH": (Decimal("2700.25"), Currency.USD),
+    }
+    assert provider.fetch(symbol="btc", day_utc=day, vs=Currency.USD).price == Decimal("54000")
+
+
+def test_fetch_many_chunks_ids(stub_coingecko, monkeypatch):
+    url, requests = stub_coingecko
+    monkeypatch.setattr(CoinGeckoPriceProvider, "MAX_IDS_PER_REQUEST", 2)
+    provider = CoinGeckoPriceProvider(base_url=url, retries=1, backoff_sec=0)
+
+    out = provider.fetch_many(
+        symbols={"BTC": Currency.EUR, "ETH": Currency.EUR, "SOL": Currency.USD},
+        day_utc=dt.date(2026, 3, 2),
+    )
+
+    assert len(requests) == 2
+    assert set(out) == {"BTC", "ETH", "SOL"}
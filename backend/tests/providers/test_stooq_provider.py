@@ -0,0 +1,127 @@
+import datetime as dt
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.domain.money import Currency
+from app.providers.stooq_provider import StooqEodPriceProvider
+from app.providers.stooq_symbol_cache import StooqSymbolCache
+
+DAY = dt.date(2026, 3, 2)
+HEADER = "Symbol,Date,Time,Open,High,Low,Close,Volume\r\n"
+QUOTES = {"aapl.us": "AAPL.US,2026-03-02,22:00:09,180,182,179,181.25,1000\r\n"}
+HISTORY = {
+    "aapl.us": (
+        "Date,Open,High,Low,Close,Volume\r\n"
+        "2026-02-27,1,1,1,179.50,10\r\n"
+        "2026-03-02,1,1,1,181.25,10\r\n"
+        "2026-03-03,1,1,1,n/a,10\r\n"
+        "2026-03-04,1,1,1,183.00,10\r\n"
+    )
+}
+
+
+@pytest.fixture
+def stub_stooq():
+    """
+    Faux stooq.com/q/l/ (cotation) et /q/d/l/ (historique) local :
+    N/D / "No data" pour les symboles inconnus, 500 pour "down*".
+    """
+    requested: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            s = parse_qs(url.query)["s"][0]
+            requested.append(s)
+            if s.startswith("down"):
+                self.send_response(500)
+                self.end_headers()
+                return
+            if url.path.startswith("/q/d/l"):
+                data = HISTORY.get(s, "No data").encode()
+            else:
+                line = QUOTES.get(s, f"{s.upper()},N/D,N/D,N/D,N/D,N/D,N/D,N/D\r\n")
+                data = (HEADER + line).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requested
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(url: str, cache_path) -> StooqEodPriceProvider:
+    return StooqEodPriceProvider(
+        retries=2,
+        backoff_sec=0,
+        base_url=url,
+        symbol_cache=StooqSymbolCache(cache_path),
+    )
+
+
+def test_resolved_suffix_is_reused_across_runs(stub_stooq, tmp_path):
+    url, requested = stub_stooq
+    cache_path = tmp_path / "stooq_symbols.json"
+
+    pp = _provider(url, cache_path).fetch(symbol="aapl", day_utc=DAY, currency=Currency.USD)
+    assert pp.price == Decimal("181.25")
+    assert requested == ["aapl", "aapl.us"]  # N/D = pas de données, pas de retry
+
+    requested.clear()
+    pp = _provider(url, cache_path).fetch(symbol="AAPL", day_utc=DAY, currency=Currency.USD)
+    assert pp is not None
+    assert requested == ["aapl.us"]
+
+
+def test_misses_are_cached_with_ttl_but_outages_are_not(stub_stooq, tmp_path):
+    url, requested = stub_stooq
+    cache_path = tmp_path / "stooq_symbols.json"
+
+    assert _provider(url, cache_path).fetch(symbol="NOPE", day_utc=DAY, currency=Currency.EUR) is None
+    assert len(requested) == 5
+
+    requested.clear()
+    cache = StooqSymbolCache(cache_path)
+    assert StooqEodPriceProvider(base_url=url, symbol_cache=cache).fetch(
+        symbol="NOPE", day_utc=DAY, currency=Currency.EUR
+    ) is None
+    assert requested == []
+    assert not cache.is_known_miss("NOPE", now=dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=8))
+
+    assert _provider(url, cache_path).fetch(symbol="DOWN", day_utc=DAY, currency=Currency.EUR) is None
+    assert not StooqSymbolCache(cache_path).is_known_miss("DOWN")
+
+
+def test_history_is_streamed_within_range_and_resolves_suffix(stub_stooq, tmp_path):
+    url, requested = stub_stooq
+    cache_path = tmp_path / "stooq_symbols.json"
+
+    points = list(
+        _provider(url, cache_path).iter_history(
+            symbol="aapl", date_from=DAY, date_to=dt.date(2026, 3, 6), currency=Currency.USD
+        )
+    )
+    assert [(p.day, p.price) for p in points] == [
+        (DAY, Decimal("181.25")),
+        (dt.date(2026, 3, 4), Decimal("183.00")),
+    ]
+    assert {p.symbol for p in points} == {"AAPL"}
+    assert requested == ["aapl", "aapl.us"]
+    assert StooqSymbolCache(cache_path).resolved("AAPL") == "AAPL.US"
+
+    requested.clear()
+    assert list(
+        _provider(url, cache_path).iter_history(symbol="NOPE", date_from=DAY, date_to=DAY, currency=Currency.EUR)
+    ) == []
+    assert len(requested) == 5
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import get_engine, get_session_factory
+from app.db_base import Base
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """
+    Base SQLite jetable (schéma via metadata, pas Alembic) pour tester les repos SQL sans Postgres.
+    """
+    import app.repositories.sql_account_repository  # noqa: F401  (enregistre les tables)
+    import app.repositories.sql_transaction_repository  # noqa: F401
+    import app.repositories.sql_import_job_repository  # noqa: F401
+    import app.repositories.sql_price_repository  # noqa: F401
+
+    monkeypatch.setenv("DASHMONEY_DATABASE_URL", f"sqlite:///{tmp_path / 'dashmoney.db'}")
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    yield engine
+
+    engine.dispose()
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
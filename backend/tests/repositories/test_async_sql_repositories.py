@@ -0,0 +1,116 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from app.db_async import get_async_engine, get_async_session_factory
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.repositories.async_sql_account_repository import AsyncSqlAccountRepository
+from app.repositories.async_sql_transaction_repository import AsyncSqlTransactionRepository
+from app.repositories.sql_account_repository import SqlAccountRepository
+from app.repositories.sql_transaction_repository import SqlTransactionRepository
+
+
+@pytest.fixture
+def async_db(sqlite_db):
+    get_async_engine.cache_clear()
+    get_async_session_factory.cache_clear()
+    yield
+    asyncio.run(get_async_engine().dispose())
+    get_async_engine.cache_clear()
+    get_async_session_factory.cache_clear()
+
+
+def _repo_with_data() -> SqlTransactionRepository:
+    accounts = SqlAccountRepository()
+    accounts.add(
+        Account(
+            id="main",
+            name="Main",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney.from_str("0.00", Currency.EUR),
+            opened_on=dt.date(2025, 1, 1),
+            account_type=AccountType.CHECKING,
+        )
+    )
+    repo = SqlTransactionRepository(tx_account_repo=accounts)
+    repo.add_many([
+        Transaction.create(
+            account_id="main",
+            date=d,
+            sequence=1,
+            amount=SignedMoney.from_str(amount, Currency.EUR),
+            kind=kind,
+            category="x",
+        )
+        for d, amount, kind in [
+            (dt.date(2025, 12, 31), "-99.00", TransactionKind.EXPENSE),
+            (dt.date(2026, 1, 1), "-10.10", TransactionKind.EXPENSE),
+            (dt.date(2026, 1, 1), "-5.05", TransactionKind.EXPENSE),
+            (dt.date(2026, 2, 2), "1500.00", TransactionKind.INCOME),
+        ]
+    ])
+    return repo
+
+
+def test_async_reads_match_sync_repository(async_db):
+    repo = _repo_with_data()
+    at = dt.date(2026, 1, 31)
+    opening = SignedMoney.from_str("0.00", Currency.EUR)
+
+    async def reads():
+        accounts = AsyncSqlAccountRepository()
+        txs = AsyncSqlTransactionRepository()
+        return (
+            await accounts.list_accounts(),
+            await txs.balances_at(at=at),
+            await txs.list_frame(account_ids=["main"]),
+            await txs.list_with_running_balance(account_id="main", opening_balance=opening, limit=3),
+        )
+
+    accounts, balances, frame, (page, total) = asyncio.run(reads())
+
+    assert [a.id for a in accounts] == ["main"]
+    assert balances == repo.balances_at(at=at)
+    assert frame == repo.list_frame(account_ids=["main"])
+    sync_page, sync_total = repo.list_with_running_balance(account_id="main", opening_balance=opening, limit=3)
+    assert (total, [x.balance_after for x in page]) == (sync_total, [x.balance_after for x in sync_page])
+
+    with pytest.raises(KeyError):
+        asyncio.run(AsyncSqlAccountRepository().get_account("nope"))
+
+
+def test_account_balance_route(async_db):
+    from fastapi.testclient import TestClient
+
+    from app.api.main import app
+
+    _repo_with_data()
+    client = TestClient(app)
+
+    r = client.get("/accounts/main/balance", params={"at": "2026-01-31"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["transactions_sum"], body["balance"], body["transactions_count"]) == ("-114.15", "-114.15", 3)
+
+    assert client.get("/accounts/main/balance").json()["balance"] == "1385.85"
+    assert client.get("/accounts/nope/balance").status_code == 404
+
+
+def test_account_transactions_route(async_db):
+    from fastapi.testclient import TestClient
+
+    from app.api.main import app
+
+    _repo_with_data()
+    r = TestClient(app).get(
+        "/accounts/main/transactions", params={"date_from": "2026-01-01", "sort_by": "amount", "sort_dir": "desc"}
+    )
+    assert r.status_code == 200, r.text
+    assert [t["amount"] for t in r.json()] == ["1500.00", "-5.05", "-10.10"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db import POOL_METRICS
+from app.db_pool import pool_status
+from app.settings import get_db_pool_settings
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    monkeypatch.setenv("DASHMONEY_DB_POOL_SIZE", "1")
+    monkeypatch.setenv("DASHMONEY_DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DASHMONEY_DB_POOL_TIMEOUT", "0.1")
+
+
+def test_pool_settings_from_env(small_pool, sqlite_db) -> None:
+    settings = get_db_pool_settings()
+    assert (settings.pool_size, settings.max_overflow, settings.pool_timeout) == (1, 0, 0.1)
+    assert sqlite_db.pool.size() == 1
+    assert sqlite_db.pool.timeout() == 0.1
+
+
+def test_invalid_pool_settings(monkeypatch) -> None:
+    monkeypatch.setenv("DASHMONEY_DB_POOL_SIZE", "0")
+    with pytest.raises(ValueError):
+        get_db_pool_settings()
+
+
+def test_checkouts_and_timeouts_are_counted(small_pool, sqlite_db) -> None:
+    before = POOL_METRICS.snapshot()
+
+    with sqlite_db.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        # seule connexion du pool déjà prise : la seconde attend pool_timeout puis échoue
+        with pytest.raises(PoolTimeoutError):
+            sqlite_db.connect()
+
+        status = pool_status(sqlite_db.pool, POOL_METRICS, get_db_pool_settings())
+        assert status["checked_out"] == 1
+
+    after = POOL_METRICS.snapshot()
+    assert after["checkouts"] == before["checkouts"] + 1
+    assert after["timeouts"] == before["timeouts"] + 1
+    assert after["wait_max_ms"] >= 100
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import datetime as dt
+from decimal import Decimal
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.api.main import app
+from app.api.query_stats import QueryStatsMiddleware
+from app.db import get_engine
+from app.db_stats import track_queries
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.repositories.sql_account_repository import SqlAccountRepository
+
+
+def _account(account_id: str) -> Account:
+    return Account(
+        id=account_id,
+        name=account_id,
+        currency=Currency.EUR,
+        opening_balance=SignedMoney(amount=Decimal("0"), currency=Currency.EUR),
+        opened_on=dt.date(2026, 1, 1),
+        account_type=AccountType.CHECKING,
+    )
+
+
+def test_track_queries_counts_statements(sqlite_db) -> None:
+    repo = SqlAccountRepository()
+    with track_queries() as stats:
+        repo.list_accounts()
+        repo.list_accounts()
+    repo.list_accounts()
+
+    assert stats.count == 2
+    assert stats.db_time_sec > 0
+
+
+def test_endpoint_query_count(sqlite_db, assert_max_queries) -> None:
+    repo = SqlAccountRepository()
+    for i in range(3):
+        repo.add(_account(f"acc_{i}"))
+
+    r = TestClient(app).get("/accounts")
+    assert r.status_code == 200, r.text
+    assert len(r.json()) == 3
+    assert r.headers["server-timing"].startswith("db;dur=")
+    assert_max_queries(r, 1)
+
+
+def test_warns_above_threshold(sqlite_db, caplog) -> None:
+    mini = FastAPI()
+
+    @mini.get("/loop")
+    def loop() -> dict:
+        with get_engine().connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {}
+
+    mini.add_middleware(QueryStatsMiddleware, warn_threshold=2)
+
+    with caplog.at_level(logging.WARNING, logger="app.api.query_stats"):
+        r = TestClient(mini).get("/loop")
+
+    assert 'desc="3 queries"' in r.headers["server-timing"]
+    assert "GET /loop -> 200: 3 SQL queries (threshold 2)" in caplog.text
@@ -0,0 +1,72 @@
+import datetime as dt
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domain.account import Account, AccountType
+from app.domain.import_job import ImportJobStatus
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.repositories.sql_account_repository import SqlAccountRepository
+from app.repositories.sql_import_job_repository import SqlImportJobRepository
+from app.repositories.sql_transaction_repository import SqlTransactionRepository
+from app.services.import_job_service import submit_import_job
+
+
+def _setup():
+    accounts = SqlAccountRepository()
+    account = Account(
+        id="main",
+        name="Main",
+        currency=Currency.EUR,
+        opening_balance=SignedMoney.from_str("0.00", Currency.EUR),
+        opened_on=dt.date(2025, 1, 1),
+        account_type=AccountType.CHECKING,
+    )
+    accounts.add(account)
+    return account, SqlTransactionRepository(tx_account_repo=accounts), SqlImportJobRepository()
+
+
+def _run(jobs, tx_repo, account, fmt, filename, content: bytes):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        job, future = submit_import_job(
+            jobs=jobs,
+            tx_repo=tx_repo,
+            account=account,
+            fmt=fmt,
+            filename=filename,
+            upload=io.BytesIO(content),
+            executor=pool,
+        )
+        assert job.status == ImportJobStatus.PENDING
+        future.result()
+    return jobs.get(job.id)
+
+
+def test_import_job_records_progress_and_paginated_errors(sqlite_db, monkeypatch):
+    monkeypatch.setenv("DASHMONEY_IMPORT_BATCH_SIZE", "2")
+    account, tx_repo, jobs = _setup()
+    lines = ["date,kind,amount,category"]
+    lines += [f"2026-01-0{1 + i % 5},EXPENSE,-{i + 1}.00,Cat" for i in range(5)]
+    lines += ["bad-date,EXPENSE,-1.00,Cat", "2026-01-01,EXPENSE,5.00,Cat", "2026-01-01,NOPE,-1.00,Cat"]
+
+    job = _run(jobs, tx_repo, account, "csv", "bank.csv", "\n".join(lines).encode())
+
+    assert job.status == ImportJobStatus.SUCCEEDED
+    assert (job.rows_parsed, job.imported, job.errors_count) == (8, 5, 3)
+    assert job.started_at is not None and job.finished_at is not None
+    assert len(tx_repo.list_frame(["main"])) == 5
+
+    first, total = jobs.list_errors(job.id, limit=2, offset=0)
+    rest, _ = jobs.list_errors(job.id, limit=2, offset=2)
+    assert total == 3
+    assert [e.line_no for e in first + rest] == [7, 8, 9]
+
+
+def test_import_job_fails_on_unreadable_file(sqlite_db):
+    account, tx_repo, jobs = _setup()
+
+    job = _run(jobs, tx_repo, account, "csv", "bank.csv", b"foo,bar\n1,2\n")
+
+    assert job.status == ImportJobStatus.FAILED
+    assert "missing required headers" in job.message
+    assert jobs.fail_unfinished(message="restart") == 0
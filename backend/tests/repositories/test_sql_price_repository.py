@@ -0,0 +1,98 @@
+import datetime as dt
+from decimal import Decimal
+
+from sqlalchemy import func, select
+
+from app.db import new_session
+from app.domain.instrument import Instrument, InstrumentKind
+from app.domain.money import Currency
+from app.domain.price_point import PricePoint
+from app.repositories.sql_instrument_repository import SqlInstrumentRepository
+from app.repositories.sql_price_repository import PricePointRow, SqlPriceRepository
+
+DAY = dt.date(2026, 3, 2)
+T0 = dt.datetime(2026, 3, 2, 18, tzinfo=dt.timezone.utc)
+
+
+def _pp(price: str, *, day=DAY, source="stooq", captured_at=T0) -> PricePoint:
+    return PricePoint(
+        symbol="aapl",
+        day=day,
+        price=Decimal(price),
+        currency=Currency.USD,
+        source=source,
+        captured_at=captured_at,
+    )
+
+
+def _count() -> int:
+    with new_session() as s:
+        return s.execute(select(func.count()).select_from(PricePointRow)).scalar_one()
+
+
+def test_add_many_upserts_on_symbol_day_source(sqlite_db):
+    SqlInstrumentRepository().add(Instrument(symbol="AAPL", kind=InstrumentKind.STOCK, currency=Currency.USD))
+    repo = SqlPriceRepository()
+
+    assert repo.add_many([_pp("180"), _pp("1", source="manual"), _pp("1", day=DAY + dt.timedelta(days=1))]) == 3
+
+    # relance du timer : même clé => mise à jour, pas de nouvelle ligne ; doublon intra-lot => le dernier gagne
+    later = T0 + dt.timedelta(hours=1)
+    assert repo.add_many([_pp("181", captured_at=later), _pp("182.5", captured_at=later)]) == 1
+    repo.add(_pp("2", source="manual"))
+
+    assert _count() == 3
+    latest = repo.latest(symbol="AAPL")
+    assert latest.day == DAY + dt.timedelta(days=1)
+    by_source = {p.source: p.price for p in repo.list_between(symbol="AAPL", date_from=DAY, date_to=DAY)}
+    assert by_source == {"stooq": Decimal("182.5"), "manual": Decimal("2")}
+    assert repo.add_many([]) == 0
+
+
+def test_add_many_keeps_most_recent_capture(sqlite_db):
+    SqlInstrumentRepository().add(Instrument(symbol="AAPL", kind=InstrumentKind.STOCK, currency=Currency.USD))
+    repo = SqlPriceRepository()
+    earlier = T0 - dt.timedelta(days=1)
+
+    assert repo.add_many([_pp("180")]) == 1
+    # rejeu d'une source plus ancienne (ex: migration JSONL) : le prix en base est plus récent
+    assert repo.add_many([_pp("170", captured_at=earlier)]) == 0
+    # dans un lot, la capture la plus récente gagne quel que soit l'ordre
+    assert repo.add_many([_pp("185", captured_at=T0 + dt.timedelta(hours=1)), _pp("175", captured_at=earlier)]) == 1
+
+    [stored] = repo.list(symbol="AAPL")
+    assert (stored.price, stored.captured_at) == (Decimal("185"), T0 + dt.timedelta(hours=1))
+
+
+def test_prices_as_of_resolves_symbols_by_days(sqlite_db):
+    instruments = SqlInstrumentRepository()
+    instruments.add(Instrument(symbol="AAPL", kind=InstrumentKind.STOCK, currency=Currency.USD))
+    instruments.add(Instrument(symbol="MSFT", kind=InstrumentKind.STOCK, currency=Currency.USD))
+    repo = SqlPriceRepository()
+    repo.add_many([
+        _pp("180"),
+        _pp("181", source="manual", captured_at=T0 + dt.timedelta(hours=1)),
+        _pp("185", day=DAY + dt.timedelta(days=3)),
+    ])
+
+    fri, mon, thu = DAY - dt.timedelta(days=3), DAY, DAY + dt.timedelta(days=3)
+    found = repo.prices_as_of(symbols=["aapl", "MSFT"], days=[thu, fri, mon, DAY + dt.timedelta(days=1)])
+
+    assert {k: v.price for k, v in found.items()} == {
+        ("AAPL", mon): Decimal("181"),  # même jour : dernière capture
+        ("AAPL", DAY + dt.timedelta(days=1)): Decimal("181"),
+        ("AAPL", thu): Decimal("185"),
+    }
+    assert repo.prices_as_of(symbols=[], days=[DAY]) == {}
+
+
+def test_closed_days_round_trip(sqlite_db):
+    SqlInstrumentRepository().add(Instrument(symbol="AAPL", kind=InstrumentKind.STOCK, currency=Currency.USD))
+    repo = SqlPriceRepository()
+    holiday = dt.date(2026, 4, 3)
+
+    assert repo.add_closed_days(symbol="aapl", days=[holiday, holiday]) == 1
+    repo.add_closed_days(symbol="AAPL", days=[holiday])  # déjà connu : ignoré
+
+    assert repo.closed_days(symbol="AAPL", date_from=dt.date(2026, 4, 1), date_to=dt.date(2026, 4, 30)) == {holiday}
+    assert repo.closed_days(symbol="AAPL", date_from=dt.date(2026, 5, 1), date_to=dt.date(2026, 5, 31)) == set()
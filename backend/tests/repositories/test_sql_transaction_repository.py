@@ -0,0 +1,211 @@
+import datetime as dt
+
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.domain.transaction_frame import TransactionFrame
+from app.engine.budget import budget_totals, summarize_budget, summarize_budget_totals
+from app.engine.net_worth import (
+    compute_net_worth,
+    compute_net_worth_from_balances,
+    compute_net_worth_grouped,
+    compute_net_worth_grouped_from_balances,
+)
+from app.engine.running_balance import compute_running_balance_strict
+from app.repositories.sql_account_repository import SqlAccountRepository
+from app.repositories.sql_transaction_repository import SqlTransactionRepository
+
+
+def _repo_with_data():
+    accounts = SqlAccountRepository()
+    accounts.add(
+        Account(
+            id="main",
+            name="Main",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney.from_str("0.00", Currency.EUR),
+            opened_on=dt.date(2025, 1, 1),
+            account_type=AccountType.CHECKING,
+        )
+    )
+    repo = SqlTransactionRepository(tx_account_repo=accounts)
+
+    rows = [
+        (dt.date(2025, 12, 31), "-99.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),
+        (dt.date(2026, 1, 1), "-10.10", TransactionKind.EXPENSE, "Transport", "Carburant"),
+        (dt.date(2026, 1, 1), "-5.05", TransactionKind.EXPENSE, "Alimentation", None),
+        (dt.date(2026, 1, 20), "-20.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),
+        (dt.date(2026, 2, 2), "1500.00", TransactionKind.INCOME, "Salaire", None),
+        (dt.date(2026, 2, 3), "-7.00", TransactionKind.TRANSFER, "Virement", None),
+        (dt.date(2026, 3, 1), "-1.00", TransactionKind.EXPENSE, "Alimentation", "Courses"),
+    ]
+    txs = []
+    for d, amount, kind, cat, sub in rows:
+        txs.append(
+            Transaction.create(
+                account_id="main",
+                date=d,
+                sequence=repo.next_sequence("main", d),
+                amount=SignedMoney.from_str(amount, Currency.EUR),
+                kind=kind,
+                category=cat,
+                subcategory=sub,
+            )
+        )
+        repo.add(txs[-1])
+    # NB: on compare aux tx insérées (SQLite ne conserve pas le tz de created_at => pas de repo.list())
+    return repo, txs
+
+
+def test_list_frame_matches_list(sqlite_db):
+    repo, txs = _repo_with_data()
+
+    frame = repo.list_frame(account_ids=["main"])
+    expected = TransactionFrame.from_transactions(txs)
+
+    assert list(frame.cents) == list(expected.cents)
+    assert list(frame.ordinals) == list(expected.ordinals)
+    assert frame.categories == expected.categories
+    assert len(repo.list_frame(account_ids=[])) == 0
+
+
+def test_budget_totals_group_by_matches_python_scan(sqlite_db):
+    repo, txs = _repo_with_data()
+
+    for date_from, date_to in [(None, None), (dt.date(2026, 1, 1), dt.date(2026, 2, 28))]:
+        sql = repo.budget_totals(account_id="main", date_from=date_from, date_to=date_to)
+
+        assert summarize_budget_totals(sql, currency=Currency.EUR) == summarize_budget(
+            txs, currency=Currency.EUR, date_from=date_from, date_to=date_to
+        )
+        assert set(sql.by_month_kind) == set(budget_totals(txs, date_from=date_from, date_to=date_to).by_month_kind)
+
+
+def test_balances_at_matches_engine_net_worth(sqlite_db):
+    repo, txs = _repo_with_data()
+    SqlAccountRepository().add(
+        Account(
+            id="livret",
+            name="Livret",
+            currency=Currency.EUR,
+            opening_balance=SignedMoney.from_str("1000.00", Currency.EUR),
+            opened_on=dt.date(2025, 1, 1),
+            account_type=AccountType.SAVINGS,
+        )
+    )
+    accounts = SqlAccountRepository().list_accounts()
+
+    for at in (None, dt.date(2025, 6, 1), dt.date(2026, 1, 1), dt.date(2026, 2, 28)):
+        balances = repo.balances_at(at=at)
+
+        assert [b.account_id for b in balances] == ["livret", "main"]
+        assert compute_net_worth_from_balances(balances) == compute_net_worth(
+            accounts=accounts, transactions=txs, at=at
+        )
+        assert compute_net_worth_grouped_from_balances(balances) == compute_net_worth_grouped(
+            accounts=accounts, transactions=txs, at=at
+        )
+
+    main = repo.balances_at(at=dt.date(2026, 1, 1), account_ids=["main"])
+    assert len(main) == 1
+    assert main[0].tx_count == 3
+    assert str(main[0].balance.amount) == "-114.15"
+    assert repo.balances_at(at=None, account_ids=[]) == []
+
+
+def test_running_balance_window_matches_engine_and_paginates(sqlite_db):
+    repo, txs = _repo_with_data()
+    opening = SignedMoney.from_str("100.00", Currency.EUR)
+    expected = compute_running_balance_strict(txs, opening_balance=opening)
+
+    page, total = repo.list_with_running_balance(account_id="main", opening_balance=opening, limit=3, offset=2)
+    assert total == len(txs)
+    assert [x.transaction.id for x in page] == [x.transaction.id for x in expected[2:5]]
+    assert [x.balance_after for x in page] == [x.balance_after for x in expected[2:5]]
+
+    newest, _ = repo.list_with_running_balance(
+        account_id="main", opening_balance=opening, limit=2, descending=True
+    )
+    assert [x.balance_after for x in newest] == [x.balance_after for x in expected[::-1][:2]]
+
+
+def test_add_many_allocates_sequences_after_existing_max(sqlite_db):
+    repo, txs = _repo_with_data()
+    day = dt.date(2026, 1, 1)  # déjà 2 tx ce jour-là
+    batch = [
+        Transaction.create(
+            account_id="main",
+            date=d,
+            sequence=1,
+            amount=SignedMoney.from_str("-1.00", Currency.EUR),
+            kind=TransactionKind.EXPENSE,
+            category="Import",
+        )
+        for d in (day, dt.date(2026, 4, 1), day, dt.date(2026, 4, 1))
+    ]
+
+    stored = repo.add_many(batch)
+
+    assert [(t.date, t.sequence) for t in stored] == [
+        (day, 3),
+        (dt.date(2026, 4, 1), 1),
+        (day, 4),
+        (dt.date(2026, 4, 1), 2),
+    ]
+    assert len(repo.list_frame(["main"])) == len(txs) + 4
+    assert repo.next_sequence("main", day) == 5
+    assert repo.add_many([]) == []
+
+
+def test_fingerprint_counts_and_update_refresh(sqlite_db):
+    from app.domain.transaction_fingerprint import transaction_fingerprint
+
+    repo, txs = _repo_with_data()
+    courses = txs[0]
+    fp = transaction_fingerprint(courses)
+
+    assert repo.fingerprint_counts([fp, "unknown"]) == {fp: 1}
+
+    repo.add_many([Transaction.create(
+        account_id="main",
+        date=courses.date,
+        sequence=1,
+        amount=courses.amount,
+        kind=courses.kind,
+        category="  alimentation ",  # même empreinte après normalisation
+        subcategory="Autre",
+    )])
+    assert repo.fingerprint_counts([fp]) == {fp: 2}
+
+    updated = repo.update(account_id="main", tx_id=courses.id, label="Marché")
+    assert repo.fingerprint_counts([fp, transaction_fingerprint(updated)]) == {
+        fp: 1,
+        transaction_fingerprint(updated): 1,
+    }
+
+
+def test_backfill_fingerprints_fills_null_rows_by_batches(sqlite_db):
+    from sqlalchemy import update
+
+    from app.db import get_engine
+    from app.domain.transaction_fingerprint import transaction_fingerprint
+    from app.repositories.sql_transaction_repository import TransactionRow, backfill_fingerprints
+
+    repo, txs = _repo_with_data()
+    fps = [transaction_fingerprint(t) for t in txs]
+    expected = repo.fingerprint_counts(fps)
+
+    # lignes antérieures à la colonne (état juste après add_column dans la migration)
+    with get_engine().begin() as conn:
+        conn.execute(update(TransactionRow).values(fingerprint=None))
+    assert repo.fingerprint_counts(fps) == {}
+
+    with get_engine().begin() as conn:
+        assert list(backfill_fingerprints(conn, batch_size=3)) == [3, 3, 1]
+    assert repo.fingerprint_counts(fps) == expected
+
+    # rien à refaire ; recompute repasse sur toutes les lignes
+    with get_engine().begin() as conn:
+        assert list(backfill_fingerprints(conn, batch_size=3)) == []
+        assert sum(backfill_fingerprints(conn, recompute=True)) == len(txs)
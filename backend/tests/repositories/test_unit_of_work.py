@@ -0,0 +1,83 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+
+from app.db import unit_of_work
+from app.domain.account import Account, AccountType
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.repositories.sql_account_repository import SqlAccountRepository
+
+
+def _account(account_id: str) -> Account:
+    return Account(
+        id=account_id,
+        name=account_id,
+        currency=Currency.EUR,
+        opening_balance=SignedMoney(amount=Decimal("0"), currency=Currency.EUR),
+        opened_on=dt.date(2026, 1, 1),
+        account_type=AccountType.CHECKING,
+    )
+
+
+@pytest.fixture
+def accounts(sqlite_db):
+    return SqlAccountRepository()
+
+
+def test_calls_share_one_transaction_committed_at_the_end(accounts):
+    with unit_of_work() as uow:
+        accounts.add(_account("a"))
+        assert [a.id for a in accounts.list_accounts()] == ["a"]  # flush : visible dans l'unité
+        first = uow.session
+        accounts.get_account("a")
+        assert uow.session is first
+
+    assert [a.id for a in SqlAccountRepository().list_accounts()] == ["a"]
+
+
+def test_error_rolls_back_every_call_of_the_unit(accounts):
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            accounts.add(_account("a"))
+            raise RuntimeError("boom")
+    assert accounts.list_accounts() == []
+
+
+def test_domain_error_discards_only_the_failing_call(accounts):
+    with unit_of_work():
+        accounts.add(_account("a"))
+        with pytest.raises(ValueError):
+            accounts.update(account_id="a", name="  ")
+        accounts.add(_account("b"))
+
+    assert [(a.id, a.name) for a in accounts.list_accounts()] == [("a", "a"), ("b", "b")]
+
+
+def test_import_batches_commit_outside_the_caller_unit(accounts):
+    from app.domain.transaction import Transaction, TransactionKind
+    from app.repositories.sql_transaction_repository import SqlTransactionRepository
+    from app.services.transaction_import_service import import_transactions
+
+    accounts.add(_account("a"))
+    txs = SqlTransactionRepository(tx_account_repo=accounts)
+
+    def parse(amount: str) -> Transaction:
+        return Transaction.create(
+            account_id="a",
+            date=dt.date(2026, 1, 2),
+            sequence=1,
+            amount=SignedMoney(amount=Decimal(amount), currency=Currency.EUR),
+            kind=TransactionKind.EXPENSE,
+            category="x",
+        )
+
+    # requête HTTP qui échoue après l'import : les lots, déjà commités un par un, restent
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            result = import_transactions(txs, enumerate(["-1", "-2", "-3"], start=2), parse, batch_size=2)
+            raise RuntimeError("boom")
+
+    assert result.imported == 3
+    assert len(txs.list(account_id="a")) == 3
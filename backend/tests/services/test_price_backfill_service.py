@@ -0,0 +1,157 @@
+import datetime as dt
+from decimal import Decimal
+
+from app.domain.instrument import Instrument, InstrumentKind
+from app.domain.money import Currency
+from app.domain.price_point import PricePoint
+from app.providers.stooq_provider import StooqUnavailable
+from app.repositories.price_repository import PriceRepository
+from app.services.price_backfill_service import backfill_prices
+
+MON = dt.date(2026, 3, 2)
+FRI = dt.date(2026, 3, 13)
+
+
+class _Instruments:
+    def __init__(self, instruments):
+        self._items = instruments
+
+    def list(self):
+        return list(self._items)
+
+
+class _Prices(PriceRepository):
+    def __init__(self, existing):
+        self.items = list(existing)
+        self.batches = []
+        self.closed = set()
+
+    def add(self, price):
+        raise AssertionError("prices must be written with add_many")
+
+    def add_many(self, prices):
+        self.batches.append(list(prices))
+        self.items.extend(prices)
+        return len(prices)
+
+    def list(self, *, symbol=None):
+        return [p for p in self.items if symbol is None or p.symbol == symbol]
+
+    def list_between(self, *, symbol, date_from, date_to):
+        return [p for p in self.list(symbol=symbol) if date_from <= p.day <= date_to]
+
+    def latest(self, *, symbol):
+        return None
+
+    def closed_days(self, *, symbol, date_from, date_to):
+        return {d for s, d in self.closed if s == symbol and date_from <= d <= date_to}
+
+    def add_closed_days(self, *, symbol, days):
+        self.closed |= {(symbol, d) for d in days}
+        return len(days)
+
+
+def _pp(symbol: str, day: dt.date) -> PricePoint:
+    return PricePoint(
+        symbol=symbol,
+        day=day,
+        price=Decimal("10"),
+        currency=Currency.EUR,
+        source="stooq",
+        captured_at=dt.datetime.now(dt.timezone.utc),
+    )
+
+
+class _FakeStooq:
+    """Historique complet (tous les jours calendaires) sur la plage demandée."""
+
+    def __init__(self, holidays=()):
+        self.calls = []
+        self.holidays = set(holidays)
+
+    def iter_history(self, *, symbol, date_from, date_to, currency):
+        self.calls.append((symbol, date_from, date_to))
+        if symbol == "DOWN":
+            raise StooqUnavailable(symbol)
+        d = date_from
+        while d <= date_to:
+            if d not in self.holidays:
+                yield _pp(symbol, d)
+            d += dt.timedelta(days=1)
+
+
+def _inst(symbol: str, kind: InstrumentKind) -> Instrument:
+    return Instrument(symbol=symbol, kind=kind, currency=Currency.EUR)
+
+
+def test_only_missing_trading_days_are_fetched_and_written():
+    existing = [_pp("AAA", MON), _pp("AAA", dt.date(2026, 3, 3)), _pp("AAA", FRI)]
+    existing += [_pp("FULL", MON + dt.timedelta(days=i)) for i in range(12)]
+    prices = _Prices(existing)
+    stooq = _FakeStooq()
+
+    res = backfill_prices(
+        instrument_repo=_Instruments([
+            _inst("AAA", InstrumentKind.STOCK),
+            _inst("FULL", InstrumentKind.ETF),
+            _inst("DOWN", InstrumentKind.STOCK),
+            _inst("BTC", InstrumentKind.CRYPTO),
+        ]),
+        price_repo=prices,
+        date_from=MON,
+        date_to=FRI,
+        stooq=stooq,
+    )
+
+    # un seul appel par instrument à trous, de la première à la dernière plage
+    assert sorted(stooq.calls) == [
+        ("AAA", dt.date(2026, 3, 4), dt.date(2026, 3, 12)),
+        ("DOWN", MON, FRI),
+    ]
+    written = sorted(p.day for batch in prices.batches for p in batch)
+    assert written == [dt.date(2026, 3, d) for d in (4, 5, 6, 9, 10, 11, 12)]  # pas de week-end
+    assert res == {
+        "date_from": "2026-03-02",
+        "date_to": "2026-03-13",
+        "instruments": 3,
+        "fetched": 1,
+        "up_to_date": 1,
+        "stored": 7,
+        "skipped": 1,
+        "failed": ["DOWN"],
+    }
+
+
+def test_holidays_are_remembered_and_not_fetched_again():
+    holiday = dt.date(2026, 3, 6)
+    prices = _Prices([])
+    stooq = _FakeStooq(holidays=[holiday])
+    run = dict(
+        instrument_repo=_Instruments([_inst("AAA", InstrumentKind.STOCK)]),
+        price_repo=prices,
+        date_from=MON,
+        date_to=FRI,
+        stooq=stooq,
+    )
+
+    first = backfill_prices(**run)
+    assert (first["fetched"], first["stored"]) == (1, 9)
+    assert prices.closed == {("AAA", holiday)}
+
+    # le férié n'est plus un trou : aucune requête, instrument à jour
+    second = backfill_prices(**run)
+    assert len(stooq.calls) == 1
+    assert (second["fetched"], second["up_to_date"], second["stored"]) == (0, 1, 0)
+
+
+def test_days_after_last_quote_are_not_marked_closed():
+    # cours du vendredi pas encore publié : redemandé au prochain passage
+    prices = _Prices([])
+    backfill_prices(
+        instrument_repo=_Instruments([_inst("AAA", InstrumentKind.STOCK)]),
+        price_repo=prices,
+        date_from=MON,
+        date_to=FRI,
+        stooq=_FakeStooq(holidays=[FRI]),
+    )
+    assert prices.closed == set()
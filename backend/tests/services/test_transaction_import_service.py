@@ -0,0 +1,102 @@
+import csv
+import datetime as dt
+import io
+
+import pytest
+
+from app.domain.money import Currency
+from app.domain.signed_money import SignedMoney
+from app.domain.transaction import Transaction, TransactionKind
+from app.repositories.in_memory_transaction_repository import InMemoryTransactionRepository
+from app.services.transaction_import_service import (
+    PENDING_SEQUENCE,
+    detect_encoding,
+    import_transactions,
+    open_upload_text,
+)
+
+
+def _parse(row: tuple[str, str]) -> Transaction | None:
+    date, amount = row
+    if date == "skip":
+        return None
+    return Transaction.create(
+        account_id="main",
+        date=dt.date.fromisoformat(date),
+        sequence=PENDING_SEQUENCE,
+        amount=SignedMoney.from_str(amount, Currency.EUR),
+        kind=TransactionKind.EXPENSE,
+        category="Import",
+    )
+
+
+def test_import_validates_then_bulk_inserts_valid_rows():
+    repo = InMemoryTransactionRepository()
+    rows = [
+        ("2026-01-01", "-1.00"),
+        ("not-a-date", "-2.00"),
+        ("skip", ""),
+        ("2026-01-01", "-3.00"),
+        ("2026-01-02", "4.00"),  # EXPENSE positif => invalide
+    ]
+
+    result = import_transactions(repo, enumerate(rows, start=2), _parse)
+
+    assert result.imported == 2
+    assert [e.split(":")[0] for e in result.errors] == ["line 3", "line 6"]
+    assert result.errors_count == 2
+    assert [(t.date.day, t.sequence) for t in repo.list()] == [(1, 1), (1, 2)]
+    assert result.summary(preview=1) == {
+        "imported": 2,
+        "duplicates_skipped": 0,
+        "errors_count": 2,
+        "errors_preview": result.errors[:1],
+    }
+
+
+class _CountingRepo(InMemoryTransactionRepository):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[int] = []
+
+    def add_many(self, txs):
+        self.batches.append(len(txs))
+        return super().add_many(txs)
+
+
+def test_import_inserts_in_fixed_size_batches():
+    repo = _CountingRepo()
+    rows = [("2026-01-01", "-1.00")] * 7
+
+    result = import_transactions(repo, enumerate(rows, start=1), _parse, batch_size=3)
+
+    assert result.imported == 7
+    assert repo.batches == [3, 3, 1]
+    assert [t.sequence for t in repo.list()] == list(range(1, 8))
+
+
+def test_open_upload_text_streams_with_encoding_fallback():
+    utf8 = io.BytesIO("\ufeffdate;montant\n01/02/2026;-3,50 €\n".encode("utf-8"))
+    cp1252 = io.BytesIO("date;montant\n01/02/2026;-3,50 €\n".encode("cp1252"))
+
+    assert detect_encoding(utf8, chunk_size=4) == "utf-8-sig"
+    assert detect_encoding(cp1252, chunk_size=4) == "cp1252"
+
+    for raw in (utf8, cp1252):
+        rows = list(csv.reader(open_upload_text(raw), delimiter=";"))
+        assert rows == [["date", "montant"], ["01/02/2026", "-3,50 €"]]
+
+    with pytest.raises(ValueError, match="Decode error"):
+        detect_encoding(io.BytesIO(b"\x81\x8d\xff\xfe"))
+
+
+def test_skip_duplicates_counts_occurrences_across_batches():
+    repo = InMemoryTransactionRepository()
+    import_transactions(repo, enumerate([("2026-01-01", "-1.00")] * 2), _parse)
+
+    # 2 déjà en base, 3 dans le fichier (+ une nouvelle) => 1 + 1 importées
+    rows = [("2026-01-01", "-1.00")] * 3 + [("2026-01-02", "-1.00")]
+    result = import_transactions(repo, enumerate(rows), _parse, batch_size=2, skip_duplicates=True)
+
+    assert (result.imported, result.duplicates_skipped) == (2, 2)
+    assert len(repo.list()) == 4
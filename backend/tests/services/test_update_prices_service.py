@@ -0,0 +1,113 @@
+import datetime as dt
+import threading
+import time
+from decimal import Decimal
+
+from app.domain.instrument import Instrument, InstrumentKind
+from app.domain.money import Currency
+from app.domain.price_point import PricePoint
+from app.repositories.price_repository import PriceRepository
+from app.services.update_prices_service import update_prices_for_day
+
+DAY = dt.date(2026, 3, 2)
+
+
+class _Instruments:
+    def __init__(self, instruments):
+        self._items = instruments
+
+    def list(self):
+        return list(self._items)
+
+
+class _Prices(PriceRepository):
+    def __init__(self):
+        self.batches = []
+
+    def add(self, price):
+        raise AssertionError("prices must be written in one batch")
+
+    def add_many(self, prices):
+        self.batches.append(list(prices))
+        return len(prices)
+
+    def list(self, *, symbol=None):
+        return []
+
+    def list_between(self, *, symbol, date_from, date_to):
+        return []
+
+    def latest(self, *, symbol):
+        return None
+
+
+def _pp(symbol: str, source: str) -> PricePoint:
+    return PricePoint(
+        symbol=symbol,
+        day=DAY,
+        price=Decimal("1.5"),
+        currency=Currency.EUR,
+        source=source,
+        captured_at=dt.datetime.now(dt.timezone.utc),
+    )
+
+
+class _FakeStooq:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, *, symbol, day_utc, currency):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(2.0 if symbol == "SLOW" else 0.05)
+            return None if symbol == "MISS" else _pp(symbol, "stooq")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class _FakeCoinGecko:
+    def __init__(self):
+        self.calls = []
+
+    def fetch_many(self, *, symbols, day_utc):
+        self.calls.append(dict(symbols))
+        return {sym: _pp(sym, "coingecko") for sym in symbols if sym != "UNKNOWN"}
+
+
+def test_update_prices_concurrent_with_limits_and_deadline():
+    stocks = [Instrument(symbol=f"S{i}", kind=InstrumentKind.STOCK, currency=Currency.EUR) for i in range(8)]
+    instruments = stocks + [
+        Instrument(symbol="SLOW", kind=InstrumentKind.ETF, currency=Currency.EUR),
+        Instrument(symbol="MISS", kind=InstrumentKind.STOCK, currency=Currency.EUR),
+        Instrument(symbol="BTC", kind=InstrumentKind.CRYPTO, currency=Currency.EUR),
+        Instrument(symbol="ETH", kind=InstrumentKind.CRYPTO, currency=Currency.USD),
+        Instrument(symbol="UNKNOWN", kind=InstrumentKind.CRYPTO, currency=Currency.EUR),
+        Instrument(symbol="GOLD", kind=InstrumentKind.OTHER, currency=Currency.EUR),
+    ]
+    stooq = _FakeStooq()
+    cg = _FakeCoinGecko()
+    prices = _Prices()
+
+    t0 = time.perf_counter()
+    res = update_prices_for_day(
+        day_utc=DAY,
+        instrument_repo=_Instruments(instruments),
+        price_repo=prices,
+        provider_concurrency={"stooq": 3},
+        deadline_sec=0.5,
+        coingecko=cg,
+        stooq=stooq,
+    )
+    elapsed = time.perf_counter() - t0
+
+    assert res == {"day": "2026-03-02", "stored": 10, "skipped": 4, "timed_out": 1}
+    assert cg.calls == [{"BTC": Currency.EUR, "ETH": Currency.USD, "UNKNOWN": Currency.EUR}]
+    assert elapsed < 1.5  # SLOW n'est pas attendu
+    assert stooq.max_active <= 3
+    assert len(prices.batches) == 1
+    assert {p.symbol for p in prices.batches[0]} == {f"S{i}" for i in range(8)} | {"BTC", "ETH"}